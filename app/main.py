@@ -3,14 +3,30 @@ Unity Catalog Description Generator - Databricks App
 Web UI for human-in-the-loop review and approval
 """
 
-from flask import Flask, render_template, request, jsonify, session, send_from_directory
+from flask import Flask, render_template, request, jsonify, session, send_from_directory, Response, stream_with_context
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import StatementState
+from databricks.sdk.errors import NotFound, PermissionDenied
+from databricks.sdk.service.sql import (StatementState, ExecuteStatementRequestOnWaitTimeout, Disposition, Format,
+                                        ColumnInfoTypeName)
 import os
+import io
+import csv
 import json
+import re
 import time
+import hashlib
+import math
+import sqlite3
+import tempfile
+import uuid
+import random
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional
+from decimal import Decimal
+from typing import Any, Callable, List, Dict, Optional, Iterable, Iterator, Tuple
 import requests
 
 app = Flask(__name__,
@@ -32,22 +48,886 @@ WAREHOUSE_ID = os.environ.get('WAREHOUSE_ID')
 if not WAREHOUSE_ID:
     raise ValueError("WAREHOUSE_ID must be configured in environment variables")
 
+# Statement execution
+SQL_TIMEOUT_SECONDS = float(os.environ.get('SQL_TIMEOUT_SECONDS', '300'))  # Default per-statement timeout
+SQL_SERVER_WAIT = '10s'  # Server-side wait on submit; short statements return without any polling
+SQL_POLL_INITIAL_SECONDS = 0.05
+SQL_POLL_MAX_SECONDS = 2.0
+SQL_DOWNLOAD_TIMEOUT_SECONDS = 60  # Per external-link chunk download
+
+# Metadata cache for catalog, schema, table and column lookups
+METADATA_CACHE_SIZE = int(os.environ.get('METADATA_CACHE_SIZE', '1024'))  # Max cached lookups
+METADATA_CACHE_TTL = float(os.environ.get('METADATA_CACHE_TTL', '300'))  # Seconds before a lookup is refreshed
+
+# Permission checks are cached briefly per (user, catalog, schema, table)
+PERMISSION_CACHE_TTL = float(os.environ.get('PERMISSION_CACHE_TTL', '60'))
+PERMISSION_CACHE_SIZE = 1024
+
+# Model call rate control (shared by all generation jobs)
+MODEL_RPS = float(os.environ.get('MODEL_RPS', '5'))  # Prompts per second at full rate
+MODEL_TPM = int(os.environ.get('MODEL_TPM', '200000'))  # Estimated model tokens per minute at full rate
+MODEL_MAX_RETRIES = int(os.environ.get('MODEL_MAX_RETRIES', '3'))  # Retries for throttled/transient failures
+MODEL_RETRY_BASE_SECONDS = 1.0  # Backoff before the first retry, doubled per attempt (jittered)
+MODEL_OUTPUT_TOKENS = 150  # Expected completion tokens per prompt, for the TPM budget
+MODEL_MIN_RATE_FACTOR = 0.05  # Floor for the adaptive rate (fraction of MODEL_RPS/MODEL_TPM)
+MODEL_MAX_RATE_FACTOR = float(os.environ.get('MODEL_MAX_RATE_FACTOR', '4'))  # Ceiling the rate probes up to (multiple of MODEL_RPS/MODEL_TPM)
+MODEL_RATE_INCREASE = 0.05  # Added to the rate factor per successful call
+MODEL_TRANSIENT_STREAK = 2  # Consecutive calls with transient failures before the rate is reduced
+
+# Generation backend: 'ai_query' sends prompts through the SQL warehouse, 'serving'
+# calls the model serving endpoint directly (falling back to ai_query on hard failures)
+GENERATION_BACKEND = os.environ.get('GENERATION_BACKEND', 'ai_query').lower()
+MODEL_SERVING_URL = os.environ.get('MODEL_SERVING_URL')  # Default: <workspace>/serving-endpoints/<MODEL_ENDPOINT>/invocations
+MODEL_SERVING_CONCURRENCY = int(os.environ.get('MODEL_SERVING_CONCURRENCY', '8'))  # Requests in flight (pooled connections)
+MODEL_SERVING_TIMEOUT = float(os.environ.get('MODEL_SERVING_TIMEOUT', '60'))  # Seconds per request
+MODEL_MAX_TOKENS = int(os.environ.get('MODEL_MAX_TOKENS', '1024'))  # Completion limit per request (combined prompts need room)
+
+# Combined generation: one prompt per table (or column chunk) answered with JSON
+# holding the table and column descriptions
+COMBINED_GENERATION_ENABLED = os.environ.get('COMBINED_GENERATION_ENABLED', 'true').lower() == 'true'
+COMBINED_CHUNK_COLUMNS = int(os.environ.get('COMBINED_CHUNK_COLUMNS', '25'))  # Most columns per prompt (bounds the JSON reply)
+
+# Prompt size control: column names, types and truncated sample values are
+# packed into a token budget; wide tables are split into chunks instead
+PROMPT_TOKEN_BUDGET = int(os.environ.get('PROMPT_TOKEN_BUDGET', '1500'))  # Estimated tokens per prompt
+PROMPT_SAMPLE_VALUES = int(os.environ.get('PROMPT_SAMPLE_VALUES', '3'))  # Sample values shown per column
+PROMPT_SAMPLE_VALUE_CHARS = int(os.environ.get('PROMPT_SAMPLE_VALUE_CHARS', '40'))  # Longer values are truncated
+PROMPT_STATS_RECENT = 200  # Recent prompts kept for /api/prompt-stats
+
+# Sample rows for prompt context: only the columns being described, each value
+# truncated on the warehouse; binary and complex types are never sampled
+SAMPLE_ROWS = int(os.environ.get('SAMPLE_ROWS', '5'))  # Rows per table; 0 for metadata-only generation
+SAMPLE_TABLESAMPLE_MIN_BYTES = int(os.environ.get('SAMPLE_TABLESAMPLE_MIN_BYTES', '0'))  # Larger tables use TABLESAMPLE; 0 disables
+SAMPLE_TABLESAMPLE_PERCENT = float(os.environ.get('SAMPLE_TABLESAMPLE_PERCENT', '1'))
+SAMPLE_SKIP_TYPES = {'BINARY', 'ARRAY', 'MAP', 'STRUCT', 'VARIANT', 'GEOMETRY', 'GEOGRAPHY'}
+
+# Persistent model response cache (SQLite on the app's local disk)
+LLM_CACHE_ENABLED = os.environ.get('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+LLM_CACHE_PATH = os.environ.get('LLM_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'uc_description_llm_cache.sqlite3'))
+LLM_CACHE_MAX_MB = float(os.environ.get('LLM_CACHE_MAX_MB', '64'))  # Least recently used responses evicted beyond this
+
+# Cross-table column deduplication: columns sharing a normalized name and type
+# across a run are described once and the result is fanned out to every table.
+# Names made only of generic words (id, status, created_at) mean something
+# different per table, so they are only shared between tables whose names share a word
+COLUMN_DEDUP_ENABLED = os.environ.get('COLUMN_DEDUP_ENABLED', 'true').lower() == 'true'
+COLUMN_DEDUP_MIN_TABLES = int(os.environ.get('COLUMN_DEDUP_MIN_TABLES', '2'))  # Smallest cluster worth sharing
+COLUMN_DEDUP_GENERIC_TOKENS = {
+    'id', 'key', 'pk', 'uuid', 'guid', 'name', 'title', 'label', 'description', 'desc', 'comment', 'comments',
+    'notes', 'status', 'state', 'type', 'kind', 'category', 'code', 'value', 'amount', 'total', 'count', 'qty',
+    'quantity', 'num', 'number', 'no', 'created', 'updated', 'modified', 'deleted', 'inserted', 'loaded', 'at',
+    'on', 'by', 'date', 'time', 'timestamp', 'ts', 'dt', 'start', 'end', 'from', 'to', 'is', 'has', 'active',
+    'enabled', 'flag', 'version', 'source', 'level', 'rank', 'sequence', 'seq', 'index', 'data', 'info',
+    'details', 'text', 'url', 'path'
+}
+APPROVED_REUSE_MODEL = 'approved-description'  # model_used for descriptions copied from reviewed rows
+
+# Similarity index over approved/applied column descriptions: close matches are
+# suggested without a model call, with the similarity stored as confidence_score
+SIMILARITY_INDEX_ENABLED = os.environ.get('SIMILARITY_INDEX_ENABLED', 'true').lower() == 'true'
+SIMILARITY_THRESHOLD = float(os.environ.get('SIMILARITY_THRESHOLD', '0.85'))  # Cosine similarity 0-1
+SIMILARITY_REFRESH_SECONDS = int(os.environ.get('SIMILARITY_REFRESH_SECONDS', '60'))  # Newly reviewed rows picked up after
+SIMILARITY_MAX_CANDIDATES = 200  # Documents scored per lookup
+SIMILARITY_INDEX_MODEL = 'similarity-index'  # model_used for index suggestions
+
+# Dashboard aggregates (stats, schema progress, review activity) are computed in
+# one statement and kept as a snapshot, updated in place by this app's generate,
+# review and apply writes
+DASHBOARD_TTL_SECONDS = int(os.environ.get('DASHBOARD_TTL_SECONDS', '30'))
+REVIEW_ROWS_REMEMBERED = 10000  # Review queue rows whose schema/status are kept for in-place review updates
+REVIEW_ROWS_TTL_SECONDS = 3600
+
+# Background generation jobs (held in process memory - run gunicorn with a single worker)
+GENERATION_WORKERS = int(os.environ.get('GENERATION_WORKERS', '2'))  # Jobs running at once
+JOB_RETENTION = int(os.environ.get('JOB_RETENTION', '50'))  # Finished jobs kept for polling
+GENERATION_CONCURRENCY = int(os.environ.get('GENERATION_CONCURRENCY', '4'))  # Tables in flight per job
+MAX_GENERATION_CONCURRENCY = 32
+MAX_STATEMENTS_IN_FLIGHT = int(os.environ.get('MAX_STATEMENTS_IN_FLIGHT', '8'))  # Request (interactive) statements at once
+MAX_GENERATION_STATEMENTS = int(os.environ.get('MAX_GENERATION_STATEMENTS', '6'))  # Job statements at once, in slots of their own
+JOB_EVENT_BUFFER = int(os.environ.get('JOB_EVENT_BUFFER', '2000'))  # Progress events kept per job for SSE replay
+JOB_MAX_ITEMS = int(os.environ.get('JOB_MAX_ITEMS', '500'))  # Result items kept per job; the event stream has them all
+GENERATE_SYNC_WAIT_SECONDS = float(os.environ.get('GENERATE_SYNC_WAIT_SECONDS', '30'))  # Longest /api/generate waits without "background"
+SSE_HEARTBEAT_SECONDS = 15
+
+# Buffered governance writes (one multi-row INSERT per flush instead of one per description)
+GOVERNANCE_FLUSH_ROWS = int(os.environ.get('GOVERNANCE_FLUSH_ROWS', '500'))
+GOVERNANCE_FLUSH_SECONDS = float(os.environ.get('GOVERNANCE_FLUSH_SECONDS', '30'))
+
+# Columns added to the governance table after its first release. Writes leave them out on
+# tables created before they existed, until /api/setup adds them.
+GOVERNANCE_MIGRATION_COLUMNS = {
+    'confidence_score': "DOUBLE COMMENT 'AI confidence 0-1'",
+    'schema_fingerprint': "STRING COMMENT 'Hash of the table column names and types at generation time'",
+}
+
+# Applying approved descriptions to UC
+APPLY_CONCURRENCY = int(os.environ.get('APPLY_CONCURRENCY', '4'))  # Tables applied in parallel
+APPLY_MARK_BATCH_SIZE = 1000  # Record ids per UPDATE ... SET review_status = 'APPLIED'
+
+# Governance export
+GOVERNANCE_EXPORT_COLUMNS = [
+    'id', 'object_type', 'catalog_name', 'schema_name', 'table_name', 'column_name', 'column_data_type',
+    'ai_generated_description', 'approved_description', 'reviewer', 'review_status',
+    'generated_at', 'reviewed_at', 'applied_at', 'model_used'
+]  # Plus any GOVERNANCE_MIGRATION_COLUMNS the table has
+EXPORT_FLUSH_ROWS = 500  # Rows per chunk written to the HTTP response
+
 # Lazy initialize Databricks client (will be created on first use)
 _workspace_client = None
+_workspace_client_lock = threading.Lock()
 
 def get_workspace_client():
     """Get or create WorkspaceClient instance"""
     global _workspace_client
-    if _workspace_client is None:
-        _workspace_client = WorkspaceClient()
+    with _workspace_client_lock:
+        if _workspace_client is None:
+            _workspace_client = WorkspaceClient()
     return _workspace_client
 
 
+class TTLCache:
+    """Thread-safe LRU cache with a per-entry TTL
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Any, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return a live entry (marking it most recently used) or default"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        """Store an entry, evicting the least recently used entries past maxsize"""
+        expires = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader: Callable[[], Any]):
+        """Return the cached value or load, cache and return it
+
+        Exceptions from loader propagate and nothing is cached.
+        """
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {'size': len(self._entries), 'max_size': self.maxsize, 'hits': self.hits, 'misses': self.misses}
+
+
+class ResponseCache:
+    """Persistent, content-addressed cache of model responses
+
+    Entries are keyed by a hash of (model endpoint, prompt) and stored in a
+    local SQLite file. Once the stored responses exceed max_bytes, the least
+    recently used entries are evicted.
+    """
+
+    def __init__(self, path: str = LLM_CACHE_PATH, max_bytes: int = int(LLM_CACHE_MAX_MB * 1024 * 1024)):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                response TEXT,
+                size INTEGER,
+                created_at REAL,
+                last_used REAL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+
+    def get_many(self, model: str, prompts: Dict[str, str]) -> Dict[str, str]:
+        """Look up cached responses; returns only the prompt keys that hit"""
+        keys = {name: self.key(model, prompt) for name, prompt in prompts.items()}
+        found = {}
+        with self._lock:
+            hashes = list(set(keys.values()))
+            for start in range(0, len(hashes), 500):
+                chunk = hashes[start:start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                for key, response in self._conn.execute(
+                        f"SELECT key, response FROM responses WHERE key IN ({placeholders})", chunk):
+                    found[key] = response
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE responses SET last_used = ? WHERE key = ?",
+                                       [(now, key) for key in found])
+                self._conn.commit()
+
+            responses = {name: found[key] for name, key in keys.items() if key in found}
+            self.hits += len(responses)
+            self.misses += len(prompts) - len(responses)
+        return responses
+
+    def put_many(self, model: str, responses: Dict[str, str], prompts: Dict[str, str]):
+        """Store responses for the given prompt keys"""
+        now = time.time()
+        rows = [(self.key(model, prompts[name]), model, response, len(response.encode('utf-8')), now, now)
+                for name, response in responses.items()]
+        if not rows:
+            return
+        with self._lock:
+            for key, _, _, size, _, _ in rows:
+                existing = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+                self._bytes += size - (existing[0] if existing else 0)
+            self._conn.executemany("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        # Trim to 90% of the limit so eviction doesn't run on every insert
+        if self._bytes <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall():
+            if self._bytes <= target:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._bytes -= size
+            evicted += 1
+        print(f"LLM cache evicted {evicted} responses")
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                'path': self.path,
+                'entries': entries,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+# Result values arrive as strings; these types are decoded using the result
+# manifest. DECIMAL is decoded per column by scale; dates, timestamps,
+# intervals and complex types stay strings.
+SQL_TYPE_DECODERS: Dict[ColumnInfoTypeName, Callable[[str], Any]] = {
+    ColumnInfoTypeName.BYTE: int,
+    ColumnInfoTypeName.SHORT: int,
+    ColumnInfoTypeName.INT: int,
+    ColumnInfoTypeName.LONG: int,
+    ColumnInfoTypeName.FLOAT: float,
+    ColumnInfoTypeName.DOUBLE: float,
+    ColumnInfoTypeName.BOOLEAN: lambda value: value.lower() == 'true',
+}
+
+
+class RateController:
+    """Shared throttle for model calls
+
+    Calls draw from two token buckets - prompts per second and estimated
+    tokens per minute - both refilled at the configured limits scaled by an
+    adaptive rate factor (AIMD: halved when the endpoint throttles or keeps
+    failing transiently, raised additively on success up to
+    MODEL_MAX_RATE_FACTOR, so the rate probes above the configured limits
+    until the endpoint pushes back). Throttled and transient failures are
+    retried with jittered exponential backoff.
+    """
+
+    THROTTLE_MARKERS = ('429', 'too many requests', 'rate limit', 'request_limit_exceeded', 'throttl', 'quota')
+    TRANSIENT_MARKERS = ('502', '503', '504', 'temporarily unavailable', 'service unavailable',
+                         'timed out', 'connection reset', 'connection aborted')
+
+    def __init__(self, rps: float = MODEL_RPS, tpm: int = MODEL_TPM, max_retries: int = MODEL_MAX_RETRIES,
+                 retry_base_seconds: float = MODEL_RETRY_BASE_SECONDS):
+        self.rps = max(0.01, rps)
+        self.tpm = max(1, tpm)
+        self.max_retries = max(0, max_retries)
+        self.retry_base_seconds = retry_base_seconds
+        self.factor = 1.0
+        self.max_factor = max(1.0, MODEL_MAX_RATE_FACTOR)
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._transient_streak = 0
+        self._stats = {'prompts': 0, 'throttled': 0, 'transient': 0, 'retried': 0, 'waited_seconds': 0.0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def estimate_tokens(prompt: str) -> int:
+        """Rough prompt plus completion token count (about 4 characters per token)"""
+        return len(prompt) // 4 + MODEL_OUTPUT_TOKENS
+
+    # Bursts of up to one second of requests and ten seconds of tokens at the current rate
+    @property
+    def _request_capacity(self) -> float:
+        return max(1.0, self.rps * self.factor)
+
+    @property
+    def _token_capacity(self) -> float:
+        return max(1.0, self.tpm * self.factor / 6.0)
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self._request_capacity, self._requests + elapsed * self.rps * self.factor)
+        self._tokens = min(self._token_capacity, self._tokens + elapsed * self.tpm / 60.0 * self.factor)
+
+    def acquire(self, calls: int = 1, tokens: int = 0):
+        """Block until the buckets allow a call, then draw from them
+
+        Calls larger than a bucket (big ai_query batches, which the warehouse
+        paces itself) wait for a full bucket, are sent at once and are charged
+        their whole cost. The bucket goes into debt that later calls wait out,
+        so the current rate (the configured limits times the adaptive factor)
+        holds on average, while one batch may burst past it.
+        """
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                self._refill()
+                need_calls = min(calls, self._request_capacity)
+                need_tokens = min(tokens, self._token_capacity)
+                if self._requests >= need_calls and self._tokens >= need_tokens:
+                    self._requests -= calls
+                    self._tokens -= tokens
+                    self._stats['waited_seconds'] += time.monotonic() - started
+                    return
+                wait = max((need_calls - self._requests) / (self.rps * self.factor),
+                           (need_tokens - self._tokens) / (self.tpm / 60.0 * self.factor))
+            time.sleep(min(max(wait, 0.01), 5.0))
+
+    def on_success(self):
+        with self._lock:
+            self._transient_streak = 0
+            self.factor = min(self.max_factor, self.factor + MODEL_RATE_INCREASE)
+
+    def on_throttle(self):
+        with self._lock:
+            self._stats['throttled'] += 1
+            self._decrease("throttled")
+
+    def on_transient(self):
+        """Repeated transient failures (overloaded endpoint) reduce the rate like throttling"""
+        with self._lock:
+            self._stats['transient'] += 1
+            self._transient_streak += 1
+            if self._transient_streak >= MODEL_TRANSIENT_STREAK:
+                self._transient_streak = 0
+                self._decrease("failing transiently")
+
+    def _decrease(self, reason: str):
+        # Concurrent calls failing in the same burst only back off once (lock held)
+        if time.monotonic() - self._last_decrease >= 1.0:
+            self.factor = max(MODEL_MIN_RATE_FACTOR, self.factor / 2)
+            self._last_decrease = time.monotonic()
+            print(f"Model endpoint {reason}, rate reduced to {self.factor:.0%}")
+
+    def classify(self, response: str) -> Optional[str]:
+        """'throttle' or 'transient' for retryable 'ERROR:' responses, else None"""
+        if not response.startswith('ERROR:'):
+            return None
+        message = response.lower()
+        if any(marker in message for marker in self.THROTTLE_MARKERS):
+            return 'throttle'
+        if any(marker in message for marker in self.TRANSIENT_MARKERS):
+            return 'transient'
+        return None
+
+    def run(self, prompts: Dict[str, str], send: Callable[[Dict[str, str]], Dict[str, str]]) -> Dict[str, str]:
+        """Send prompts with send(prompts) -> responses under the rate limits
+
+        Prompts whose responses are throttled or transient 'ERROR:' strings are
+        resent (only those) until MODEL_MAX_RETRIES is reached.
+        """
+        results = {}
+        pending = dict(prompts)
+        for attempt in range(self.max_retries + 1):
+            self.acquire(len(pending), sum(self.estimate_tokens(prompt) for prompt in pending.values()))
+            responses = send(pending)
+            with self._lock:
+                self._stats['prompts'] += len(pending)
+
+            retry = {}
+            throttled = False
+            for key, response in responses.items():
+                results[key] = response
+                kind = self.classify(response)
+                if kind:
+                    retry[key] = pending[key]
+                    throttled = throttled or kind == 'throttle'
+
+            if throttled:
+                self.on_throttle()
+            elif retry:
+                self.on_transient()
+            else:
+                self.on_success()
+
+            if not retry or attempt == self.max_retries:
+                break
+            pending = retry
+            with self._lock:
+                self._stats['retried'] += len(retry)
+            time.sleep(random.uniform(0.5, 1.0) * self.retry_base_seconds * 2 ** attempt)
+
+        return results
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return dict(self._stats, rate_factor=round(self.factor, 3), max_rate_factor=self.max_factor,
+                        prompts_per_second=round(self.rps * self.factor, 3),
+                        tokens_per_minute=round(self.tpm * self.factor))
+
+
+class PromptBuilder:
+    """Builds generation prompts that fit an estimated token budget
+
+    Column lines (name, type and a few truncated sample values) are packed
+    until the budget is reached: table prompts list the remaining columns by
+    name, and combined prompts split wide tables into chunks, so columns are
+    never silently dropped. Token counts of built prompts are recorded.
+    """
+
+    def __init__(self, budget: int = PROMPT_TOKEN_BUDGET, sample_values: int = PROMPT_SAMPLE_VALUES,
+                 value_chars: int = PROMPT_SAMPLE_VALUE_CHARS, chunk_columns: int = COMBINED_CHUNK_COLUMNS):
+        self.budget = max(100, budget)
+        self.sample_values = max(0, sample_values)
+        self.value_chars = max(8, value_chars)
+        self.chunk_columns = max(1, chunk_columns)
+        self._totals: Dict[str, Dict] = {}
+        self._recent = deque(maxlen=PROMPT_STATS_RECENT)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """Rough token count (about 4 characters per token)"""
+        return (len(text) + 3) // 4
+
+    def format_values(self, values: Iterable) -> List[str]:
+        """Distinct non-null sample values, whitespace-collapsed and truncated"""
+        formatted = []
+        for value in values:
+            if len(formatted) >= self.sample_values:
+                break
+            if value is None:
+                continue
+            text = ' '.join(str(value).split())
+            if len(text) > self.value_chars:
+                text = text[:self.value_chars - 3] + '...'
+            if text and text not in formatted:
+                formatted.append(text)
+        return formatted
+
+    def column_line(self, column: Dict, sample_data: Optional[List[Dict]], with_samples: bool = True) -> str:
+        line = f"  - {column['column_name']} ({column['data_type']})"
+        if with_samples and sample_data:
+            values = self.format_values(row.get(column['column_name']) for row in sample_data)
+            if values:
+                line += f" e.g. {', '.join(values)}"
+        return line
+
+    def _fit_lines(self, columns: List[Dict], sample_data: Optional[List[Dict]], available: int) -> List[str]:
+        """Column lines for as many leading columns as fit (always at least one)"""
+        lines, used = [], 0
+        for column in columns:
+            line = self.column_line(column, sample_data)
+            if used + self.count_tokens(line) + 1 > available:
+                line = self.column_line(column, sample_data, with_samples=False)
+                if lines and used + self.count_tokens(line) + 1 > available:
+                    break
+            lines.append(line)
+            used += self.count_tokens(line) + 1
+        return lines
+
+    def _names_within(self, names: List[str], available: int) -> str:
+        """Comma-separated names cut off at the budget with an 'and N more' tail"""
+        shown, used = [], 0
+        for name in names:
+            if used + self.count_tokens(name) + 1 > available:
+                break
+            shown.append(name)
+            used += self.count_tokens(name) + 1
+        text = ", ".join(shown)
+        if len(shown) < len(names):
+            text += f"{' and' if shown else ''} {len(names) - len(shown)} more"
+        return text
+
+    def table_prompt(self, catalog: str, schema: str, table: str, columns: List[Dict],
+                     sample_data: Optional[List[Dict]] = None) -> str:
+        """Prompt for a table description; columns past the budget are listed by name"""
+        path = f"{catalog}.{schema}.{table}"
+        head = f"Generate a 1-2 sentence description for table {path} with columns:\n"
+        tail = "\nWhat data does this table contain and what is its purpose?"
+        available = self.budget - self.count_tokens(head + tail)
+
+        lines = self._fit_lines(columns, sample_data, available * 3 // 4)
+        body = "\n".join(lines)
+        remaining = [col['column_name'] for col in columns[len(lines):]]
+        if remaining:
+            body += "\n  Other columns: " + self._names_within(remaining, available - self.count_tokens(body) - 4)
+
+        return self.record('table', path, head + body + tail, len(columns))
+
+    def column_prompt(self, catalog: str, schema: str, table: str, column_name: str, column_type: str,
+                      sample_values: Optional[List] = None) -> str:
+        """Prompt for one column description"""
+        path = f"{catalog}.{schema}.{table}"
+        values = self.format_values(sample_values or [])
+        while True:
+            sample_info = f" Sample values: {', '.join(values)}." if values else ""
+            prompt = (f"Generate a 1-sentence description for column {column_name} ({column_type}) in table "
+                      f"{path}.{sample_info} What does this column represent?")
+            if not values or self.count_tokens(prompt) <= self.budget:
+                return self.record('column', f"{path}.{column_name}", prompt, 1)
+            values = values[:-1]
+
+    def combined_prompts(self, catalog: str, schema: str, table: str, columns: List[Dict],
+                         sample_data: Optional[List[Dict]] = None, include_table: bool = True,
+                         table_columns: Optional[List[Dict]] = None) -> List[Tuple[List[Dict], str]]:
+        """Split columns into chunks that fit the budget, one JSON-answer prompt each
+
+        The first chunk also asks for the table description when include_table
+        is set; it names the table's other columns (table_columns) for context.
+
+        Returns:
+            List of (chunk columns, prompt)
+        """
+        path = f"{catalog}.{schema}.{table}"
+        table_columns = table_columns or columns
+        chunks = []
+        remaining = list(columns)
+        while remaining or (include_table and not chunks):
+            first = include_table and not chunks
+            if first:
+                shape = '{"table": "<description>", "columns": {"<column name>": "<description>", ...}}'
+                task = ("Write a 1-2 sentence description of what data the table contains and its purpose, "
+                        "and a 1-sentence description of what each of these columns represents:\n")
+            else:
+                shape = '{"columns": {"<column name>": "<description>", ...}}'
+                task = f"For table {path}, write a 1-sentence description of what each of these columns represents:\n"
+            tail = f"\nRespond with only a JSON object of the form {shape}, with one entry for every column listed."
+            available = self.budget - self.count_tokens(task + tail)
+
+            if first:
+                available -= self.count_tokens(f"Table {path} has {len(table_columns)} columns.\n")
+                lines = self._fit_lines(remaining[:self.chunk_columns], sample_data, available * 3 // 4)
+                described = {col['column_name'] for col in remaining[:len(lines)]}
+                others = [col['column_name'] for col in table_columns if col['column_name'] not in described]
+                context = f"Table {path} has {len(table_columns)} columns"
+                if others:
+                    used = sum(self.count_tokens(line) + 1 for line in lines)
+                    context += f", including {self._names_within(others, available - used - 4)}"
+                head = context + ".\n" + task
+            else:
+                lines = self._fit_lines(remaining[:self.chunk_columns], sample_data, available)
+                head = task
+
+            chunk, remaining = remaining[:len(lines)], remaining[len(lines):]
+            prompt = head + "\n".join(lines) + tail
+            chunks.append((chunk, self.record('combined', path, prompt, len(chunk))))
+        return chunks
+
+    def record(self, kind: str, target: str, prompt: str, columns: int) -> str:
+        """Record a built prompt's estimated token count; returns the prompt"""
+        tokens = self.count_tokens(prompt)
+        with self._lock:
+            totals = self._totals.setdefault(kind, {'prompts': 0, 'tokens': 0, 'max_tokens': 0,
+                                                    'columns': 0, 'over_budget': 0})
+            totals['prompts'] += 1
+            totals['tokens'] += tokens
+            totals['columns'] += columns
+            totals['max_tokens'] = max(totals['max_tokens'], tokens)
+            totals['over_budget'] += tokens > self.budget
+            self._recent.append({'kind': kind, 'target': target, 'tokens': tokens, 'columns': columns})
+        return prompt
+
+    def stats(self) -> Dict:
+        with self._lock:
+            by_kind = {kind: dict(totals, avg_tokens=round(totals['tokens'] / totals['prompts'], 1))
+                       for kind, totals in self._totals.items()}
+            return {'budget': self.budget, 'sample_values': self.sample_values,
+                    'sample_value_chars': self.value_chars, 'chunk_columns': self.chunk_columns,
+                    'by_kind': by_kind, 'recent': list(self._recent)}
+
+
+class ServingClient:
+    """Calls a chat model serving endpoint directly over pooled keep-alive HTTP
+
+    Requests run on a bounded thread pool sharing one requests.Session, so at
+    most `concurrency` connections are open. Failures come back as 'ERROR:'
+    strings, like ai_query results.
+    """
+
+    def __init__(self, url: str, headers: Callable[[], Dict[str, str]],
+                 concurrency: int = MODEL_SERVING_CONCURRENCY, timeout: float = MODEL_SERVING_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+        self._headers = headers
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(1, concurrency))
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._executor = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix='serving')
+
+    def query(self, prompt: str) -> str:
+        """Send one prompt and return the completion text"""
+        try:
+            response = self._session.post(
+                self.url,
+                json={'messages': [{'role': 'user', 'content': prompt}], 'max_tokens': MODEL_MAX_TOKENS},
+                headers=self._headers(),
+                timeout=self.timeout
+            )
+            if response.status_code != 200:
+                return f"ERROR: HTTP {response.status_code}: {response.text[:200]}"
+            content = response.json()['choices'][0]['message']['content']
+            return content.strip() if content else "ERROR: No response from serving endpoint"
+        except requests.exceptions.Timeout:
+            return f"ERROR: Request timed out after {self.timeout:g} seconds"
+        except Exception as e:
+            return f"ERROR: {str(e)}"
+
+    def query_batch(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        """Send prompts concurrently; returns key -> completion or 'ERROR:' string"""
+        keys = list(prompts)
+        return dict(zip(keys, self._executor.map(self.query, (prompts[key] for key in keys))))
+
+
+class SimilarityIndex:
+    """In-memory TF-IDF index over reviewed column descriptions
+
+    Each approved or applied column is a document of weighted terms from its
+    column name, data type and table name, keyed by object path so a newer
+    review of the same column replaces the older one. IDF weights are computed
+    at query time, so documents can be added incrementally.
+
+    A document is only a candidate if it shares both a column name term and a
+    table name term with the query, so a generic column such as `id` or
+    `status` never borrows the description from an unrelated table.
+    """
+
+    def __init__(self, max_candidates: int = SIMILARITY_MAX_CANDIDATES):
+        self.watermark = None  # Latest reviewed_at loaded
+        self.refreshed_at = 0.0  # time.monotonic() of the last refresh
+        self.refresh_lock = threading.Lock()
+        self.max_candidates = max(1, max_candidates)
+        self._docs: Dict[str, Dict] = {}
+        self._postings: Dict[str, set] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    @staticmethod
+    def features(column_name: str, data_type: str, table_name: str) -> Dict[str, float]:
+        """Weighted terms for a column: full name, name tokens, base type and table tokens
+
+        Table tokens carry as much weight in total as the column name, so the
+        same column name in an unrelated table scores well below the threshold.
+        """
+        name = DescriptionService.normalize_column_name(column_name)
+        terms = {f"name:{name}": 2.0}
+        for token in name.split('_'):
+            if token:
+                terms[f"token:{token}"] = terms.get(f"token:{token}", 0.0) + 1.0
+        base_type = re.split(r'[(<]', data_type.strip().lower())[0]  # decimal(10,2) -> decimal
+        if base_type:
+            terms[f"type:{base_type}"] = 1.0
+        table_tokens = SimilarityIndex.table_tokens(table_name)
+        for token in table_tokens:
+            terms[f"table:{token}"] = terms.get(f"table:{token}", 0.0) + 2.0 / len(table_tokens)
+        return terms
+
+    @staticmethod
+    def table_tokens(table_name: str) -> List[str]:
+        """Words of a table name; plural names (orders, order_history) share their singular token"""
+        return [token[:-1] if len(token) > 3 and token.endswith('s') and not token.endswith('ss') else token
+                for token in DescriptionService.normalize_column_name(table_name).split('_') if token]
+
+    def add(self, key: str, column_name: str, data_type: str, table_name: str, description: str):
+        """Index (or re-index) one reviewed column description"""
+        terms = self.features(column_name, data_type, table_name)
+        with self._lock:
+            self._remove(key)
+            self._docs[key] = {'terms': terms, 'description': description}
+            for term in terms:
+                self._postings.setdefault(term, set()).add(key)
+
+    def discard(self, key: str):
+        """Drop a column that is no longer approved, if indexed"""
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key: str):
+        doc = self._docs.pop(key, None)
+        if doc is None:
+            return
+        for term in doc['terms']:
+            posting = self._postings.get(term)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[term]
+
+    def mark_stale(self):
+        """Refresh on next use"""
+        self.refreshed_at = 0.0
+
+    def _candidates(self, query: Dict[str, float]) -> List[str]:
+        """Documents sharing a name term and a table term, exact name matches first (caller holds the lock)"""
+        table_keys = set()
+        for term in query:
+            if term.startswith('table:'):
+                table_keys |= self._postings.get(term, set())
+        if not table_keys:
+            return []
+
+        candidates = []
+        seen = set()
+        # Exact name first, then name tokens from rarest to most common
+        name_terms = sorted((term for term in query if term.startswith(('name:', 'token:'))),
+                            key=lambda term: (not term.startswith('name:'), len(self._postings.get(term, ()))))
+        for term in name_terms:
+            for key in self._postings.get(term, set()) & table_keys:
+                if key not in seen:
+                    seen.add(key)
+                    candidates.append(key)
+                    if len(candidates) >= self.max_candidates:
+                        return candidates
+        return candidates
+
+    def search(self, column_name: str, data_type: str, table_name: str) -> Optional[Tuple[str, float]]:
+        """Most similar indexed description by cosine similarity
+
+        At most max_candidates documents are scored; the lock is only held
+        while they and their term frequencies are collected.
+
+        Returns:
+            (description, similarity) or None when no document shares a name and table term
+        """
+        query = self.features(column_name, data_type, table_name)
+        with self._lock:
+            docs = [self._docs[key] for key in self._candidates(query)]
+            if not docs:
+                return None
+            total = len(self._docs)
+            terms = set(query).union(*(doc['terms'] for doc in docs))
+            idf = {term: math.log((1 + total) / (1 + len(self._postings.get(term, ())))) + 1 for term in terms}
+
+        query_vec = {term: tf * idf[term] for term, tf in query.items()}
+        query_norm = math.sqrt(sum(w * w for w in query_vec.values()))
+
+        best = None
+        for doc in docs:
+            doc_vec = {term: tf * idf[term] for term, tf in doc['terms'].items()}
+            doc_norm = math.sqrt(sum(w * w for w in doc_vec.values()))
+            dot = sum(w * doc_vec.get(term, 0.0) for term, w in query_vec.items())
+            score = dot / (query_norm * doc_norm) if query_norm and doc_norm else 0.0
+            if best is None or score > best[1]:
+                best = (doc['description'], score)
+        return best
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'documents': len(self._docs),
+                'terms': len(self._postings),
+                'watermark': self.watermark,
+                'threshold': SIMILARITY_THRESHOLD,
+                'max_candidates': self.max_candidates
+            }
+
+
+class StatementHandle:
+    """A statement submitted to the warehouse that may still be running"""
+
+    PENDING_STATES = (StatementState.PENDING, StatementState.RUNNING)
+
+    def __init__(self, statement, timeout: float = SQL_TIMEOUT_SECONDS):
+        self.statement = statement
+        self.statement_id = statement.statement_id
+        self.deadline = time.monotonic() + timeout
+        self.timeout = timeout
+
+    @property
+    def done(self) -> bool:
+        return self.statement.status.state not in self.PENDING_STATES
+
+
 class DescriptionService:
     """Service for managing UC descriptions"""
 
     def __init__(self):
         self.w = get_workspace_client()
+        # Bounded warehouse load; generation jobs have their own slots so long
+        # ai_query statements never queue the UI's requests behind them
+        self._statement_slots = threading.BoundedSemaphore(MAX_STATEMENTS_IN_FLIGHT)
+        self._generation_slots = threading.BoundedSemaphore(MAX_GENERATION_STATEMENTS)
+        self._thread_state = threading.local()
+        self._metadata_cache = TTLCache(METADATA_CACHE_SIZE, METADATA_CACHE_TTL)
+        self._permission_cache = TTLCache(PERMISSION_CACHE_SIZE, PERMISSION_CACHE_TTL)
+        self.similarity_index = SimilarityIndex() if SIMILARITY_INDEX_ENABLED else None
+        self.rate_controller = RateController()
+        self.prompt_builder = PromptBuilder()
+        self._serving_client = None
+        self._serving_lock = threading.Lock()
+        self._dashboard = None  # Snapshot built by _load_dashboard
+        self._count_cache = TTLCache(256, DASHBOARD_TTL_SECONDS)
+        self._review_rows = TTLCache(REVIEW_ROWS_REMEMBERED, REVIEW_ROWS_TTL_SECONDS)  # id -> dashboard row
+        self._http = requests.Session()  # Result chunk downloads
+        self._dashboard_lock = threading.Lock()
+        self._dashboard_load_lock = threading.Lock()
+        self.response_cache = None
+        if LLM_CACHE_ENABLED:
+            try:
+                self.response_cache = ResponseCache()
+            except Exception as e:
+                print(f"LLM response cache disabled, cannot open {LLM_CACHE_PATH}: {e}")
 
     def _validate_identifier(self, identifier: str, name: str):
         """Validate SQL identifier (catalog, schema, table, column name)"""
@@ -70,10 +950,32 @@ class DescriptionService:
         """
         Check if current user has necessary permissions
 
+        Results are cached per (user, catalog, schema, table) for PERMISSION_CACHE_TTL
+        seconds. Checks that failed for other reasons than a missing grant (a
+        warehouse timeout, a transient SDK error) are not cached.
+
         Returns:
             Dict with permission status and details
         """
-        permissions = {
+        try:
+            # Get current user
+            user = self._permission_cache.get_or_load(('user',), lambda: self.w.current_user.me().user_name)
+        except Exception as e:
+            permissions = self._no_permissions()
+            permissions['errors'].append(f"Error checking permissions: {str(e)}")
+            return permissions
+
+        key = ('permissions', user, catalog, schema, table)
+        missing = object()
+        permissions = self._permission_cache.get(key, missing)
+        if permissions is missing:
+            permissions, conclusive = self._check_permissions(user, catalog, schema, table)
+            if conclusive:
+                self._permission_cache.set(key, permissions)
+        return dict(permissions, errors=list(permissions['errors']))
+
+    def _no_permissions(self) -> Dict:
+        return {
             'can_select': False,
             'can_modify': False,
             'can_use_catalog': False,
@@ -82,32 +984,38 @@ class DescriptionService:
             'errors': []
         }
 
+    def _check_permissions(self, user: str, catalog: str, schema: str,
+                           table: Optional[str]) -> Tuple[Dict, bool]:
+        """Run the permission checks
+
+        Returns:
+            (permissions, whether every check had a definite answer)
+        """
+        permissions = self._no_permissions()
+        conclusive = True
+
         try:
-            # Get current user
-            current_user = self.w.current_user.me()
-            permissions['user'] = current_user.user_name
+            permissions['user'] = user
 
-            # Check catalog access
+            # Check catalog access (direct lookup by name)
             try:
-                catalogs = self.w.catalogs.list()
-                catalog_names = [c.name for c in catalogs]
-                if catalog in catalog_names:
-                    permissions['can_use_catalog'] = True
-                else:
-                    permissions['errors'].append(f"Catalog '{catalog}' not accessible")
+                self.w.catalogs.get(catalog)
+                permissions['can_use_catalog'] = True
+            except (NotFound, PermissionDenied):
+                permissions['errors'].append(f"Catalog '{catalog}' not accessible")
             except Exception as e:
-                permissions['errors'].append(f"Cannot list catalogs: {str(e)}")
+                permissions['errors'].append(f"Cannot check catalog: {str(e)}")
+                conclusive = False
 
-            # Check schema access
+            # Check schema access (direct lookup by name)
             try:
-                schemas = self.w.schemas.list(catalog_name=catalog)
-                schema_names = [s.name for s in schemas]
-                if schema in schema_names:
-                    permissions['can_use_schema'] = True
-                else:
-                    permissions['errors'].append(f"Schema '{schema}' not accessible")
+                self.w.schemas.get(f"{catalog}.{schema}")
+                permissions['can_use_schema'] = True
+            except (NotFound, PermissionDenied):
+                permissions['errors'].append(f"Schema '{schema}' not accessible")
             except Exception as e:
-                permissions['errors'].append(f"Cannot list schemas: {str(e)}")
+                permissions['errors'].append(f"Cannot check schema: {str(e)}")
+                conclusive = False
 
             # Check table access (if specified)
             if table:
@@ -122,7 +1030,9 @@ class DescriptionService:
                     self.execute_sql(desc_query)
                     permissions['can_modify'] = True
                 except Exception as e:
+                    # A failed statement doesn't say whether it was the grant or the warehouse
                     permissions['errors'].append(f"Cannot access table '{table}': {str(e)}")
+                    conclusive = False
             else:
                 # Check if we can list tables in schema
                 try:
@@ -137,17 +1047,30 @@ class DescriptionService:
                     permissions['can_modify'] = True  # Assume if can list, can modify
                 except Exception as e:
                     permissions['errors'].append(f"Cannot list tables: {str(e)}")
+                    conclusive = False
 
         except Exception as e:
             permissions['errors'].append(f"Error checking permissions: {str(e)}")
+            conclusive = False
+
+        return permissions, conclusive
 
-        return permissions
+    def invalidate_table(self, catalog: str, schema: str, table: str):
+        """Drop cached metadata for a table (and its schema's table list) after its comments change"""
+        self._metadata_cache.invalidate(('table_metadata', catalog, schema, table))
+        self._metadata_cache.invalidate(('tables', catalog, schema))
+
+    def clear_metadata_cache(self):
+        """Drop every cached metadata lookup"""
+        self._metadata_cache.clear()
 
     def get_catalogs(self) -> List[str]:
         """Get list of accessible catalogs"""
         try:
-            catalogs = self.w.catalogs.list()
-            return sorted([c.name for c in catalogs if c.name])
+            return self._metadata_cache.get_or_load(
+                ('catalogs',),
+                lambda: sorted([c.name for c in self.w.catalogs.list() if c.name])
+            )
         except Exception as e:
             print(f"Error listing catalogs: {e}")
             return []
@@ -155,14 +1078,22 @@ class DescriptionService:
     def get_schemas(self, catalog: str) -> List[str]:
         """Get list of schemas in catalog"""
         try:
-            schemas = self.w.schemas.list(catalog_name=catalog)
-            return sorted([s.name for s in schemas if s.name])
+            return self._metadata_cache.get_or_load(
+                ('schemas', catalog),
+                lambda: sorted([s.name for s in self.w.schemas.list(catalog_name=catalog) if s.name])
+            )
         except Exception as e:
             print(f"Error listing schemas: {e}")
             return []
 
     def get_tables(self, catalog: str, schema: str) -> List[Dict]:
         """Get list of tables in schema with metadata"""
+        return self._metadata_cache.get_or_load(
+            ('tables', catalog, schema),
+            lambda: self._load_tables(catalog, schema)
+        )
+
+    def _load_tables(self, catalog: str, schema: str) -> List[Dict]:
         # Simplified query without correlated subquery for performance
         query = f"""
         SELECT
@@ -177,48 +1108,218 @@ class DescriptionService:
         """
         return self.execute_sql(query)
 
-    def execute_sql(self, query: str, warehouse_id: str = WAREHOUSE_ID) -> List[Dict]:
-        """Execute SQL and return results"""
+    def execute_sql(self, query: str, warehouse_id: str = WAREHOUSE_ID,
+                    timeout: float = SQL_TIMEOUT_SECONDS,
+                    disposition: Optional[Disposition] = None) -> List[Dict]:
+        """Execute SQL and return results
+
+        Every result chunk is read, so large results are complete; pass
+        Disposition.EXTERNAL_LINKS for results beyond the inline size limit,
+        or use iter_sql to avoid holding them in memory.
+        The statement is cancelled on the warehouse if it runs longer than timeout.
+        """
         try:
-            print(f"Executing SQL query (warehouse: {warehouse_id})")
-            statement = self.w.statement_execution.execute_statement(
-                statement=query,
-                warehouse_id=warehouse_id,
-                wait_timeout='50s'
-            )
+            results = list(self.iter_sql(query, warehouse_id, timeout, disposition=disposition))
+            print(f"SQL query returned {len(results)} rows")
+            return results
 
-            # Wait for completion with timeout
-            max_wait = 45  # Maximum 45 seconds
-            elapsed = 0
-            while statement.status.state in [StatementState.PENDING, StatementState.RUNNING]:
-                if elapsed >= max_wait:
-                    raise Exception(f"Query timeout after {max_wait} seconds")
-                time.sleep(1)
-                elapsed += 1
-                statement = self.w.statement_execution.get_statement(statement.statement_id)
+        except Exception as e:
+            print(f"SQL Error: {e}")
+            raise
 
-            if statement.status.state != StatementState.SUCCEEDED:
-                error_msg = statement.status.error if statement.status.error else "Unknown error"
-                raise Exception(f"Query failed: {error_msg}")
+    def iter_sql(self, query: str, warehouse_id: str = WAREHOUSE_ID,
+                 timeout: float = SQL_TIMEOUT_SECONDS,
+                 disposition: Optional[Disposition] = Disposition.EXTERNAL_LINKS) -> Iterator[Dict]:
+        """Execute SQL and yield result rows chunk by chunk
 
-            # Parse results
-            if not statement.result or not statement.result.data_array:
-                return []
+        Only one chunk is held in memory at a time. The statement slot is
+        released once the statement finishes, before rows are fetched.
+        """
+        statement = self._run_statement(query, warehouse_id, timeout, disposition)
+        yield from self._iter_statement_rows(statement)
 
-            # Get column names
-            columns = [col.name for col in statement.manifest.schema.columns]
+    def execute_sql_columns(self, query: str, warehouse_id: str = WAREHOUSE_ID,
+                            timeout: float = SQL_TIMEOUT_SECONDS,
+                            disposition: Optional[Disposition] = None) -> Dict[str, List]:
+        """Execute SQL and return typed results column by column
 
-            # Convert to list of dicts
-            results = []
-            for row in statement.result.data_array:
-                results.append(dict(zip(columns, row)))
+        Returns:
+            Dict mapping each result column name to its list of values
+        """
+        statement = self._run_statement(query, warehouse_id, timeout, disposition)
+        names, decoders = self._result_columns(statement)
+        columns = {name: [] for name in names}
+        for rows in self._iter_chunks(statement):
+            for name, decoder, values in zip(names, decoders, zip(*rows)):
+                columns[name].extend(values if decoder is None else
+                                     [None if value is None else decoder(value) for value in values])
+        return columns
+
+    @contextmanager
+    def generation_statements(self):
+        """Run this thread's statements in the generation jobs' slots"""
+        previous = getattr(self._thread_state, 'generation', False)
+        self._thread_state.generation = True
+        try:
+            yield
+        finally:
+            self._thread_state.generation = previous
+
+    def _run_statement(self, query: str, warehouse_id: str, timeout: float,
+                       disposition: Optional[Disposition]):
+        """Run a statement to completion within a statement slot"""
+        print(f"Executing SQL query (warehouse: {warehouse_id})")
+        generation = getattr(self._thread_state, 'generation', False)
+        with self._generation_slots if generation else self._statement_slots:
+            wait_timeout = SQL_SERVER_WAIT if timeout >= 10 else '0s'
+            handle = self.submit_sql(query, warehouse_id, timeout=timeout, wait_timeout=wait_timeout,
+                                     disposition=disposition)
+            self._wait(handle)
+        return handle.statement
+
+    def submit_sql(self, query: str, warehouse_id: str = WAREHOUSE_ID,
+                   timeout: float = SQL_TIMEOUT_SECONDS, wait_timeout: str = '0s',
+                   disposition: Optional[Disposition] = None) -> StatementHandle:
+        """Submit SQL without waiting for it to finish
+
+        Statements submitted this way don't take a statement slot;
+        callers bound their own fan-out and collect results with await_sql or
+        iter_completed.
+        """
+        statement = self.w.statement_execution.execute_statement(
+            statement=query,
+            warehouse_id=warehouse_id,
+            wait_timeout=wait_timeout,
+            on_wait_timeout=ExecuteStatementRequestOnWaitTimeout.CONTINUE,
+            disposition=disposition,
+            format=Format.JSON_ARRAY if disposition else None
+        )
+        return StatementHandle(statement, timeout)
 
-            print(f"SQL query returned {len(results)} rows")
-            return results
+    def await_sql(self, handle: StatementHandle) -> List[Dict]:
+        """Wait for a submitted statement and return its results"""
+        self._wait(handle)
+        return self._statement_rows(handle.statement)
+
+    def _wait(self, handle: StatementHandle):
+        """Wait for a submitted statement to finish
 
+        Polls with exponential backoff starting at SQL_POLL_INITIAL_SECONDS and
+        cancels the statement once its timeout has passed.
+        """
+        delay = SQL_POLL_INITIAL_SECONDS
+        while not handle.done:
+            remaining = handle.deadline - time.monotonic()
+            if remaining <= 0:
+                self.cancel_sql(handle)
+                raise TimeoutError(f"Query timeout after {handle.timeout:g} seconds")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, SQL_POLL_MAX_SECONDS)
+            self._refresh(handle)
+
+    def iter_completed(self, handles: Iterable[StatementHandle]) -> Iterator[Tuple[StatementHandle, Optional[List[Dict]], Optional[Exception]]]:
+        """Yield (handle, rows, error) for submitted statements as they finish
+
+        All pending statements are polled together with one shared backoff,
+        which resets whenever a statement completes.
+        """
+        pending = list(handles)
+        delay = SQL_POLL_INITIAL_SECONDS
+        while pending:
+            still_running = []
+            for handle in pending:
+                if not handle.done and time.monotonic() >= handle.deadline:
+                    self.cancel_sql(handle)
+                    yield handle, None, TimeoutError(f"Query timeout after {handle.timeout:g} seconds")
+                elif handle.done:
+                    try:
+                        yield handle, self._statement_rows(handle.statement), None
+                    except Exception as e:
+                        yield handle, None, e
+                else:
+                    still_running.append(handle)
+
+            if len(still_running) < len(pending):
+                delay = SQL_POLL_INITIAL_SECONDS
+            pending = still_running
+            if pending:
+                time.sleep(delay)
+                delay = min(delay * 2, SQL_POLL_MAX_SECONDS)
+                for handle in pending:
+                    self._refresh(handle)
+
+    def cancel_sql(self, handle: StatementHandle):
+        """Cancel a running statement (best effort)"""
+        try:
+            self.w.statement_execution.cancel_execution(handle.statement_id)
+            print(f"Cancelled statement {handle.statement_id}")
         except Exception as e:
-            print(f"SQL Error: {e}")
-            raise
+            print(f"Error cancelling statement {handle.statement_id}: {e}")
+
+    def _refresh(self, handle: StatementHandle):
+        handle.statement = self.w.statement_execution.get_statement(handle.statement_id)
+
+    def _statement_rows(self, statement) -> List[Dict]:
+        """Convert a finished statement into a list of row dicts"""
+        return list(self._iter_statement_rows(statement))
+
+    def _iter_statement_rows(self, statement) -> Iterator[Dict]:
+        """Yield typed row dicts of a finished statement, fetching further chunks as needed"""
+        names, decoders = self._result_columns(statement)
+        for rows in self._iter_chunks(statement):
+            for row in rows:
+                yield {name: value if value is None or decoder is None else decoder(value)
+                       for name, decoder, value in zip(names, decoders, row)}
+
+    def _result_columns(self, statement) -> Tuple[List[str], List[Optional[Callable[[str], Any]]]]:
+        """Column names and value decoders (None keeps the string) of a finished statement"""
+        if statement.status.state != StatementState.SUCCEEDED:
+            error_msg = statement.status.error if statement.status.error else "Unknown error"
+            raise Exception(f"Query failed: {error_msg}")
+
+        if not statement.manifest or not statement.manifest.schema or not statement.manifest.schema.columns:
+            return [], []
+
+        names, decoders = [], []
+        for col in statement.manifest.schema.columns:
+            names.append(col.name)
+            if col.type_name == ColumnInfoTypeName.DECIMAL:
+                # Scaled decimals stay exact; float would round money and IDs
+                decoders.append(int if not col.type_scale else Decimal)
+            else:
+                decoders.append(SQL_TYPE_DECODERS.get(col.type_name))
+        return names, decoders
+
+    def _iter_chunks(self, statement) -> Iterator[List[List]]:
+        """Yield the raw rows of each result chunk of a finished statement"""
+        if not statement.manifest or not statement.result:
+            return
+        if statement.manifest.truncated:
+            print(f"Warning: result of statement {statement.statement_id} was truncated by the warehouse")
+
+        chunk = statement.result
+        while chunk is not None:
+            yield self._chunk_rows(chunk)
+
+            # Inline chunks carry next_chunk_index themselves; link chunks carry it per link
+            next_index = chunk.next_chunk_index
+            if next_index is None and chunk.external_links:
+                next_index = chunk.external_links[-1].next_chunk_index
+            chunk = (self.w.statement_execution.get_statement_result_chunk_n(statement.statement_id, next_index)
+                     if next_index is not None else None)
+
+    def _chunk_rows(self, chunk) -> List[List]:
+        """Rows of one result chunk, downloading external links"""
+        if chunk.external_links:
+            rows = []
+            for link in chunk.external_links:
+                # Presigned URLs: send only the headers the link asks for, never workspace auth
+                response = self._http.get(link.external_link, headers=link.http_headers or {},
+                                          timeout=SQL_DOWNLOAD_TIMEOUT_SECONDS)
+                response.raise_for_status()
+                rows.extend(response.json())
+            return rows
+        return chunk.data_array or []
 
     def setup_governance_table(self):
         """Create governance table if not exists"""
@@ -243,12 +1344,43 @@ class DescriptionService:
             applied_at TIMESTAMP,
             model_used STRING,
             generation_error STRING,
-            confidence_score DOUBLE COMMENT 'AI confidence 0-1'
+            confidence_score DOUBLE COMMENT 'AI confidence 0-1',
+            schema_fingerprint STRING COMMENT 'Hash of the table column names and types at generation time'
         )
         COMMENT 'Governance tracking for UC description generation'
         """
         self.execute_sql(create_table)
 
+        # Add columns introduced since the table was first created
+        self._metadata_cache.invalidate(('governance_columns',))
+        existing = self._governance_table_columns()
+        for column, definition in GOVERNANCE_MIGRATION_COLUMNS.items():
+            if column not in existing:
+                print(f"Adding column {column} to {GOVERNANCE_TABLE}")
+                self.execute_sql(f"ALTER TABLE {GOVERNANCE_TABLE} ADD COLUMNS ({column} {definition})")
+        self._metadata_cache.invalidate(('governance_columns',))
+
+    def _governance_table_columns(self) -> set:
+        """Column names of the governance table (cached)"""
+        def load():
+            query = f"""
+            SELECT column_name
+            FROM system.information_schema.columns
+            WHERE table_catalog = '{TARGET_CATALOG}'
+              AND table_schema = '{GOVERNANCE_SCHEMA}'
+              AND table_name = 'description_governance'
+            """
+            return set(self.execute_sql_columns(query).get('column_name', []))
+
+        return self._metadata_cache.get_or_load(('governance_columns',), load)
+
+    def _governance_has_column(self, column: str) -> bool:
+        try:
+            return column in self._governance_table_columns()
+        except Exception as e:
+            print(f"Cannot read governance table columns: {e}")
+            return False
+
     def get_tables_for_generation(self, catalog: str, schema: Optional[str] = None) -> List[Dict]:
         """Get tables for description generation - shows all tables (MANAGED, EXTERNAL, MATERIALIZED_VIEW)"""
         if schema:
@@ -280,9 +1412,27 @@ class DescriptionService:
 
         return self.execute_sql(query)
 
-    def get_table_metadata(self, catalog: str, schema: str, table: str) -> Dict:
-        """Get detailed metadata for a table"""
-        # Get columns
+    def get_table_metadata(self, catalog: str, schema: str, table: str,
+                           columns: Optional[List[Dict]] = None, sample: bool = True) -> Dict:
+        """Get detailed metadata for a table
+
+        Pass columns already loaded by prefetch_columns to skip the per-table
+        information_schema query; they are fresher than any cached entry, so
+        they replace it. sample=False leaves sample_data empty so the caller
+        can sample just the columns it describes with get_sample_data.
+        """
+        key = ('table_metadata', catalog, schema, table)
+        if columns is not None:
+            metadata = {'columns': columns}
+            self._metadata_cache.set(key, metadata)
+        else:
+            metadata = self._metadata_cache.get_or_load(
+                key, lambda: self._load_table_metadata(catalog, schema, table)
+            )
+        sample_data = self.get_sample_data(catalog, schema, table, metadata['columns']) if sample else []
+        return dict(metadata, sample_data=sample_data)
+
+    def _load_table_metadata(self, catalog: str, schema: str, table: str) -> Dict:
         columns_query = f"""
         SELECT column_name, data_type, comment
         FROM system.information_schema.columns
@@ -291,23 +1441,216 @@ class DescriptionService:
           AND table_name = '{table}'
         ORDER BY ordinal_position
         """
-        columns = self.execute_sql(columns_query)
+        return {'columns': self.execute_sql(columns_query)}
+
+    @staticmethod
+    def is_sampleable(data_type: Optional[str]) -> bool:
+        """Whether sample values of a column type are useful prompt context"""
+        base = (data_type or '').split('<')[0].split('(')[0].strip().upper()
+        return bool(base) and base not in SAMPLE_SKIP_TYPES
 
-        # Get sample data (safely)
-        sample_data = []
+    def get_sample_data(self, catalog: str, schema: str, table: str, columns: List[Dict]) -> List[Dict]:
+        """Sample rows of the given columns, values truncated on the warehouse
+
+        Samples are cached per table, so the prompts of one run share a single
+        query; asking for columns not yet sampled re-samples the union. A
+        failed sample is logged and cached as empty.
+        """
+        if SAMPLE_ROWS <= 0:
+            return []
+        names = [col['column_name'] for col in columns if self.is_sampleable(col.get('data_type'))]
+        if not names:
+            return []
+
+        key = ('sample_data', catalog, schema, table)
+        cached = self._metadata_cache.get(key)
+        if cached is not None:
+            if set(names) <= cached['columns']:
+                return cached['rows']
+            names = list(dict.fromkeys(list(cached['columns']) + names))
+
+        rows = []
         try:
-            sample_query = f"SELECT * FROM {catalog}.{schema}.{table} LIMIT 5"
-            sample_data = self.execute_sql(sample_query)
-        except:
-            pass
+            rows = self._sample_rows(catalog, schema, table, names)
+        except Exception as e:
+            print(f"Sampling {catalog}.{schema}.{table} failed, generating without sample data: {e}")
 
-        return {
-            'columns': columns,
-            'sample_data': sample_data
-        }
+        self._metadata_cache.set(key, {'columns': set(names), 'rows': rows})
+        return rows
+
+    def _sample_rows(self, catalog: str, schema: str, table: str, names: List[str]) -> List[Dict]:
+        self._validate_identifier(catalog, "catalog")
+        self._validate_identifier(schema, "schema")
+        self._validate_identifier(table, "table")
+
+        # One extra character so the prompt builder can mark truncated values
+        projections = ",\n                ".join(
+            f"substr(cast(`{name.replace('`', '``')}` AS STRING), 1, {PROMPT_SAMPLE_VALUE_CHARS + 1}) "
+            f"AS `{name.replace('`', '``')}`"
+            for name in names
+        )
+        def query(tablesample: str = "") -> str:
+            return f"""
+            SELECT
+                {projections}
+            FROM {catalog}.{schema}.{table}{tablesample}
+            LIMIT {SAMPLE_ROWS}
+            """
+
+        if SAMPLE_TABLESAMPLE_MIN_BYTES > 0:
+            size = self._table_size_bytes(catalog, schema, table)
+            if size is not None and size >= SAMPLE_TABLESAMPLE_MIN_BYTES:
+                try:
+                    rows = self.execute_sql(query(f" TABLESAMPLE ({SAMPLE_TABLESAMPLE_PERCENT:g} PERCENT)"))
+                    if rows:
+                        return rows
+                    print(f"TABLESAMPLE of {catalog}.{schema}.{table} returned no rows, sampling without it")
+                except Exception as e:
+                    # Some sources (materialized views, non-Delta formats) reject TABLESAMPLE
+                    print(f"TABLESAMPLE of {catalog}.{schema}.{table} failed, sampling without it: {e}")
+
+        return self.execute_sql(query())
+
+    def _table_size_bytes(self, catalog: str, schema: str, table: str) -> Optional[int]:
+        """Table size from DESCRIBE DETAIL (Delta tables only, None otherwise)"""
+        try:
+            rows = self.execute_sql(f"DESCRIBE DETAIL {catalog}.{schema}.{table}")
+            return int(rows[0]['sizeInBytes']) if rows and rows[0].get('sizeInBytes') is not None else None
+        except Exception as e:
+            print(f"Cannot read size of {catalog}.{schema}.{table}: {e}")
+            return None
+
+    def prefetch_columns(self, catalog: str, schema: Optional[str] = None,
+                         tables: Optional[List[Tuple[str, str]]] = None) -> Dict[Tuple[str, str], List[Dict]]:
+        """Load columns for every table of a schema (or catalog) with one query
+
+        Args:
+            tables: Optional (schema, table) pairs to restrict the result to; a
+                table with the same name in another schema is left out
+
+        Returns:
+            Dict mapping (schema, table) to that table's columns in ordinal order
+        """
+        self._validate_identifier(catalog, "catalog")
+        filters = ""
+        if schema:
+            self._validate_identifier(schema, "schema")
+            filters += f"\n          AND table_schema = '{schema}'"
+        wanted = None
+        if tables:
+            wanted = set(tables)
+            for table_schema, table in wanted:
+                self._validate_identifier(table_schema, "schema")
+                self._validate_identifier(table, "table")
+            if not schema:
+                schemas = ", ".join(f"'{self._escape_sql_string(s)}'" for s in sorted({s for s, _ in wanted}))
+                filters += f"\n          AND table_schema IN ({schemas})"
+            names = ", ".join(f"'{self._escape_sql_string(t)}'" for t in sorted({t for _, t in wanted}))
+            filters += f"\n          AND table_name IN ({names})"
+
+        query = f"""
+        SELECT table_schema, table_name, column_name, data_type, comment
+        FROM system.information_schema.columns
+        WHERE table_catalog = '{catalog}'{filters}
+        ORDER BY table_schema, table_name, ordinal_position
+        """
+
+        columns_by_table: Dict[Tuple[str, str], List[Dict]] = {}
+        for row in self.execute_sql(query):
+            key = (row['table_schema'], row['table_name'])
+            if wanted is not None and key not in wanted:
+                continue
+            columns_by_table.setdefault(key, []).append({
+                'column_name': row['column_name'],
+                'data_type': row['data_type'],
+                'comment': row['comment']
+            })
+
+        print(f"Prefetched columns for {len(columns_by_table)} tables in {catalog}" + (f".{schema}" if schema else ""))
+        return columns_by_table
+
+    def call_ai_function(self, prompt: str, use_cache: bool = True) -> str:
+        """Call Databricks SQL AI Function - works with Service Principal auth
+
+        Set use_cache=False to bypass the response cache and force a fresh answer,
+        which then replaces the cached one.
+        """
+        return self.call_ai_function_batch({'prompt': prompt}, use_cache=use_cache, single=True)['prompt']
+
+    def call_ai_function_batch(self, prompts: Dict[str, str], use_cache: bool = True,
+                               single: bool = False) -> Dict[str, str]:
+        """Call ai_query over many prompts in a single SQL statement
+
+        Prompts are sent as rows of one inline relation keyed by the dict keys.
+        Per-row model failures come back as 'ERROR:' strings for that key only.
+        Cached responses are served without calling the model unless use_cache
+        is False. Successful responses are always cached, so a forced run
+        replaces the cached answers for its prompts.
+        """
+        if not prompts:
+            return {}
+
+        cached = {}
+        if use_cache and self.response_cache:
+            try:
+                cached = self.response_cache.get_many(MODEL_ENDPOINT, prompts)
+            except Exception as e:
+                print(f"LLM cache lookup failed: {e}")
+
+        missing = {key: prompt for key, prompt in prompts.items() if key not in cached}
+        if not missing:
+            return cached
+
+        # Throttled and transient failures are retried under the shared rate limits
+        if GENERATION_BACKEND == 'serving':
+            responses = self.rate_controller.run(missing, self._query_serving)
+        elif single:
+            responses = self.rate_controller.run(
+                missing, lambda batch: {key: self._query_model(prompt) for key, prompt in batch.items()}
+            )
+        else:
+            responses = self.rate_controller.run(missing, self._query_model_batch)
 
-    def call_ai_function(self, prompt: str) -> str:
-        """Call Databricks SQL AI Function - works with Service Principal auth"""
+        if self.response_cache:
+            try:
+                self.response_cache.put_many(
+                    MODEL_ENDPOINT,
+                    {key: response for key, response in responses.items() if not response.startswith('ERROR:')},
+                    missing
+                )
+            except Exception as e:
+                print(f"LLM cache update failed: {e}")
+
+        return {**responses, **cached}
+
+    @property
+    def serving_client(self) -> 'ServingClient':
+        """Direct model serving client (created on first use)"""
+        with self._serving_lock:
+            if self._serving_client is None:
+                host = self.w.config.host.rstrip('/')
+                url = MODEL_SERVING_URL or f"{host}/serving-endpoints/{MODEL_ENDPOINT}/invocations"
+                # Workspace credentials only go to the workspace, not to a stand-in URL
+                headers = self.w.config.authenticate if url.startswith(host + '/') else dict
+                self._serving_client = ServingClient(url, headers)
+                print(f"Model serving client using {url}")
+            return self._serving_client
+
+    def _query_serving(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        """Send prompts to the serving endpoint, falling back to ai_query for hard failures
+
+        Throttled and transient failures are left for the rate controller to retry.
+        """
+        responses = self.serving_client.query_batch(prompts)
+        failed = {key: prompts[key] for key, response in responses.items()
+                  if response.startswith('ERROR:') and self.rate_controller.classify(response) is None}
+        if failed:
+            print(f"Serving endpoint failed for {len(failed)} prompts, falling back to ai_query")
+            responses.update(self._query_model_batch(failed))
+        return responses
+
+    def _query_model(self, prompt: str) -> str:
+        """Send one prompt through ai_query"""
         try:
             # Escape single quotes in prompt
             escaped_prompt = self._escape_sql_string(prompt)
@@ -329,40 +1672,186 @@ class DescriptionService:
         except Exception as e:
             return f"ERROR: {str(e)}"
 
-    def generate_table_description(self, catalog: str, schema: str, table: str) -> str:
+    def _query_model_batch(self, prompts: Dict[str, str]) -> Dict[str, str]:
+        """Send many prompts through one ai_query statement"""
+        rows = ",\n".join(
+            f"('{self._escape_sql_string(key)}', '{self._escape_sql_string(prompt)}')"
+            for key, prompt in prompts.items()
+        )
+
+        # failOnError => false returns a struct so one bad row doesn't fail the statement
+        query = f"""
+        SELECT
+            prompt_key,
+            response.result as response,
+            response.errorMessage as error_message
+        FROM (
+            SELECT
+                prompt_key,
+                ai_query(
+                    '{MODEL_ENDPOINT}',
+                    prompt,
+                    failOnError => false
+                ) as response
+            FROM VALUES
+            {rows}
+            AS prompts(prompt_key, prompt)
+        )
+        """
+
+        try:
+            result = self.execute_sql(query)
+        except Exception as e:
+            return {key: f"ERROR: {str(e)}" for key in prompts}
+
+        responses = {}
+        for row in result:
+            key = row.get('prompt_key')
+            if key not in prompts:
+                continue
+            if row.get('error_message'):
+                responses[key] = f"ERROR: {row['error_message']}"
+            elif row.get('response'):
+                responses[key] = row['response'].strip()
+
+        for key in prompts:
+            if key not in responses:
+                responses[key] = "ERROR: No response from AI function"
+
+        return responses
+
+    def generate_table_description(self, catalog: str, schema: str, table: str,
+                                   metadata: Optional[Dict] = None, use_cache: bool = True) -> str:
         """Generate description for a table"""
-        metadata = self.get_table_metadata(catalog, schema, table)
+        if metadata is None:
+            metadata = self.get_table_metadata(catalog, schema, table)
+
+        prompt = self.prompt_builder.table_prompt(catalog, schema, table, metadata['columns'], metadata['sample_data'])
+        return self.call_ai_function(prompt, use_cache=use_cache)
 
-        columns_info = "\n".join([
-            f"  - {col['column_name']} ({col['data_type']})"
-            for col in metadata['columns'][:10]  # Limit to first 10 columns to avoid prompt size issues
-        ])
+    def _build_column_prompt(self, catalog: str, schema: str, table: str,
+                             column_name: str, column_type: str, sample_values: List = None) -> str:
+        """Build the generation prompt for a single column"""
+        return self.prompt_builder.column_prompt(catalog, schema, table, column_name, column_type, sample_values)
 
-        sample_info = ""
-        if metadata['sample_data']:
-            sample_info = f" Sample data shows {len(metadata['sample_data'])} rows."
+    def generate_column_descriptions(self, catalog: str, schema: str, table: str,
+                                     columns: List[Dict], sample_data: List[Dict] = None,
+                                     use_cache: bool = True) -> Dict[str, str]:
+        """Generate descriptions for many columns of a table in one ai_query statement
 
-        prompt = f"Generate a 1-2 sentence description for table {catalog}.{schema}.{table} with columns: {columns_info}.{sample_info} What data does this table contain and what is its purpose?"
+        Returns:
+            Dict mapping column name to description (or 'ERROR:' string)
+        """
+        prompts = {}
+        for col in columns:
+            sample_values = None
+            if sample_data:
+                sample_values = [row.get(col['column_name']) for row in sample_data]
+            prompts[col['column_name']] = self._build_column_prompt(
+                catalog, schema, table, col['column_name'], col['data_type'], sample_values
+            )
 
-        return self.call_ai_function(prompt)
+        return self.call_ai_function_batch(prompts, use_cache=use_cache)
 
-    def generate_column_description(self, catalog: str, schema: str, table: str,
-                                   column_name: str, column_type: str, sample_values: List = None) -> str:
-        """Generate description for a column"""
-        sample_info = ""
-        if sample_values:
-            values = [str(v) for v in sample_values if v is not None][:3]
-            if values:
-                sample_info = f" Sample values: {', '.join(values)}."
+    @staticmethod
+    def parse_combined_response(response: str, column_names: List[str],
+                                include_table: bool) -> Tuple[Optional[str], Dict[str, str]]:
+        """Extract the table and column descriptions from a combined response
+
+        Only non-empty strings for requested columns are kept (column names match
+        case-insensitively). A response that isn't valid JSON, such as one cut off
+        at the token limit, is scanned for complete "key": "value" pairs instead.
+
+        Returns:
+            (table description or None, column name -> description)
+        """
+        if not response or response.startswith('ERROR:'):
+            return None, {}
+
+        text = response.strip()
+        if text.startswith('```'):
+            text = re.sub(r'^```[a-zA-Z]*\s*|\s*```$', '', text)
+
+        table_desc, raw_columns = None, {}
+        try:
+            parsed = json.loads(text[text.index('{'):text.rindex('}') + 1])
+            if isinstance(parsed, dict):
+                table_desc = parsed.get('table')
+                if isinstance(parsed.get('columns'), dict):
+                    raw_columns = parsed['columns']
+        except ValueError:
+            for key, value in re.findall(r'"((?:[^"\\]|\\.)*)"\s*:\s*"((?:[^"\\]|\\.)*)"', text):
+                try:
+                    key, value = json.loads(f'"{key}"'), json.loads(f'"{value}"')
+                except ValueError:
+                    continue
+                if key == 'table':
+                    table_desc = value
+                else:
+                    raw_columns.setdefault(key, value)
+
+        by_name = {name.lower(): name for name in column_names}
+        descriptions = {}
+        for key, value in raw_columns.items():
+            name = by_name.get(str(key).lower())
+            if name and isinstance(value, str) and value.strip():
+                descriptions[name] = value.strip()
+
+        if not include_table or not isinstance(table_desc, str) or not table_desc.strip():
+            table_desc = None
+        else:
+            table_desc = table_desc.strip()
+
+        return table_desc, descriptions
 
-        prompt = f"Generate a 1-sentence description for column {column_name} ({column_type}) in table {catalog}.{schema}.{table}.{sample_info} What does this column represent?"
+    def generate_combined_descriptions(self, catalog: str, schema: str, table: str,
+                                       columns: List[Dict], metadata: Dict, include_table: bool = True,
+                                       use_cache: bool = True) -> Tuple[Optional[str], Dict[str, str]]:
+        """Generate the table and column descriptions with one prompt per column chunk
 
-        return self.call_ai_function(prompt)
+        Columns are split into chunks that fit the prompt token budget; the
+        table description is requested with the first chunk. Chunks are sent
+        in one batch, and anything missing from the parsed responses is retried
+        with the single-object prompts.
 
-    def store_generated_description(self, object_type: str, catalog: str, schema: str,
-                                   table: str, column: Optional[str], column_type: Optional[str],
-                                   description: str):
-        """Store generated description in governance table"""
+        Returns:
+            (table description or 'ERROR:' string, or None if not requested;
+             column name -> description or 'ERROR:' string)
+        """
+        chunks = self.prompt_builder.combined_prompts(
+            catalog, schema, table, columns, metadata['sample_data'], include_table, metadata['columns']
+        )
+        prompts = {f"chunk:{index}": prompt for index, (_, prompt) in enumerate(chunks)}
+        if len(chunks) > 1:
+            print(f"Split {len(columns)} columns of {catalog}.{schema}.{table} into {len(chunks)} prompts")
+        responses = self.call_ai_function_batch(prompts, use_cache=use_cache)
+
+        table_desc, col_descs = None, {}
+        for index, (chunk, _) in enumerate(chunks):
+            chunk_table, chunk_cols = self.parse_combined_response(
+                responses[f"chunk:{index}"], [col['column_name'] for col in chunk], include_table and index == 0
+            )
+            table_desc = table_desc or chunk_table
+            col_descs.update(chunk_cols)
+
+        missing = [col for col in columns if col['column_name'] not in col_descs]
+        if missing:
+            print(f"Combined response for {catalog}.{schema}.{table} missed {len(missing)} of {len(columns)} "
+                  f"columns, retrying them individually")
+            col_descs.update(self.generate_column_descriptions(
+                catalog, schema, table, missing, metadata['sample_data'], use_cache=use_cache
+            ))
+        if include_table and table_desc is None:
+            table_desc = self.generate_table_description(catalog, schema, table, metadata, use_cache=use_cache)
+
+        return table_desc, col_descs
+
+    def _governance_row_sql(self, object_type: str, catalog: str, schema: str,
+                            table: str, column: Optional[str], column_type: Optional[str],
+                            description: str, fingerprint: Optional[str] = None,
+                            model_used: Optional[str] = None,
+                            confidence: Optional[float] = None) -> Dict[str, str]:
+        """Validate inputs and build one governance row as column name -> SQL literal"""
         # Validate inputs
         self._validate_identifier(catalog, "catalog")
         self._validate_identifier(schema, "schema")
@@ -375,21 +1864,522 @@ class DescriptionService:
         column_type_val = f"'{self._escape_sql_string(column_type)}'" if column_type else "NULL"
         escaped_desc = self._escape_sql_string(description)
 
+        return {
+            'object_type': f"'{self._escape_sql_string(object_type)}'",
+            'catalog_name': f"'{self._escape_sql_string(catalog)}'",
+            'schema_name': f"'{self._escape_sql_string(schema)}'",
+            'table_name': f"'{self._escape_sql_string(table)}'",
+            'column_name': column_val,
+            'column_data_type': column_type_val,
+            'ai_generated_description': f"'{escaped_desc}'",
+            'review_status': "'PENDING'",
+            'generated_at': "current_timestamp()",
+            'model_used': f"'{self._escape_sql_string(model_used or MODEL_ENDPOINT)}'",
+            'schema_fingerprint': f"'{self._escape_sql_string(fingerprint)}'" if fingerprint else "NULL",
+            'confidence_score': f"{float(confidence):.4f}" if confidence is not None else "CAST(NULL AS DOUBLE)"
+        }
+
+    def _insert_governance_rows(self, rows: List[Dict[str, str]]):
+        """Insert rows built by _governance_row_sql into the governance table in one statement"""
+        if not rows:
+            return
+
+        columns = [c for c in rows[0]
+                   if c not in GOVERNANCE_MIGRATION_COLUMNS or self._governance_has_column(c)]
+        values = ",\n        ".join(
+            "(" + ", ".join(row[c] for c in columns) + ")" for row in rows
+        )
         insert_sql = f"""
         INSERT INTO {GOVERNANCE_TABLE}
-        (object_type, catalog_name, schema_name, table_name, column_name, column_data_type,
-         ai_generated_description, review_status, generated_at, model_used)
+        ({', '.join(columns)})
         VALUES
-        ('{self._escape_sql_string(object_type)}', '{self._escape_sql_string(catalog)}',
-         '{self._escape_sql_string(schema)}', '{self._escape_sql_string(table)}',
-         {column_val}, {column_type_val},
-         '{escaped_desc}', 'PENDING', current_timestamp(), '{self._escape_sql_string(MODEL_ENDPOINT)}')
+        {values}
         """
 
         self.execute_sql(insert_sql)
 
-    def get_pending_reviews(self, limit: int = 100, offset: int = 0) -> List[Dict]:
-        """Get descriptions pending review - ONLY returns items with PENDING status"""
+    def governance_writer(self, max_rows: int = GOVERNANCE_FLUSH_ROWS,
+                          max_age_seconds: float = GOVERNANCE_FLUSH_SECONDS,
+                          on_flush: Optional[Callable[[List[Dict]], None]] = None) -> 'GovernanceWriter':
+        """Create a buffered writer for generated descriptions"""
+        return GovernanceWriter(self, max_rows=max_rows, max_age_seconds=max_age_seconds, on_flush=on_flush)
+
+    @staticmethod
+    def normalize_column_name(name: str) -> str:
+        """Normalize a column name for clustering: CustomerID, customer-id and customer_id match"""
+        name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', name.strip())
+        return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+    @staticmethod
+    def is_generic_column_name(name: str) -> bool:
+        """Whether a column name is made only of generic words (id, status, created_at)"""
+        tokens = [token for token in DescriptionService.normalize_column_name(name).split('_') if token]
+        return all(token in COLUMN_DEDUP_GENERIC_TOKENS or token.isdigit() for token in tokens)
+
+    def can_share_description(self, column_name: str, tables: Iterable[str]) -> bool:
+        """Whether one description of a column fits it in every one of these tables
+
+        Specific names (customer_id, email) always can; generic names only when
+        every table name shares a word, so orders.id and customers.id never do.
+        """
+        if not self.is_generic_column_name(column_name):
+            return True
+        common = None
+        for table in tables:
+            tokens = set(SimilarityIndex.table_tokens(table))
+            common = tokens if common is None else common & tokens
+            if not common:
+                return False
+        return True
+
+    @staticmethod
+    def _normalized_name_sql(column: str) -> str:
+        """SQL expression matching normalize_column_name"""
+        return (f"trim(BOTH '_' FROM regexp_replace(lower(regexp_replace(trim({column}), "
+                f"'([a-z0-9])([A-Z])', '$1_$2')), '[^a-z0-9]+', '_'))")
+
+    def cluster_columns(self, columns_by_table: Dict[Tuple[str, str], List[Dict]],
+                        generation_state: Optional[Dict[Tuple[str, str], Dict]] = None,
+                        min_tables: int = COLUMN_DEDUP_MIN_TABLES) -> Dict[Tuple[str, str, int], List[Dict]]:
+        """Group a run's undocumented columns by normalized name and data type
+
+        Columns an incremental run would skip are left out. Generic names are
+        split further so every table in a cluster shares a word with the
+        others (can_share_description). Only clusters spanning at least
+        min_tables tables are returned.
+
+        Returns:
+            Dict mapping (normalized name, data type, part) to member columns,
+            each with schema, table, column_name and data_type
+        """
+        groups: Dict[Tuple[str, str], List[Dict]] = {}
+        for (schema, table), columns in columns_by_table.items():
+            known = generation_state.get((schema, table)) if generation_state is not None else None
+            for col in columns:
+                if col.get('comment'):
+                    continue
+                if known and (col['column_name'], col['data_type']) in known['columns']:
+                    continue
+                key = (self.normalize_column_name(col['column_name']), col['data_type'].strip().lower())
+                groups.setdefault(key, []).append({
+                    'schema': schema,
+                    'table': table,
+                    'column_name': col['column_name'],
+                    'data_type': col['data_type']
+                })
+
+        clusters: Dict[Tuple[str, str, int], List[Dict]] = {}
+        for (name, data_type), members in groups.items():
+            parts: List[List[Dict]] = []
+            for member in members:
+                for part in parts:
+                    if self.can_share_description(name, [m['table'] for m in part] + [member['table']]):
+                        part.append(member)
+                        break
+                else:
+                    parts.append([member])
+            for i, part in enumerate(parts):
+                if len({(m['schema'], m['table']) for m in part}) >= max(2, min_tables):
+                    clusters[(name, data_type, i)] = part
+        return clusters
+
+    def get_approved_column_descriptions(self, column_names: Iterable[str]) -> Dict[Tuple[str, str], List[Dict]]:
+        """Reviewed descriptions per (normalized name, data type), most recent first
+
+        Only APPROVED and APPLIED column rows are considered, matched on the
+        normalized column name so CustomerID finds customer_id.
+
+        Returns:
+            Dict mapping (normalized name, data type) to [{'table_name', 'description'}],
+            one entry per table
+        """
+        names = sorted({self.normalize_column_name(name) for name in column_names})
+        approved: Dict[Tuple[str, str], List[Dict]] = {}
+        seen = set()
+        for start in range(0, len(names), 1000):
+            chunk = names[start:start + 1000]
+            name_list = ", ".join(f"'{self._escape_sql_string(name)}'" for name in chunk)
+            query = f"""
+            SELECT
+                catalog_name,
+                schema_name,
+                table_name,
+                column_name,
+                column_data_type,
+                COALESCE(approved_description, ai_generated_description) as description
+            FROM {GOVERNANCE_TABLE}
+            WHERE object_type = 'COLUMN'
+                AND review_status IN ('APPROVED', 'APPLIED')
+                AND {self._normalized_name_sql('column_name')} IN ({name_list})
+            ORDER BY reviewed_at DESC
+            """
+            for row in self.execute_sql(query):
+                if not row.get('description') or not row.get('column_data_type'):
+                    continue
+                key = (self.normalize_column_name(row['column_name']), row['column_data_type'].strip().lower())
+                table_key = (key, row['catalog_name'], row['schema_name'], row['table_name'])
+                if table_key in seen:
+                    continue
+                seen.add(table_key)
+                approved.setdefault(key, []).append({'table_name': row['table_name'],
+                                                     'description': row['description']})
+        return approved
+
+    def _build_cluster_prompt(self, catalog: str, members: List[Dict]) -> str:
+        """Build the generation prompt for a column shared by many tables"""
+        first = members[0]
+        tables = sorted({f"{catalog}.{m['schema']}.{m['table']}" for m in members})
+        table_list = ", ".join(tables[:5])
+        if len(tables) > 5:
+            table_list += f" and {len(tables) - 5} more"
+        return (f"Generate a 1-sentence description for column {first['column_name']} ({first['data_type']}). "
+                f"The column appears in tables {table_list}. What does this column represent?")
+
+    def describe_shared_columns(self, catalog: str, columns_by_table: Dict[Tuple[str, str], List[Dict]],
+                                generation_state: Optional[Dict[Tuple[str, str], Dict]] = None,
+                                use_cache: bool = True) -> Dict[Tuple[str, str], Dict[str, Dict]]:
+        """Describe each cross-table column cluster once
+
+        Clusters reuse an approved description when one exists from a table
+        the whole cluster can share it with. Otherwise each member gets its
+        own similarity index suggestion if it has one, and the members left
+        are generated in one ai_query statement. Clusters whose generation
+        fails are left out so their columns are generated per table as usual.
+
+        Returns:
+            Dict mapping (schema, table) to {column_name: {'description', 'model_used'}}
+        """
+        clusters = self.cluster_columns(columns_by_table, generation_state)
+        if not clusters:
+            return {}
+
+        shared: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+
+        def assign(members: List[Dict], result: Dict):
+            for member in members:
+                shared.setdefault((member['schema'], member['table']), {})[member['column_name']] = result
+
+        try:
+            approved = self.get_approved_column_descriptions(
+                m['column_name'] for members in clusters.values() for m in members
+            )
+        except Exception as e:
+            print(f"Approved description lookup failed, generating every cluster: {e}")
+            approved = {}
+
+        reused = 0
+        pending: Dict[Tuple[str, str, int], List[Dict]] = {}
+        for key, members in clusters.items():
+            tables = [m['table'] for m in members]
+            match = next((candidate for candidate in approved.get(key[:2], [])
+                          if self.can_share_description(key[0], tables + [candidate['table_name']])), None)
+            if match:
+                assign(members, {'description': match['description'], 'model_used': APPROVED_REUSE_MODEL})
+                reused += 1
+                continue
+
+            # The index's table-overlap rule is checked for every member, not just the first
+            remaining = []
+            for member in members:
+                suggestion = self.suggest_description(member['column_name'], member['data_type'],
+                                                      member['table']) if use_cache else None
+                if suggestion:
+                    assign([member], {'description': suggestion[0], 'model_used': SIMILARITY_INDEX_MODEL,
+                                      'confidence': suggestion[1]})
+                else:
+                    remaining.append(member)
+            # A single table left is generated with the rest of that table
+            if len({(m['schema'], m['table']) for m in remaining}) >= 2:
+                pending[key] = remaining
+
+        to_generate = list(pending)
+        prompts = {str(i): self.prompt_builder.record('cluster', f"{catalog}.*.{pending[key][0]['column_name']}",
+                                                      self._build_cluster_prompt(catalog, pending[key]), 1)
+                   for i, key in enumerate(to_generate)}
+        responses = self.call_ai_function_batch(prompts, use_cache=use_cache)
+        for i, key in enumerate(to_generate):
+            description = responses.get(str(i), "ERROR: No response from AI function")
+            if description.startswith('ERROR:'):
+                print(f"Shared column {key[0]} ({key[1]}) generation failed: {description}")
+                continue
+            assign(pending[key], {'description': description, 'model_used': None})
+
+        print(f"Column dedup: {sum(len(m) for m in clusters.values())} columns in {len(clusters)} clusters, "
+              f"{reused} reused approved, {len(prompts)} generated")
+        return shared
+
+    def refresh_similarity_index(self, force: bool = False) -> int:
+        """Load column reviews since the index watermark
+
+        Approved and applied descriptions are added; a column whose latest
+        review is anything else (rejected, or sent back to pending) is dropped
+        so it stops being suggested. Refreshes at most every
+        SIMILARITY_REFRESH_SECONDS unless forced. Returns the number of rows loaded.
+        """
+        index = self.similarity_index
+        if index is None:
+            return 0
+
+        with index.refresh_lock:
+            if not force and time.monotonic() - index.refreshed_at < SIMILARITY_REFRESH_SECONDS:
+                return 0
+
+            # >= so rows sharing the watermark timestamp aren't missed; re-applying is harmless
+            since = ""
+            if index.watermark:
+                since = f"AND reviewed_at >= CAST('{self._escape_sql_string(index.watermark)}' AS TIMESTAMP)"
+            query = f"""
+            SELECT
+                catalog_name,
+                schema_name,
+                table_name,
+                column_name,
+                column_data_type,
+                review_status,
+                COALESCE(approved_description, ai_generated_description) as description,
+                reviewed_at
+            FROM {GOVERNANCE_TABLE}
+            WHERE object_type = 'COLUMN'
+                AND reviewed_at IS NOT NULL
+                {since}
+            ORDER BY reviewed_at, id
+            """
+            # Streamed: the first load reads every reviewed column. Later rows for a
+            # column replace earlier ones, so its latest review decides
+            loaded = 0
+            for row in self.iter_sql(query):
+                loaded += 1
+                if not row.get('column_name'):
+                    continue
+                key = f"{row['catalog_name']}.{row['schema_name']}.{row['table_name']}.{row['column_name']}"
+                if row.get('review_status') in ('APPROVED', 'APPLIED') and row.get('description'):
+                    index.add(key, row['column_name'], row.get('column_data_type') or '', row['table_name'],
+                              row['description'])
+                else:
+                    index.discard(key)
+                if row.get('reviewed_at'):
+                    index.watermark = str(row['reviewed_at'])
+            index.refreshed_at = time.monotonic()
+
+        if loaded:
+            print(f"Similarity index loaded {loaded} reviewed descriptions ({len(index)} indexed)")
+        return loaded
+
+    def suggest_description(self, column_name: str, data_type: str,
+                            table: str) -> Optional[Tuple[str, float]]:
+        """Reviewed description of the most similar column, if similar enough
+
+        Returns:
+            (description, similarity) or None
+        """
+        if self.similarity_index is None:
+            return None
+        try:
+            self.refresh_similarity_index()
+        except Exception as e:
+            # Keep serving from whatever is already loaded
+            print(f"Similarity index refresh failed: {e}")
+
+        match = self.similarity_index.search(column_name, data_type, table)
+        if match and match[1] >= SIMILARITY_THRESHOLD:
+            return match
+        return None
+
+    def table_fingerprint(self, columns: List[Dict]) -> str:
+        """Fingerprint of a table's column names and types in ordinal order"""
+        signature = "\n".join(f"{col['column_name']}:{col['data_type']}" for col in columns)
+        return hashlib.sha256(signature.encode('utf-8')).hexdigest()
+
+    def get_generation_state(self, catalog: str, schema: Optional[str],
+                             tables: List[str]) -> Dict[Tuple[str, str], Dict]:
+        """Load what the governance table already holds for a run's tables, in one query
+
+        Rejected rows are ignored so their objects are generated again.
+
+        Returns:
+            Dict mapping (schema, table) to {'fingerprints': set of table
+            fingerprints, 'columns': set of (column_name, column_data_type)}
+        """
+        if not self._governance_has_column('schema_fingerprint'):
+            raise ValueError(f"Incremental generation needs the schema_fingerprint column in "
+                             f"{GOVERNANCE_TABLE}; run setup (POST /api/setup) to add it")
+
+        self._validate_identifier(catalog, "catalog")
+        filters = ""
+        if schema:
+            self._validate_identifier(schema, "schema")
+            filters += f"\n          AND schema_name = '{schema}'"
+        for table in tables:
+            self._validate_identifier(table, "table")
+        names = ", ".join(f"'{self._escape_sql_string(table)}'" for table in sorted(set(tables)))
+
+        query = f"""
+        SELECT DISTINCT schema_name, table_name, object_type, column_name, column_data_type, schema_fingerprint
+        FROM {GOVERNANCE_TABLE}
+        WHERE catalog_name = '{catalog}'{filters}
+          AND table_name IN ({names})
+          AND review_status != 'REJECTED'
+        """
+
+        state: Dict[Tuple[str, str], Dict] = {}
+        for row in self.iter_sql(query):
+            entry = state.setdefault((row['schema_name'], row['table_name']), {'fingerprints': set(), 'columns': set()})
+            if row['object_type'] == 'TABLE':
+                if row['schema_fingerprint']:
+                    entry['fingerprints'].add(row['schema_fingerprint'])
+            else:
+                entry['columns'].add((row['column_name'], row['column_data_type']))
+
+        return state
+
+    def generate_for_table(self, catalog: str, schema: str, table: str,
+                           columns: Optional[List[Dict]] = None,
+                           known: Optional[Dict] = None, use_cache: bool = True,
+                           shared: Optional[Dict[str, Dict]] = None,
+                           on_stored: Optional[Callable[[List[Dict]], None]] = None,
+                           combined: bool = COMBINED_GENERATION_ENABLED) -> Dict:
+        """Generate and store table and column descriptions for one table
+
+        All rows for the table are written with one multi-row INSERT, which is
+        flushed even if generation fails partway. Pass columns from
+        prefetch_columns to avoid a per-table information_schema query.
+
+        Args:
+            known: This table's entry from get_generation_state for incremental
+                runs; the table description is skipped if its fingerprint is
+                unchanged and columns already recorded with the same type are
+                skipped. None generates everything.
+            use_cache: False forces fresh model responses instead of cached ones
+                or similarity index suggestions.
+            shared: Column name -> {'description', 'model_used'} already resolved
+                by describe_shared_columns; these columns are not sent to the model.
+            on_stored: Called with summaries of descriptions once they are written.
+            combined: Ask for the table and column descriptions together as JSON,
+                one prompt per column chunk, instead of one prompt per object.
+
+        Returns:
+            Dict with generated/error/skipped counts and result items for the table
+        """
+        with self.governance_writer(on_flush=on_stored) as writer:
+            return self._generate_for_table(catalog, schema, table, writer, columns, known, use_cache, shared,
+                                            combined)
+
+    def _generate_for_table(self, catalog: str, schema: str, table: str, writer: 'GovernanceWriter',
+                            columns: Optional[List[Dict]] = None, known: Optional[Dict] = None,
+                            use_cache: bool = True, shared: Optional[Dict[str, Dict]] = None,
+                            combined: bool = COMBINED_GENERATION_ENABLED) -> Dict:
+        results = {'generated': 0, 'errors': 0, 'skipped': 0, 'items': []}
+        path = f"{catalog}.{schema}.{table}"
+        metadata = self.get_table_metadata(catalog, schema, table, columns=columns, sample=False)
+        fingerprint = self.table_fingerprint(metadata['columns'])
+
+        describe_table = True
+        if known is not None and fingerprint in known['fingerprints']:
+            print(f"Skipping table description for {path}: schema unchanged")
+            results['skipped'] += 1
+            describe_table = False
+
+        # Columns still needing a description after skips, sharing and suggestions
+        columns_to_describe = [col for col in metadata['columns'] if not col.get('comment')]
+        if known is not None:
+            unchanged = [col for col in columns_to_describe
+                         if (col['column_name'], col['data_type']) in known['columns']]
+            results['skipped'] += len(unchanged)
+            columns_to_describe = [col for col in columns_to_describe if col not in unchanged]
+
+        # Columns described once for the whole run
+        if shared:
+            for col in columns_to_describe:
+                if col['column_name'] in shared:
+                    result = shared[col['column_name']]
+                    writer.add('COLUMN', catalog, schema, table, col['column_name'], col['data_type'],
+                               result['description'], fingerprint=fingerprint, model_used=result['model_used'],
+                               confidence=result.get('confidence'))
+                    results['generated'] += 1
+            columns_to_describe = [col for col in columns_to_describe if col['column_name'] not in shared]
+
+        # Close matches to reviewed descriptions are suggested without a model call
+        if use_cache and self.similarity_index is not None:
+            suggested = set()
+            for col in columns_to_describe:
+                suggestion = self.suggest_description(col['column_name'], col['data_type'], table)
+                if suggestion:
+                    writer.add('COLUMN', catalog, schema, table, col['column_name'], col['data_type'],
+                               suggestion[0], fingerprint=fingerprint, model_used=SIMILARITY_INDEX_MODEL,
+                               confidence=suggestion[1])
+                    results['generated'] += 1
+                    suggested.add(col['column_name'])
+            columns_to_describe = [col for col in columns_to_describe if col['column_name'] not in suggested]
+
+        # Sample only the columns left for the model (all of them for a table-only prompt)
+        sample_columns = columns_to_describe or (metadata['columns'] if describe_table else [])
+        metadata['sample_data'] = self.get_sample_data(catalog, schema, table, sample_columns)
+
+        table_desc = None
+        if combined and columns_to_describe:
+            print(f"Generating combined descriptions for {path} ({len(columns_to_describe)} columns)")
+            table_desc, col_descs = self.generate_combined_descriptions(
+                catalog, schema, table, columns_to_describe, metadata, include_table=describe_table,
+                use_cache=use_cache
+            )
+        else:
+            if describe_table:
+                print(f"Generating description for {path}")
+                table_desc = self.generate_table_description(catalog, schema, table, metadata, use_cache=use_cache)
+            # One ai_query statement for all of the table's columns
+            col_descs = self.generate_column_descriptions(
+                catalog, schema, table, columns_to_describe, metadata['sample_data'], use_cache=use_cache
+            )
+
+        if table_desc is not None:
+            print(f"Table description result: {table_desc[:100]}...")
+            if not table_desc.startswith('ERROR:'):
+                writer.add('TABLE', catalog, schema, table, None, None, table_desc, fingerprint=fingerprint)
+                results['generated'] += 1
+                results['items'].append({
+                    'type': 'TABLE',
+                    'path': path,
+                    'description': table_desc[:100] + '...'
+                })
+            else:
+                results['errors'] += 1
+                results['items'].append({
+                    'type': 'TABLE',
+                    'path': path,
+                    'error': table_desc
+                })
+                print(f"Table description failed: {table_desc}")
+
+        for col in columns_to_describe:
+            col_desc = col_descs[col['column_name']]
+            if not col_desc.startswith('ERROR:'):
+                writer.add('COLUMN', catalog, schema, table, col['column_name'], col['data_type'], col_desc,
+                           fingerprint=fingerprint)
+                results['generated'] += 1
+            else:
+                results['errors'] += 1
+                print(f"Column {col['column_name']} generation failed: {col_desc}")
+
+        return results
+
+    def get_pending_reviews(self, limit: int = 100, offset: int = 0, cursor: Optional[str] = None,
+                            catalog: Optional[str] = None, schema: Optional[str] = None,
+                            table: Optional[str] = None, object_type: Optional[str] = None) -> List[Dict]:
+        """Get descriptions pending review - ONLY returns items with PENDING status
+
+        Rows are ordered newest first by (generated_at, id). Pass the
+        next_cursor of the previous page as cursor to page by keyset;
+        offset is only used without a cursor.
+        """
+        conditions = ["review_status = 'PENDING'"] + self._pending_filters(catalog, schema, table, object_type)
+        if cursor:
+            generated_micros, record_id = self._decode_cursor(cursor)
+            conditions.append(
+                f"(generated_at < timestamp_micros({generated_micros}) "
+                f"OR (generated_at = timestamp_micros({generated_micros}) AND id < {record_id}))"
+            )
+            offset = 0
+
         query = f"""
         SELECT
             id,
@@ -407,70 +2397,309 @@ class DescriptionService:
             reviewer,
             generated_at,
             reviewed_at,
-            model_used
+            model_used,
+            CAST(unix_micros(generated_at) AS BIGINT) as cursor_micros
         FROM {GOVERNANCE_TABLE}
-        WHERE review_status = 'PENDING'
-        ORDER BY generated_at DESC
-        LIMIT {limit} OFFSET {offset}
+        WHERE {' AND '.join(conditions)}
+        ORDER BY generated_at DESC, id DESC
+        LIMIT {int(limit)} OFFSET {int(offset)}
+        """
+
+        rows = self.execute_sql(query)
+        # Reviews of these rows adjust the dashboard in place instead of recounting
+        for row in rows:
+            self._review_rows.set(row['id'], {'schema_name': row['schema_name'], 'object_type': row['object_type'],
+                                              'review_status': row['review_status'], 'reviewer': row['reviewer']})
+        return rows
+
+    def _pending_filters(self, catalog: Optional[str], schema: Optional[str],
+                         table: Optional[str], object_type: Optional[str]) -> List[str]:
+        """Validated WHERE conditions for the review queue filters"""
+        conditions = []
+        for value, column, name in ((catalog, 'catalog_name', 'catalog'),
+                                    (schema, 'schema_name', 'schema'),
+                                    (table, 'table_name', 'table')):
+            if value:
+                self._validate_identifier(value, name)
+                conditions.append(f"{column} = '{self._escape_sql_string(value)}'")
+        if object_type:
+            if object_type not in ('TABLE', 'COLUMN'):
+                raise ValueError(f"Invalid object_type: {object_type}")
+            conditions.append(f"object_type = '{object_type}'")
+        return conditions
+
+    @staticmethod
+    def encode_cursor(row: Dict) -> str:
+        """Keyset cursor pointing just past a review queue row"""
+        return f"{row['cursor_micros']}.{row['id']}"
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[int, int]:
+        try:
+            generated_micros, record_id = cursor.split('.')
+            return int(generated_micros), int(record_id)
+        except (ValueError, AttributeError):
+            raise ValueError(f"Invalid cursor: {cursor}")
+
+    def estimate_pending(self, catalog: Optional[str] = None, schema: Optional[str] = None,
+                         table: Optional[str] = None, object_type: Optional[str] = None) -> int:
+        """Approximate number of pending reviews matching the filters
+
+        Unfiltered and schema-only counts come from the dashboard snapshot;
+        other filters run a COUNT that is cached for DASHBOARD_TTL_SECONDS.
         """
+        if not (catalog or table or object_type):
+            dashboard = self.get_dashboard()
+            if not schema:
+                return dashboard['stats']['pending']
+            # The snapshot groups by schema name across catalogs
+            return next((row['pending'] for row in dashboard['schema_progress']
+                         if row['schema_name'] == schema), 0)
+
+        conditions = ["review_status = 'PENDING'"] + self._pending_filters(catalog, schema, table, object_type)
+
+        def load() -> int:
+            query = f"""
+            SELECT COUNT(*) as pending
+            FROM {GOVERNANCE_TABLE}
+            WHERE {' AND '.join(conditions)}
+            """
+            return self.execute_sql_columns(query)['pending'][0]
+
+        return self._count_cache.get_or_load(('pending', catalog, schema, table, object_type), load)
+
+    def export_governance_records(self, statuses: Optional[List[str]] = None, catalog: Optional[str] = None,
+                                  schema: Optional[str] = None, since: Optional[str] = None,
+                                  until: Optional[str] = None,
+                                  time_column: str = 'generated_at') -> Tuple[List[str], Iterator[Dict]]:
+        """Run a governance table export and stream its rows
+
+        The statement runs before this returns, so bad filters and query
+        errors surface here; rows are then fetched one result chunk at a time.
+        since/until are ISO timestamps bounding time_column (inclusive/exclusive).
 
-        return self.execute_sql(query)
+        Returns:
+            (column names, iterator of row dicts ordered by id)
+        """
+        if time_column not in ('generated_at', 'reviewed_at', 'applied_at'):
+            raise ValueError(f"Invalid time_column: {time_column}")
+
+        conditions = []
+        if statuses:
+            for status in statuses:
+                if status not in ('PENDING', 'APPROVED', 'REJECTED', 'APPLIED'):
+                    raise ValueError(f"Invalid status: {status}")
+            status_list = ", ".join(f"'{status}'" for status in statuses)
+            conditions.append(f"review_status IN ({status_list})")
+        conditions += self._pending_filters(catalog, schema, None, None)
+        for value, op in ((since, '>='), (until, '<')):
+            if value:
+                try:
+                    moment = datetime.fromisoformat(value.replace('Z', '+00:00'))
+                except ValueError:
+                    raise ValueError(f"Invalid timestamp: {value}")
+                conditions.append(f"{time_column} {op} CAST('{moment.isoformat()}' AS TIMESTAMP)")
 
-    def get_statistics(self) -> Dict:
-        """Get overall statistics"""
+        columns = GOVERNANCE_EXPORT_COLUMNS + [c for c in GOVERNANCE_MIGRATION_COLUMNS
+                                               if self._governance_has_column(c)]
         query = f"""
-        SELECT
-            CAST(COUNT(*) AS BIGINT) as total,
-            CAST(COALESCE(SUM(CASE WHEN review_status = 'PENDING' THEN 1 ELSE 0 END), 0) AS BIGINT) as pending,
-            CAST(COALESCE(SUM(CASE WHEN review_status = 'APPROVED' THEN 1 ELSE 0 END), 0) AS BIGINT) as approved,
-            CAST(COALESCE(SUM(CASE WHEN review_status = 'REJECTED' THEN 1 ELSE 0 END), 0) AS BIGINT) as rejected,
-            CAST(COALESCE(SUM(CASE WHEN review_status = 'APPLIED' THEN 1 ELSE 0 END), 0) AS BIGINT) as applied,
-            CAST(COALESCE(SUM(CASE WHEN object_type = 'TABLE' THEN 1 ELSE 0 END), 0) AS BIGINT) as tables,
-            CAST(COALESCE(SUM(CASE WHEN object_type = 'COLUMN' THEN 1 ELSE 0 END), 0) AS BIGINT) as columns
+        SELECT {', '.join(columns)}
         FROM {GOVERNANCE_TABLE}
+        {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+        ORDER BY id
         """
 
-        results = self.execute_sql(query)
-        stats = results[0] if results else {}
-
-        # Convert all numeric values to int for JSON serialization
-        if stats:
-            for key in ['total', 'pending', 'approved', 'rejected', 'applied', 'tables', 'columns']:
-                if key in stats and stats[key] is not None:
-                    try:
-                        stats[key] = int(stats[key])
-                    except (ValueError, TypeError):
-                        stats[key] = 0
-                else:
-                    stats[key] = 0
+        statement = self._run_statement(query, WAREHOUSE_ID, SQL_TIMEOUT_SECONDS, Disposition.EXTERNAL_LINKS)
+        return columns, self._iter_statement_rows(statement)
 
-        print(f"DEBUG: Statistics: {stats}")
-        return stats
+    def get_statistics(self) -> Dict:
+        """Get overall statistics"""
+        return self.get_dashboard()['stats']
 
     def get_schema_progress(self) -> List[Dict]:
         """Get progress by schema"""
+        return self.get_dashboard()['schema_progress']
+
+    def get_review_activity(self) -> List[Dict]:
+        """Get review counts per reviewer and status"""
+        return self.get_dashboard()['activity']
+
+    def get_dashboard(self, refresh: bool = False) -> Dict:
+        """Statistics, schema progress and review activity from one snapshot
+
+        The snapshot is computed with a single aggregation over the governance
+        table, reused for DASHBOARD_TTL_SECONDS and kept current in between by
+        this app's own generate, review and apply writes. The aggregation runs
+        outside the snapshot lock so those writes never wait on it.
+        """
+        if not refresh:
+            with self._dashboard_lock:
+                snapshot = self._dashboard
+                if snapshot is not None and snapshot['expires'] >= time.monotonic():
+                    return self._render_dashboard(snapshot)
+
+        # One load at a time; readers queued behind it reuse its result
+        with self._dashboard_load_lock:
+            if not refresh:
+                with self._dashboard_lock:
+                    snapshot = self._dashboard
+                    if snapshot is not None and snapshot['expires'] >= time.monotonic():
+                        return self._render_dashboard(snapshot)
+            snapshot = self._load_dashboard()
+            with self._dashboard_lock:
+                self._dashboard = snapshot
+                return self._render_dashboard(snapshot)
+
+    def invalidate_dashboard(self):
+        """Recompute the dashboard on next read"""
+        with self._dashboard_lock:
+            self._dashboard = None
+
+    def _load_dashboard(self) -> Dict:
         query = f"""
         SELECT
+            CASE
+                WHEN GROUPING(schema_name) = 0 THEN 'schema'
+                WHEN GROUPING(reviewer) = 0 THEN 'activity'
+                ELSE 'overall'
+            END as grouping_set,
             schema_name,
+            reviewer,
+            review_status,
             COUNT(*) as total,
-            SUM(CASE WHEN review_status = 'APPLIED' THEN 1 ELSE 0 END) as completed,
-            SUM(CASE WHEN review_status = 'PENDING' THEN 1 ELSE 0 END) as pending,
-            ROUND(100.0 * SUM(CASE WHEN review_status = 'APPLIED' THEN 1 ELSE 0 END) / COUNT(*), 2) as pct_complete
+            COALESCE(SUM(CASE WHEN review_status = 'PENDING' THEN 1 ELSE 0 END), 0) as pending,
+            COALESCE(SUM(CASE WHEN review_status = 'APPROVED' THEN 1 ELSE 0 END), 0) as approved,
+            COALESCE(SUM(CASE WHEN review_status = 'REJECTED' THEN 1 ELSE 0 END), 0) as rejected,
+            COALESCE(SUM(CASE WHEN review_status = 'APPLIED' THEN 1 ELSE 0 END), 0) as applied,
+            COALESCE(SUM(CASE WHEN object_type = 'TABLE' THEN 1 ELSE 0 END), 0) as tables,
+            COALESCE(SUM(CASE WHEN object_type = 'COLUMN' THEN 1 ELSE 0 END), 0) as columns,
+            MIN(reviewed_at) as first_review,
+            MAX(reviewed_at) as last_review
         FROM {GOVERNANCE_TABLE}
-        GROUP BY schema_name
-        ORDER BY pct_complete DESC, schema_name
+        GROUP BY GROUPING SETS ((), (schema_name), (reviewer, review_status))
         """
 
-        return self.execute_sql(query)
+        overall = dict.fromkeys(('total', 'pending', 'approved', 'rejected', 'applied', 'tables', 'columns'), 0)
+        schemas: Dict[Optional[str], Dict[str, int]] = {}
+        activity: Dict[Tuple[str, str], Dict] = {}
+        for row in self.execute_sql(query):
+            if row['grouping_set'] == 'overall':
+                overall = {key: row[key] for key in overall}
+            elif row['grouping_set'] == 'schema':
+                schemas[row['schema_name']] = {
+                    'total': row['total'],
+                    'completed': row['applied'],
+                    'pending': row['pending']
+                }
+            elif row['reviewer'] is not None:
+                activity[(row['reviewer'], row['review_status'])] = {
+                    'count': row['total'],
+                    'first_review': row['first_review'],
+                    'last_review': row['last_review']
+                }
+
+        print(f"Dashboard snapshot: {overall}")
+        return {
+            'overall': overall,
+            'schemas': schemas,
+            'activity': activity,
+            'computed_at': datetime.utcnow().isoformat() + 'Z',
+            'expires': time.monotonic() + DASHBOARD_TTL_SECONDS
+        }
+
+    def _render_dashboard(self, snapshot: Dict) -> Dict:
+        schema_progress = [{
+            'schema_name': schema_name,
+            'total': counts['total'],
+            'completed': counts['completed'],
+            'pending': counts['pending'],
+            'pct_complete': round(100.0 * counts['completed'] / counts['total'], 2) if counts['total'] else 0.0
+        } for schema_name, counts in snapshot['schemas'].items() if counts['total'] > 0]
+        schema_progress.sort(key=lambda row: (-row['pct_complete'], row['schema_name'] or ''))
+
+        activity = [dict(reviewer=reviewer, review_status=status, **entry)
+                    for (reviewer, status), entry in sorted(snapshot['activity'].items(),
+                                                            key=lambda item: (item[0][0], item[0][1] or ''))
+                    if entry['count'] > 0]
+
+        return {
+            'stats': dict(snapshot['overall']),
+            'schema_progress': schema_progress,
+            'activity': activity,
+            'computed_at': snapshot['computed_at']
+        }
+
+    def _update_dashboard(self, changes: Iterable[Tuple[Optional[Dict], Optional[Dict]]]):
+        """Apply row changes to the dashboard snapshot, if a live one is loaded
+
+        Each change is (before, after): the governance row's schema_name,
+        object_type, review_status and reviewer before and after the write,
+        with None for a row that didn't exist. Rows without a schema_name key
+        leave the per-schema counts alone. An expired snapshot is dropped
+        rather than adjusted.
+        """
+        now = datetime.utcnow().isoformat() + 'Z'
+        with self._dashboard_lock:
+            snapshot = self._dashboard
+            if snapshot is None:
+                return
+            if snapshot['expires'] < time.monotonic():
+                self._dashboard = None
+                return
+            for before, after in changes:
+                for row, delta in ((before, -1), (after, 1)):
+                    if row is None:
+                        continue
+                    status = row.get('review_status')
+                    overall = snapshot['overall']
+                    overall['total'] += delta
+                    if status and status.lower() in overall:
+                        overall[status.lower()] += delta
+                    object_key = {'TABLE': 'tables', 'COLUMN': 'columns'}.get(row.get('object_type'))
+                    if object_key:
+                        overall[object_key] += delta
+
+                    if 'schema_name' in row:
+                        counts = snapshot['schemas'].setdefault(row['schema_name'],
+                                                                {'total': 0, 'completed': 0, 'pending': 0})
+                        counts['total'] += delta
+                        if status == 'APPLIED':
+                            counts['completed'] += delta
+                        elif status == 'PENDING':
+                            counts['pending'] += delta
+
+                    if row.get('reviewer') is not None:
+                        entry = snapshot['activity'].setdefault((row['reviewer'], status), {
+                            'count': 0, 'first_review': None, 'last_review': None
+                        })
+                        entry['count'] += delta
+                        if delta > 0 and row.get('reviewed_now'):
+                            entry['first_review'] = entry['first_review'] or now
+                            entry['last_review'] = now
+
+    def _apply_review_changes(self, reviews: Dict[int, Tuple[str, str]]):
+        """Move reviewed rows between statuses in the dashboard snapshot
+
+        Rows served by get_pending_reviews are remembered with their schema and
+        status, so reviews from the queue are applied in place. A review of a
+        row the app hasn't served can't be placed in a schema and makes the
+        next read recompute the snapshot instead.
+        """
+        changes = []
+        for record_id, (status, reviewer) in reviews.items():
+            before = self._review_rows.get(record_id)
+            if before is None:
+                self.invalidate_dashboard()
+                return
+            after = dict(before, review_status=status, reviewer=reviewer)
+            self._review_rows.set(record_id, after)
+            changes.append((before, dict(after, reviewed_now=True)))
+        self._update_dashboard(changes)
 
     def update_review_status(self, record_id: int, status: str,
                             approved_desc: Optional[str], reviewer: str):
         """Update review status"""
-        # Validate inputs
-        if not isinstance(record_id, int) or record_id <= 0:
-            raise ValueError("Invalid record_id")
-        if status not in ('PENDING', 'APPROVED', 'REJECTED', 'APPLIED'):
-            raise ValueError(f"Invalid status: {status}")
+        self._validate_review(record_id, status)
 
         if approved_desc:
             escaped_desc = self._escape_sql_string(approved_desc)
@@ -495,30 +2724,110 @@ class DescriptionService:
             """
 
         self.execute_sql(update_sql)
+        if self.similarity_index is not None:
+            self.similarity_index.mark_stale()
+        self._apply_review_changes({record_id: (status, reviewer)})
+
+    def _validate_review(self, record_id: int, status: str):
+        """Validate a review update"""
+        if not isinstance(record_id, int) or isinstance(record_id, bool) or record_id <= 0:
+            raise ValueError("Invalid record_id")
+        if status not in ('PENDING', 'APPROVED', 'REJECTED', 'APPLIED'):
+            raise ValueError(f"Invalid status: {status}")
+
+    def update_review_statuses(self, reviews: List[Dict]) -> Dict:
+        """Update review status for many records with a single MERGE statement
+
+        Each review is validated individually; invalid reviews are reported as
+        errors and the rest are applied together, keyed on id.
+
+        Returns:
+            Dict with per-id 'results' and 'errors' lists
+        """
+        rows = {}
+        reviewed = {}  # id -> (status, reviewer) for the dashboard snapshot
+        errors = []
+
+        for review in reviews:
+            try:
+                record_id = review['id']
+                status = review['status']
+                approved_desc = review.get('approved_description')
+                reviewer = review.get('reviewer', 'unknown')
+                self._validate_review(record_id, status)
+
+                # Empty description means "approve as generated", same as update_review_status
+                desc_val = f"'{self._escape_sql_string(approved_desc)}'" if approved_desc else "CAST(NULL AS STRING)"
+                if record_id in rows:
+                    # MERGE rejects several source rows for one target row; the last review wins
+                    errors.append({'id': record_id, 'error': 'Superseded by a later review for the same id'})
+                    del rows[record_id]
+                rows[record_id] = (f"({record_id}, '{self._escape_sql_string(status)}', {desc_val}, "
+                                   f"'{self._escape_sql_string(reviewer)}')")
+                reviewed[record_id] = (status, reviewer)
+            except Exception as e:
+                errors.append({'id': review.get('id') if isinstance(review, dict) else None, 'error': str(e)})
+
+        if not rows:
+            return {'results': [], 'errors': errors}
+
+        values = ",\n            ".join(rows.values())
+        merge_sql = f"""
+        MERGE INTO {GOVERNANCE_TABLE} AS target
+        USING (
+            SELECT * FROM VALUES
+            {values}
+            AS updates(id, review_status, approved_description, reviewer)
+        ) AS source
+        ON target.id = source.id
+        WHEN MATCHED THEN UPDATE SET
+            review_status = source.review_status,
+            approved_description = COALESCE(source.approved_description, target.ai_generated_description),
+            reviewer = source.reviewer,
+            reviewed_at = current_timestamp()
+        """
+
+        try:
+            self.execute_sql(merge_sql)
+        except Exception as e:
+            errors.extend({'id': record_id, 'error': str(e)} for record_id in rows)
+            return {'results': [], 'errors': errors}
+
+        print(f"Bulk review updated {len(rows)} records")
+        if self.similarity_index is not None:
+            self.similarity_index.mark_stale()
+        self._apply_review_changes({record_id: reviewed[record_id] for record_id in rows})
+        return {
+            'results': [{'id': record_id, 'success': True} for record_id in rows],
+            'errors': errors
+        }
 
     def apply_approved_descriptions(self) -> Dict:
-        """Apply approved descriptions to UC"""
+        """Apply approved descriptions to UC
+
+        Descriptions are grouped by table: each table gets at most one
+        COMMENT ON TABLE and one multi-column ALTER COLUMN statement, tables
+        are applied concurrently, and applied records are marked APPLIED with
+        one UPDATE per batch of ids.
+        """
         print("Starting apply_approved_descriptions...")
 
         # Get approved items
         query = f"""
-        SELECT id, object_type, catalog_name, schema_name, table_name, column_name, approved_description
+        SELECT id, object_type, catalog_name, schema_name, table_name, column_name, approved_description, reviewer
         FROM {GOVERNANCE_TABLE}
         WHERE review_status = 'APPROVED' AND applied_at IS NULL
+        ORDER BY id
         """
 
-        approved = self.execute_sql(query)
+        approved = self.execute_sql(query, disposition=Disposition.EXTERNAL_LINKS)
         print(f"Found {len(approved)} approved descriptions to apply")
 
-        applied_count = 0
-        error_count = 0
         errors = []
+        groups: Dict[str, Dict] = {}
 
         for item in approved:
             try:
-                # Debug: Print the item details
-                print(f"Processing item: id={item.get('id')} (type: {type(item.get('id'))}), object_type={item.get('object_type')}")
-
                 # Validate identifiers
                 self._validate_identifier(item['catalog_name'], "catalog")
                 self._validate_identifier(item['schema_name'], "schema")
@@ -526,79 +2835,592 @@ class DescriptionService:
                 if item['column_name']:
                     self._validate_identifier(item['column_name'], "column")
 
-                escaped_desc = self._escape_sql_string(item['approved_description'])
-
+                table_path = f"{item['catalog_name']}.{item['schema_name']}.{item['table_name']}"
+                group = groups.setdefault(table_path, {
+                    'path': table_path,
+                    'catalog': item['catalog_name'],
+                    'schema': item['schema_name'],
+                    'table_name': item['table_name'],
+                    'table': [],
+                    'columns': {}
+                })
                 if item['object_type'] == 'TABLE':
-                    apply_sql = f"""
-                    COMMENT ON TABLE {item['catalog_name']}.{item['schema_name']}.{item['table_name']}
-                    IS '{escaped_desc}'
-                    """
+                    group['table'].append(item)
                 else:
-                    # For columns, use COMMENT ON COLUMN syntax (same as table)
-                    apply_sql = f"""
-                    COMMENT ON COLUMN {item['catalog_name']}.{item['schema_name']}.{item['table_name']}.{item['column_name']}
-                    IS '{escaped_desc}'
-                    """
-
-                print(f"Applying: {item['object_type']} {item['catalog_name']}.{item['schema_name']}.{item['table_name']}" +
-                      (f".{item['column_name']}" if item['column_name'] else ""))
-                self.execute_sql(apply_sql)
-                print(f"Successfully applied!")
+                    group['columns'].setdefault(item['column_name'], []).append(item)
 
-                # Mark as applied
-                record_id = item.get('id')
-                print(f"DEBUG: Raw record_id from item: {record_id}, type: {type(record_id)}")
-
-                # Convert to int if needed (Databricks may return as string, long, Decimal, etc.)
-                try:
-                    if record_id is None:
-                        raise ValueError(f"Record ID is None for item: {item}")
-
-                    # Convert to int regardless of type
-                    record_id = int(record_id)
-                    print(f"DEBUG: Converted record_id: {record_id}")
-                except (ValueError, TypeError) as e:
-                    raise ValueError(f"Invalid record ID: {record_id} (type: {type(record_id)}). Error: {e}")
-
-                print(f"Marking record {record_id} as applied")
-                update_sql = f"""
-                UPDATE {GOVERNANCE_TABLE}
-                SET review_status = 'APPLIED', applied_at = current_timestamp()
-                WHERE id = {record_id}
-                """
+            except Exception as e:
+                errors.append(self._apply_error(item, e))
+
+        applied_ids = []
+        if groups:
+            print(f"Applying descriptions to {len(groups)} tables ({APPLY_CONCURRENCY} in flight)")
+            with ThreadPoolExecutor(max_workers=APPLY_CONCURRENCY, thread_name_prefix='apply') as pool:
+                for table_ids, table_errors in pool.map(self._apply_table_group, groups.values()):
+                    applied_ids.extend(table_ids)
+                    errors.extend(table_errors)
+
+        # Mark as applied, one set-based UPDATE per batch
+        approved_by_id = {item['id']: item for item in approved}
+        marked = 0
+        unmarked = 0
+        for start in range(0, len(applied_ids), APPLY_MARK_BATCH_SIZE):
+            batch = applied_ids[start:start + APPLY_MARK_BATCH_SIZE]
+            update_sql = f"""
+            UPDATE {GOVERNANCE_TABLE}
+            SET review_status = 'APPLIED', applied_at = current_timestamp()
+            WHERE id IN ({', '.join(str(record_id) for record_id in batch)})
+            """
+            try:
                 self.execute_sql(update_sql)
-                print(f"Record {record_id} marked as APPLIED")
-
-                applied_count += 1
-
+                marked += len(batch)
+                for record_id in batch:
+                    self._review_rows.invalidate(record_id)
+                self._update_dashboard(
+                    (dict(approved_by_id[record_id], review_status='APPROVED'),
+                     dict(approved_by_id[record_id], review_status='APPLIED'))
+                    for record_id in batch
+                )
             except Exception as e:
-                error_msg = f"Error applying description for {item['object_type']} {item.get('catalog_name')}.{item.get('schema_name')}.{item.get('table_name')}: {str(e)}"
+                # One error per failed batch; the records stay APPROVED and are re-applied next time
+                error_msg = (f"Applied to UC but failed to mark {len(batch)} records "
+                             f"(ids {min(batch)}-{max(batch)}) as APPLIED: {str(e)}")
                 print(error_msg)
                 errors.append(error_msg)
-                error_count += 1
+                unmarked += len(batch)
 
-        print(f"Apply complete: {applied_count} applied, {error_count} errors")
+        print(f"Apply complete: {marked} applied, {len(errors)} errors")
         return {
-            'applied_count': applied_count,
-            'error_count': error_count,
+            'applied_count': marked,
+            'unmarked_count': unmarked,
+            'error_count': len(errors),
             'total_approved': len(approved),
             'errors': errors
         }
 
+    def _apply_error(self, item: Dict, error: Exception) -> str:
+        error_msg = f"Error applying description for {item.get('object_type')} {item.get('catalog_name')}.{item.get('schema_name')}.{item.get('table_name')}: {str(error)}"
+        print(error_msg)
+        return error_msg
+
+    def _apply_table_group(self, group: Dict):
+        """Apply the approved table and column descriptions of one table
+
+        When a table or column has several approved records, the newest one is
+        written and all of them are marked applied.
+
+        Returns:
+            Tuple of (applied record ids, error messages)
+        """
+        applied_ids = []
+        errors = []
+        path = group['path']
+
+        if group['table']:
+            latest = group['table'][-1]
+            apply_sql = f"""
+            COMMENT ON TABLE {path}
+            IS '{self._escape_sql_string(latest['approved_description'])}'
+            """
+            try:
+                print(f"Applying: TABLE {path}")
+                self.execute_sql(apply_sql)
+                applied_ids.extend(item['id'] for item in group['table'])
+            except Exception as e:
+                errors.extend(self._apply_error(item, e) for item in group['table'])
+
+        if group['columns']:
+            clauses = [
+                f"{column} COMMENT '{self._escape_sql_string(items[-1]['approved_description'])}'"
+                for column, items in group['columns'].items()
+            ]
+            alter_sql = f"""
+            ALTER TABLE {path}
+            ALTER COLUMN {', '.join(clauses)}
+            """
+            try:
+                print(f"Applying: {len(clauses)} COLUMN comments on {path}")
+                self.execute_sql(alter_sql)
+                applied_ids.extend(item['id'] for items in group['columns'].values() for item in items)
+            except Exception as e:
+                # Multi-column ALTER needs a recent runtime; fall back to one statement per column
+                print(f"Grouped column comment failed on {path}, applying per column: {e}")
+                for column, items in group['columns'].items():
+                    apply_sql = f"""
+                    COMMENT ON COLUMN {path}.{column}
+                    IS '{self._escape_sql_string(items[-1]['approved_description'])}'
+                    """
+                    try:
+                        self.execute_sql(apply_sql)
+                        applied_ids.extend(item['id'] for item in items)
+                    except Exception as column_error:
+                        errors.extend(self._apply_error(item, column_error) for item in items)
+
+        # Comments changed, so cached metadata for this table is stale
+        if applied_ids:
+            self.invalidate_table(group['catalog'], group['schema'], group['table_name'])
+
+        return applied_ids, errors
+
+
+class GovernanceWriter:
+    """Buffers generated descriptions and writes them as multi-row INSERTs
+
+    Rows are validated and escaped when added. The buffer is flushed when it
+    reaches max_rows, when its oldest row is older than max_age_seconds, on
+    flush(), and when used as a context manager, on exit (including errors).
+    on_flush, if given, is called with a summary of each batch once written.
+    """
+
+    def __init__(self, service: DescriptionService, max_rows: int = GOVERNANCE_FLUSH_ROWS,
+                 max_age_seconds: float = GOVERNANCE_FLUSH_SECONDS,
+                 on_flush: Optional[Callable[[List[Dict]], None]] = None):
+        self.service = service
+        self.on_flush = on_flush
+        self.max_rows = max(1, max_rows)
+        self.max_age_seconds = max_age_seconds
+        self.rows_written = 0
+        self._rows: List[Tuple[Dict[str, str], Dict]] = []  # (SQL literals, dashboard summary)
+        self._oldest = None
+        self._lock = threading.Lock()
+
+    def add(self, object_type: str, catalog: str, schema: str, table: str,
+            column: Optional[str], column_type: Optional[str], description: str,
+            fingerprint: Optional[str] = None, model_used: Optional[str] = None,
+            confidence: Optional[float] = None):
+        """Buffer one description, flushing if a threshold is reached"""
+        row = self.service._governance_row_sql(object_type, catalog, schema, table, column, column_type,
+                                               description, fingerprint, model_used, confidence)
+        summary = {
+            'object_type': object_type,
+            'catalog_name': catalog,
+            'schema_name': schema,
+            'table_name': table,
+            'column_name': column,
+            'description': description[:100],
+            'model_used': model_used or MODEL_ENDPOINT,
+            'review_status': 'PENDING',
+            'reviewer': None
+        }
+        with self._lock:
+            if not self._rows:
+                self._oldest = time.monotonic()
+            self._rows.append((row, summary))
+            due = (len(self._rows) >= self.max_rows or
+                   time.monotonic() - self._oldest >= self.max_age_seconds)
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered rows; returns the number of rows written"""
+        with self._lock:
+            rows, self._rows = self._rows, []
+            self._oldest = None
+        if not rows:
+            return 0
+
+        for start in range(0, len(rows), self.max_rows):
+            batch = rows[start:start + self.max_rows]
+            self.service._insert_governance_rows([row for row, _ in batch])
+            self.service._update_dashboard((None, summary) for _, summary in batch)
+            if self.on_flush:
+                self.on_flush([summary for _, summary in batch])
+        with self._lock:
+            self.rows_written += len(rows)
+        print(f"Flushed {len(rows)} governance rows")
+        return len(rows)
+
+    def __enter__(self) -> 'GovernanceWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.flush()
+        except Exception as e:
+            if exc_type is None:
+                raise
+            print(f"Error flushing governance rows: {e}")
+        return False
+
 
 # Lazy initialize service (will be created on first request)
 _service = None
+_service_lock = threading.Lock()
 
 def get_service():
     """Get or create DescriptionService instance"""
     global _service
-    if _service is None:
-        print("Initializing DescriptionService...")
-        _service = DescriptionService()
-        print("DescriptionService initialized successfully")
+    with _service_lock:
+        if _service is None:
+            print("Initializing DescriptionService...")
+            _service = DescriptionService()
+            print("DescriptionService initialized successfully")
     return _service
 
 
+
+class GenerationJob:
+    """Background description generation run with per-table progress"""
+
+    TERMINAL_STATES = ('COMPLETED', 'FAILED', 'CANCELLED')
+
+    def __init__(self, catalog: str, schema: Optional[str], tables: List[Dict], total_found: int,
+                 concurrency: int = GENERATION_CONCURRENCY, incremental: bool = False,
+                 force_regenerate: bool = False, dedup: bool = COLUMN_DEDUP_ENABLED,
+                 combined: bool = COMBINED_GENERATION_ENABLED):
+        self.id = uuid.uuid4().hex
+        self.catalog = catalog
+        self.schema = schema
+        self.concurrency = max(1, min(int(concurrency), MAX_GENERATION_CONCURRENCY))
+        self.incremental = bool(incremental)
+        self.force_regenerate = bool(force_regenerate)
+        self.dedup = bool(dedup)
+        self.combined = bool(combined)
+        self.status = 'QUEUED'  # QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED
+        self.error = None
+        self.created_at = datetime.utcnow()
+        self.started_at = None
+        self.finished_at = None
+        self.tables = [{
+            'catalog': t['table_catalog'],
+            'schema': t['table_schema'],
+            'table': t['table_name'],
+            'path': f"{t['table_catalog']}.{t['table_schema']}.{t['table_name']}",
+            'status': 'PENDING',  # PENDING, RUNNING, COMPLETED, FAILED, CANCELLED
+            'generated': 0,
+            'errors': 0,
+            'skipped': 0,
+            'error': None,
+            'items': []
+        } for t in tables]
+        # Items stay on their table entry so results come out in table order
+        # regardless of which table finishes first
+        self.results = {
+            'total_found': total_found,
+            'processing': len(tables),
+            'generated': 0,
+            'errors': 0,
+            'skipped': 0,
+            'shared_columns': 0,
+            'stored': 0
+        }
+        self._items_kept = 0
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        # Progress events for streaming; ids increase by one so clients can resume
+        self._events = deque(maxlen=JOB_EVENT_BUFFER)
+        self._event_id = 0
+        self._changed = threading.Condition(self._lock)
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in self.TERMINAL_STATES
+
+    def request_cancel(self):
+        """Ask the job to stop before its next table"""
+        self._cancel_event.set()
+        with self._lock:
+            if self.status == 'QUEUED':
+                self._finish('CANCELLED')
+
+    def start(self) -> bool:
+        """Mark the job as running; False if it was cancelled while queued"""
+        with self._lock:
+            if self.status != 'QUEUED':
+                return False
+            self.status = 'RUNNING'
+            self.started_at = datetime.utcnow()
+            self._emit('status', self._summary())
+            return True
+
+    def table_started(self, index: int):
+        with self._lock:
+            self.tables[index]['status'] = 'RUNNING'
+
+    def items_stored(self, summaries: List[Dict]):
+        """Record descriptions written to the governance table, one event each"""
+        with self._lock:
+            for summary in summaries:
+                self.results['stored'] += 1
+                path = '.'.join(part for part in (summary['catalog_name'], summary['schema_name'],
+                                                  summary['table_name'], summary['column_name']) if part)
+                self._emit('item', {
+                    'type': summary['object_type'],
+                    'path': path,
+                    'description': summary['description'],
+                    'model_used': summary['model_used'],
+                    'progress': self._progress()
+                })
+
+    def table_finished(self, index: int, table_results: Dict):
+        with self._lock:
+            entry = self.tables[index]
+            entry['status'] = 'COMPLETED'
+            entry['generated'] = table_results['generated']
+            entry['errors'] = table_results['errors']
+            entry['skipped'] = table_results['skipped']
+            entry['items'] = self._keep_items(table_results['items'])
+            self.results['generated'] += table_results['generated']
+            self.results['errors'] += table_results['errors']
+            self.results['skipped'] += table_results['skipped']
+            self._emit('table', self._table_event(entry, table_results['items']))
+
+    def table_failed(self, index: int, error: str):
+        with self._lock:
+            entry = self.tables[index]
+            entry['status'] = 'FAILED'
+            entry['errors'] += 1
+            entry['error'] = error
+            self.results['errors'] += 1
+            items = [{
+                'type': 'TABLE',
+                'path': entry['path'],
+                'error': error
+            }]
+            entry['items'] = self._keep_items(items)
+            self._emit('table', self._table_event(entry, items))
+
+    def _keep_items(self, items: List[Dict]) -> List[Dict]:
+        # Large runs only keep the first JOB_MAX_ITEMS result items in memory
+        kept = items[:max(0, JOB_MAX_ITEMS - self._items_kept)]
+        self._items_kept += len(kept)
+        return kept
+
+    def _table_event(self, entry: Dict, items: List[Dict]) -> Dict:
+        return {
+            'path': entry['path'],
+            'status': entry['status'],
+            'generated': entry['generated'],
+            'errors': entry['errors'],
+            'skipped': entry['skipped'],
+            'error': entry['error'],
+            'items': items,
+            'progress': self._progress()
+        }
+
+    def finish(self, error: Optional[str] = None):
+        """Mark the job as finished (cancelled, failed or completed)"""
+        with self._lock:
+            if self.cancel_requested:
+                self._finish('CANCELLED')
+            elif error:
+                self.error = error
+                self._finish('FAILED')
+            else:
+                self._finish('COMPLETED')
+
+    def _finish(self, status: str):
+        for entry in self.tables:
+            if entry['status'] == 'PENDING':
+                entry['status'] = 'CANCELLED'
+        self.status = status
+        self.finished_at = datetime.utcnow()
+        self._emit('done', self._summary())
+
+    def _emit(self, event: str, data: Dict):
+        """Append a progress event and wake streaming clients (lock held)"""
+        self._event_id += 1
+        self._events.append({'id': self._event_id, 'event': event, 'data': data})
+        self._changed.notify_all()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job finishes; returns whether it did within timeout"""
+        with self._changed:
+            return self._changed.wait_for(lambda: self.is_finished, timeout)
+
+    def events_since(self, last_id: int, timeout: float) -> Tuple[List[Dict], bool]:
+        """Events after last_id, waiting up to timeout for new ones
+
+        Returns:
+            (events, finished) - events older than the buffer are dropped
+        """
+        with self._changed:
+            if self._event_id <= last_id and not self.is_finished:
+                self._changed.wait(timeout)
+            return [e for e in self._events if e['id'] > last_id], self.is_finished
+
+    def _progress(self) -> Dict:
+        return {
+            'tables_total': len(self.tables),
+            'tables_done': sum(1 for t in self.tables if t['status'] in ('COMPLETED', 'FAILED')),
+            'generated': self.results['generated'],
+            'errors': self.results['errors'],
+            'skipped': self.results['skipped'],
+            'stored': self.results['stored']
+        }
+
+    def _summary(self) -> Dict:
+        return {
+            'id': self.id,
+            'catalog': self.catalog,
+            'schema': self.schema,
+            'status': self.status,
+            'error': self.error,
+            'concurrency': self.concurrency,
+            'incremental': self.incremental,
+            'force_regenerate': self.force_regenerate,
+            'dedup': self.dedup,
+            'combined': self.combined,
+            'created_at': self.created_at.isoformat() + 'Z',
+            'started_at': self.started_at.isoformat() + 'Z' if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() + 'Z' if self.finished_at else None,
+            'progress': self._progress()
+        }
+
+    def to_dict(self, include_tables: bool = True) -> Dict:
+        """JSON-serializable snapshot of job progress"""
+        with self._lock:
+            job = self._summary()
+            if include_tables:
+                job['tables'] = [{k: v for k, v in t.items() if k != 'items'} for t in self.tables]
+                job['results'] = dict(self.results, items=[item for t in self.tables for item in t['items']],
+                                      items_truncated=self._items_kept >= JOB_MAX_ITEMS)
+            return job
+
+
+class JobManager:
+    """Runs generation jobs on an in-process worker pool"""
+
+    def __init__(self, max_workers: int = GENERATION_WORKERS, retention: int = JOB_RETENTION):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='generation')
+        self._jobs: Dict[str, GenerationJob] = {}
+        self._retention = retention
+        self._lock = threading.Lock()
+
+    def submit(self, job: GenerationJob) -> GenerationJob:
+        """Queue a job for execution"""
+        with self._lock:
+            self._jobs[job.id] = job
+            self._evict_finished()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[GenerationJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[GenerationJob]:
+        """Jobs newest first"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[GenerationJob]:
+        job = self.get(job_id)
+        if job:
+            job.request_cancel()
+        return job
+
+    def _evict_finished(self):
+        finished = sorted((j for j in self._jobs.values() if j.is_finished), key=lambda j: j.created_at)
+        for job in finished[:max(0, len(finished) - self._retention)]:
+            del self._jobs[job.id]
+
+    def _run(self, job: GenerationJob):
+        if not job.start():
+            return
+
+        print(f"Job {job.id}: generating descriptions for {len(job.tables)} tables "
+              f"({job.concurrency} in flight)")
+        try:
+            service = get_service()
+            with service.generation_statements():
+                # One information_schema query for the whole run instead of one per table
+                columns_by_table = {}
+                if job.tables:
+                    try:
+                        columns_by_table = service.prefetch_columns(
+                            job.catalog, job.schema, [(entry['schema'], entry['table']) for entry in job.tables]
+                        )
+                    except Exception as e:
+                        print(f"Job {job.id}: column prefetch failed, loading columns per table: {e}")
+
+                # What earlier runs already generated, for skipping unchanged objects
+                generation_state = None
+                if job.incremental and job.tables:
+                    generation_state = service.get_generation_state(
+                        job.catalog, job.schema, [entry['table'] for entry in job.tables]
+                    )
+
+                # Describe columns repeated across tables once, before the per-table pass
+                shared_columns = {}
+                if job.dedup and columns_by_table:
+                    try:
+                        shared_columns = service.describe_shared_columns(
+                            job.catalog, columns_by_table, generation_state, use_cache=not job.force_regenerate
+                        )
+                        job.results['shared_columns'] = sum(len(cols) for cols in shared_columns.values())
+                    except Exception as e:
+                        print(f"Job {job.id}: column dedup failed, describing columns per table: {e}")
+
+                if job.concurrency == 1:
+                    for index in range(len(job.tables)):
+                        self._run_table(service, job, index, columns_by_table, generation_state, shared_columns)
+                else:
+                    with ThreadPoolExecutor(max_workers=job.concurrency,
+                                            thread_name_prefix=f"generation-{job.id[:8]}") as pool:
+                        futures = [pool.submit(self._run_table, service, job, index, columns_by_table,
+                                               generation_state, shared_columns)
+                                   for index in range(len(job.tables))]
+                        for future in futures:
+                            future.result()
+
+            job.finish()
+        except Exception as e:
+            print(f"Job {job.id} failed: {e}")
+            job.finish(error=str(e))
+
+        print(f"Job {job.id} {job.status}: {job.results['generated']} generated, {job.results['errors']} errors")
+
+    def _run_table(self, service: 'DescriptionService', job: GenerationJob, index: int,
+                   columns_by_table: Dict[Tuple[str, str], List[Dict]],
+                   generation_state: Optional[Dict[Tuple[str, str], Dict]] = None,
+                   shared_columns: Optional[Dict[Tuple[str, str], Dict[str, Dict]]] = None):
+        """Generate one table of a job, recording failures on the job"""
+        if job.cancel_requested:
+            return
+
+        entry = job.tables[index]
+        key = (entry['schema'], entry['table'])
+        known = None
+        if generation_state is not None:
+            known = generation_state.get(key, {'fingerprints': set(), 'columns': set()})
+
+        job.table_started(index)
+        try:
+            with service.generation_statements():
+                table_results = service.generate_for_table(
+                    entry['catalog'], entry['schema'], entry['table'],
+                    columns=columns_by_table.get(key),
+                    known=known,
+                    use_cache=not job.force_regenerate,
+                    shared=(shared_columns or {}).get(key),
+                    on_stored=job.items_stored,
+                    combined=job.combined
+                )
+            job.table_finished(index, table_results)
+        except Exception as e:
+            error_msg = f"Error processing {entry['path']}: {str(e)}"
+            print(error_msg)
+            job.table_failed(index, str(e))
+
+
+# Lazy initialize job manager (worker threads start on first job)
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+def get_job_manager():
+    """Get or create JobManager instance"""
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager()
+    return _job_manager
+
+
 # API Endpoints
 @app.route('/api/setup', methods=['POST'])
 def api_setup():
@@ -612,13 +3434,19 @@ def api_setup():
 
 @app.route('/api/generate', methods=['POST'])
 def api_generate():
-    """Generate descriptions for tables"""
+    """Start a background job generating descriptions for tables"""
     try:
         data = request.json
         catalog = data.get('catalog', TARGET_CATALOG)
         schema = data.get('schema')
         tables_list = data.get('tables', [])  # Specific tables or empty for all
         batch_size = data.get('batch_size', 10)
+        concurrency = data.get('concurrency', GENERATION_CONCURRENCY)
+        incremental = bool(data.get('incremental', False))  # Skip tables/columns unchanged since last run
+        force_regenerate = bool(data.get('force_regenerate', False))  # Bypass the LLM response cache
+        dedup = bool(data.get('dedup', COLUMN_DEDUP_ENABLED))  # Describe repeated columns once per run
+        combined = bool(data.get('combined', COMBINED_GENERATION_ENABLED))  # One JSON prompt per table/column chunk
+        background = bool(data.get('background', False))  # Return the job id without waiting for results
 
         # Check permissions first
         perms = get_service().check_permissions(catalog, schema)
@@ -638,76 +3466,105 @@ def api_generate():
             # Get all tables (up to batch size)
             tables_to_process = all_tables[:batch_size]
 
-        results = {
-            'total_found': len(all_tables),
-            'processing': len(tables_to_process),
-            'generated': 0,
-            'errors': 0,
-            'items': []
-        }
+        job = get_job_manager().submit(
+            GenerationJob(catalog, schema, tables_to_process, len(all_tables),
+                          concurrency=concurrency, incremental=incremental,
+                          force_regenerate=force_regenerate, dedup=dedup, combined=combined)
+        )
 
-        for table_info in tables_to_process:
-            cat = table_info['table_catalog']
-            sch = table_info['table_schema']
-            tbl = table_info['table_name']
+        if background:
+            return jsonify({'success': True, 'job_id': job.id, 'job': job.to_dict()}), 202
+
+        # Clients built before background jobs expect the results in the response. The
+        # wait is bounded so a long run doesn't hold a request thread. Those clients
+        # report any 2xx as a finished run, so a run still going is an error to them
+        finished = job.wait(GENERATE_SYNC_WAIT_SECONDS)
+        snapshot = job.to_dict()
+        if snapshot['status'] == 'FAILED':
+            return jsonify({'success': False, 'job_id': job.id, 'error': snapshot['error']}), 500
+        if not finished:
+            return jsonify({
+                'success': False,
+                'job_id': job.id,
+                'status': snapshot['status'],
+                'results': snapshot['results'],
+                'error': (f"Generation is still running in the background (job {job.id}); "
+                          f"new descriptions appear in the review queue as tables finish")
+            }), 504
+        return jsonify({'success': True, 'job_id': job.id, 'results': snapshot['results']})
 
-            try:
-                # Generate table description using SQL AI function
-                print(f"Generating description for {cat}.{sch}.{tbl}")
-                table_desc = get_service().generate_table_description(cat, sch, tbl)
-                print(f"Table description result: {table_desc[:100]}...")
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-                if not table_desc.startswith('ERROR:'):
-                    get_service().store_generated_description('TABLE', cat, sch, tbl, None, None, table_desc)
-                    results['generated'] += 1
-                    results['items'].append({
-                        'type': 'TABLE',
-                        'path': f"{cat}.{sch}.{tbl}",
-                        'description': table_desc[:100] + '...'
-                    })
-                else:
-                    results['errors'] += 1
-                    results['items'].append({
-                        'type': 'TABLE',
-                        'path': f"{cat}.{sch}.{tbl}",
-                        'error': table_desc
-                    })
-                    print(f"Table description failed: {table_desc}")
-
-                # Generate column descriptions
-                metadata = get_service().get_table_metadata(cat, sch, tbl)
-                for col in metadata['columns']:
-                    if not col.get('comment'):
-                        sample_values = None
-                        if metadata['sample_data']:
-                            sample_values = [row.get(col['column_name']) for row in metadata['sample_data']]
-
-                        col_desc = get_service().generate_column_description(
-                            cat, sch, tbl, col['column_name'], col['data_type'], sample_values
-                        )
 
-                        if not col_desc.startswith('ERROR:'):
-                            get_service().store_generated_description(
-                                'COLUMN', cat, sch, tbl, col['column_name'], col['data_type'], col_desc
-                            )
-                            results['generated'] += 1
-                        else:
-                            results['errors'] += 1
-                            print(f"Column {col['column_name']} generation failed: {col_desc}")
+@app.route('/api/jobs', methods=['GET'])
+def api_jobs():
+    """List recent generation jobs"""
+    try:
+        jobs = [job.to_dict(include_tables=False) for job in get_job_manager().list()]
+        return jsonify({'success': True, 'jobs': jobs})
 
-                time.sleep(0.5)  # Rate limiting
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
 
-            except Exception as e:
-                results['errors'] += 1
-                error_msg = f"Error processing {cat}.{sch}.{tbl}: {str(e)}"
-                print(error_msg)
-                results['items'].append({
-                    'type': 'TABLE',
-                    'path': f"{cat}.{sch}.{tbl}",
-                    'error': str(e)
-                })
 
-        return jsonify({'success': True, 'results': results})
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def api_job(job_id):
+    """Get generation job progress"""
+    try:
+        job = get_job_manager().get(job_id)
+        if not job:
+            return jsonify({'success': False, 'error': f'Job {job_id} not found'}), 404
+
+        return jsonify({'success': True, 'job': job.to_dict()})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def api_job_events(job_id):
+    """Stream generation job progress as Server-Sent Events
+
+    Emits 'status', 'item' (one per stored description), 'table' and a final
+    'done' event, each with running totals. Reconnecting clients resume after
+    the Last-Event-ID header.
+    """
+    try:
+        job = get_job_manager().get(job_id)
+        if not job:
+            return jsonify({'success': False, 'error': f'Job {job_id} not found'}), 404
+
+        last_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_event_id') or 0)
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    def stream(last_id: int):
+        yield "retry: 2000\n\n"
+        while True:
+            events, finished = job.events_since(last_id, timeout=SSE_HEARTBEAT_SECONDS)
+            for event in events:
+                last_id = event['id']
+                yield f"id: {event['id']}\nevent: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
+            if finished and not events:
+                break
+            if not events:
+                yield ": keep-alive\n\n"
+
+    return Response(stream_with_context(stream(last_id)), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+def api_job_cancel(job_id):
+    """Cancel a queued or running generation job"""
+    try:
+        job = get_job_manager().cancel(job_id)
+        if not job:
+            return jsonify({'success': False, 'error': f'Job {job_id} not found'}), 404
+
+        return jsonify({'success': True, 'job': job.to_dict()})
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -732,28 +3589,24 @@ def api_review(record_id):
 
 @app.route('/api/review/bulk', methods=['POST'])
 def api_review_bulk():
-    """Bulk update review status for multiple records"""
+    """Bulk update review status for multiple records in one statement"""
     try:
         data = request.json
         reviews = data.get('reviews', [])  # [{id, status, approved_description, reviewer}, ...]
 
+        # Shorthand used by the UI: {ids, status, reviewer} applies one status to every id
+        if not reviews and data.get('ids'):
+            reviews = [
+                {'id': record_id, 'status': data.get('status'), 'reviewer': data.get('reviewer', 'unknown')}
+                for record_id in data['ids']
+            ]
+
         if not reviews:
             return jsonify({'success': False, 'error': 'No reviews provided'}), 400
 
-        results = []
-        errors = []
-
-        for review in reviews:
-            try:
-                record_id = review['id']
-                status = review['status']
-                approved_desc = review.get('approved_description')
-                reviewer = review.get('reviewer', 'unknown')
-
-                get_service().update_review_status(record_id, status, approved_desc, reviewer)
-                results.append({'id': record_id, 'success': True})
-            except Exception as e:
-                errors.append({'id': review.get('id'), 'error': str(e)})
+        outcome = get_service().update_review_statuses(reviews)
+        results = outcome['results']
+        errors = outcome['errors']
 
         return jsonify({
             'success': len(errors) == 0,
@@ -837,6 +3690,77 @@ def api_tables():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/llm-cache', methods=['GET'])
+def api_llm_cache():
+    """Get LLM response cache statistics"""
+    try:
+        cache = get_service().response_cache
+        return jsonify({'success': True, 'enabled': cache is not None, 'stats': cache.stats() if cache else None})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/llm-cache/clear', methods=['POST'])
+def api_llm_cache_clear():
+    """Drop every cached LLM response"""
+    try:
+        cache = get_service().response_cache
+        if cache:
+            cache.clear()
+        return jsonify({'success': True, 'message': 'LLM response cache cleared'})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/similarity-index', methods=['GET'])
+def api_similarity_index():
+    """Get similarity index statistics, refreshing it from the governance table first"""
+    try:
+        service = get_service()
+        if service.similarity_index is None:
+            return jsonify({'success': True, 'enabled': False, 'stats': None})
+
+        service.refresh_similarity_index(force=request.args.get('refresh', 'false').lower() == 'true')
+        return jsonify({'success': True, 'enabled': True, 'stats': service.similarity_index.stats()})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/model-rate', methods=['GET'])
+def api_model_rate():
+    """Get model call rate controller statistics"""
+    try:
+        return jsonify({'success': True, 'backend': GENERATION_BACKEND,
+                        'stats': get_service().rate_controller.stats()})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/prompt-stats', methods=['GET'])
+def api_prompt_stats():
+    """Get estimated token counts of generation prompts"""
+    try:
+        return jsonify({'success': True, 'stats': get_service().prompt_builder.stats()})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/cache/clear', methods=['POST'])
+def api_cache_clear():
+    """Drop cached catalog, schema, table and column metadata"""
+    try:
+        get_service().clear_metadata_cache()
+        return jsonify({'success': True, 'message': 'Metadata cache cleared'})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/permissions', methods=['POST'])
 def api_permissions():
     """Check permissions for catalog/schema/table"""
@@ -858,18 +3782,96 @@ def api_permissions():
 
 @app.route('/api/pending', methods=['GET'])
 def api_pending():
-    """Get pending reviews with pagination"""
+    """Get pending reviews, paged by cursor (or page number) with optional filters"""
     try:
-        page = int(request.args.get('page', 1))
         per_page = int(request.args.get('per_page', 20))
+        page = int(request.args.get('page', 1))
+        cursor = request.args.get('cursor') or None
+        filters = {
+            'catalog': request.args.get('catalog') or None,
+            'schema': request.args.get('schema') or None,
+            'table': request.args.get('table') or None,
+            'object_type': request.args.get('object_type') or None
+        }
+
+        service = get_service()
+        # One extra row tells whether another page follows
+        pending = service.get_pending_reviews(limit=per_page + 1, offset=(page-1)*per_page,
+                                              cursor=cursor, **filters)
+        has_more = len(pending) > per_page
+        pending = pending[:per_page]
+        next_cursor = service.encode_cursor(pending[-1]) if has_more else None
+        for row in pending:
+            row.pop('cursor_micros', None)
+
+        return jsonify({
+            'success': True,
+            'pending': pending,
+            'page': page,
+            'next_cursor': next_cursor,
+            'has_more': has_more,
+            'total_estimate': service.estimate_pending(**filters)
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 
-        pending = get_service().get_pending_reviews(limit=per_page, offset=(page-1)*per_page)
+@app.route('/api/export', methods=['GET'])
+def api_export():
+    """Stream governance records as CSV or JSONL
 
-        return jsonify({'success': True, 'pending': pending, 'page': page})
+    Query params: format (csv|jsonl), status (comma separated), catalog,
+    schema, since/until (ISO timestamps) and time_column.
+    """
+    try:
+        export_format = request.args.get('format', 'csv').lower()
+        if export_format not in ('csv', 'jsonl'):
+            raise ValueError(f"Invalid format: {export_format}")
+        statuses = [status.strip().upper() for status in request.args.get('status', '').split(',') if status.strip()]
+
+        columns, rows = get_service().export_governance_records(
+            statuses=statuses,
+            catalog=request.args.get('catalog') or None,
+            schema=request.args.get('schema') or None,
+            since=request.args.get('since') or None,
+            until=request.args.get('until') or None,
+            time_column=request.args.get('time_column', 'generated_at')
+        )
 
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns)
+        writer.writeheader()
+        for count, row in enumerate(rows, 1):
+            writer.writerow(row)
+            if count % EXPORT_FLUSH_ROWS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    def generate_jsonl():
+        lines = []
+        for row in rows:
+            lines.append(json.dumps(row, default=str))
+            if len(lines) >= EXPORT_FLUSH_ROWS:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    filename = f"description_governance_{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.{export_format}"
+    body = generate_csv() if export_format == 'csv' else generate_jsonl()
+    return Response(stream_with_context(body),
+                    mimetype='text/csv' if export_format == 'csv' else 'application/x-ndjson',
+                    headers={'Content-Disposition': f'attachment; filename="{filename}"'})
+
 
 @app.route('/api/schema-progress', methods=['GET'])
 def api_schema_progress():
@@ -886,26 +3888,25 @@ def api_schema_progress():
 def api_review_activity():
     """Get reviewer activity"""
     try:
-        query = f"""
-        SELECT
-            reviewer,
-            review_status,
-            COUNT(*) as count,
-            MIN(reviewed_at) as first_review,
-            MAX(reviewed_at) as last_review
-        FROM {GOVERNANCE_TABLE}
-        WHERE reviewer IS NOT NULL
-        GROUP BY reviewer, review_status
-        ORDER BY reviewer, review_status
-        """
-
-        activity = get_service().execute_sql(query)
+        activity = get_service().get_review_activity()
         return jsonify({'success': True, 'activity': activity})
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/dashboard', methods=['GET'])
+def api_dashboard():
+    """Get statistics, schema progress and review activity in one call"""
+    try:
+        refresh = request.args.get('refresh', 'false').lower() == 'true'
+        dashboard = get_service().get_dashboard(refresh=refresh)
+        return jsonify({'success': True, **dashboard})
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/coverage', methods=['GET'])
 def api_coverage():
     """Get current UC coverage"""
@@ -26,26 +26,19 @@ export default function Compliance() {
   const [alertModal, setAlertModal] = useState({ isOpen: false, title: '', message: '', type: 'info' })
   const queryClient = useQueryClient()
 
-  const { data: stats } = useQuery({
+  // Stats, schema progress and review activity come from one dashboard snapshot
+  const { data: dashboard } = useQuery({
     queryKey: ['stats'],
-    queryFn: descriptionService.getStats,
-  })
-
-  const { data: schemaProgress } = useQuery({
-    queryKey: ['schema-progress'],
-    queryFn: descriptionService.getSchemaProgress,
-  })
-
-  const { data: reviewActivity } = useQuery({
-    queryKey: ['review-activity'],
-    queryFn: descriptionService.getReviewActivity,
+    queryFn: descriptionService.getDashboard,
   })
+  const stats = dashboard
+  const schemaProgress = dashboard
+  const reviewActivity = dashboard
 
   const applyMutation = useMutation({
     mutationFn: descriptionService.applyDescriptions,
     onSuccess: (data) => {
       queryClient.invalidateQueries(['stats'])
-      queryClient.invalidateQueries(['schema-progress'])
       setAlertModal({
         isOpen: true,
         title: 'Success',
@@ -298,10 +291,10 @@ export default function Compliance() {
       <div className="card">
         <div className="flex items-center justify-between mb-6">
           <h3 className="text-xl font-bold text-gray-900">Schema Progress Details</h3>
-          <button className="btn btn-secondary flex items-center space-x-2">
+          <a href={descriptionService.exportUrl()} download className="btn btn-secondary flex items-center space-x-2">
             <Download className="w-4 h-4" />
             <span>Export Report</span>
-          </button>
+          </a>
         </div>
 
         <div className="overflow-x-auto">
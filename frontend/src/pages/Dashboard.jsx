@@ -46,16 +46,14 @@ export default function Dashboard() {
   const [confirmModal, setConfirmModal] = useState({ isOpen: false, message: '', onConfirm: () => {} })
   const [alertModal, setAlertModal] = useState({ isOpen: false, title: '', message: '', type: 'info' })
 
-  const { data: stats, isLoading: statsLoading } = useQuery({
+  // Stats and schema progress come from one dashboard snapshot
+  const { data: dashboard, isLoading: statsLoading } = useQuery({
     queryKey: ['stats'],
-    queryFn: descriptionService.getStats,
+    queryFn: descriptionService.getDashboard,
     refetchInterval: 10000, // Refresh every 10s
   })
-
-  const { data: schemaProgress } = useQuery({
-    queryKey: ['schema-progress'],
-    queryFn: descriptionService.getSchemaProgress,
-  })
+  const stats = dashboard
+  const schemaProgress = dashboard
 
   if (statsLoading) {
     return (
@@ -5,11 +5,15 @@ import { Sparkles, Database, Loader, CheckCircle, AlertCircle, Shield, Table as
 import { descriptionService } from '../services/api'
 import { ConfirmModal, AlertModal } from '../components/Modal'
 
+const TERMINAL_JOB_STATES = ['COMPLETED', 'FAILED', 'CANCELLED']
+
 export default function Generate() {
   const [catalog, setCatalog] = useState('')
   const [schema, setSchema] = useState('')
   const [selectedTables, setSelectedTables] = useState([])
   const [results, setResults] = useState(null)
+  const [jobId, setJobId] = useState(null)
+  const [incremental, setIncremental] = useState(false)
   const [permissions, setPermissions] = useState(null)
   const [confirmModal, setConfirmModal] = useState({ isOpen: false, message: '', onConfirm: () => {} })
   const [alertModal, setAlertModal] = useState({ isOpen: false, title: '', message: '', type: 'info' })
@@ -49,14 +53,49 @@ export default function Generate() {
     }
   }, [catalog, schema])
 
-  // Generate mutation
+  // Generate mutation - starts a background job
   const generateMutation = useMutation({
     mutationFn: (params) => descriptionService.generate(params),
     onSuccess: (data) => {
-      setResults(data.results)
+      setJobId(data.job_id)
+    },
+  })
+
+  // Stream job progress; EventSource reconnects and resumes from the last event id
+  const [job, setJob] = useState(null)
+  const [liveItems, setLiveItems] = useState([])
+
+  useEffect(() => {
+    if (!jobId) return
+    setJob(null)
+    setLiveItems([])
+    const source = new EventSource(`/api/jobs/${jobId}/events`)
+    const updateProgress = (progress) => setJob(prev => prev && { ...prev, progress })
+
+    source.addEventListener('status', (e) => setJob(JSON.parse(e.data)))
+    source.addEventListener('item', (e) => {
+      const item = JSON.parse(e.data)
+      updateProgress(item.progress)
+      setLiveItems(prev => [item, ...prev].slice(0, 20))
+    })
+    source.addEventListener('table', (e) => updateProgress(JSON.parse(e.data).progress))
+    source.addEventListener('done', async (e) => {
+      source.close()
+      setJob(JSON.parse(e.data))
+      // The final job snapshot carries the result items
+      const data = await descriptionService.getJob(jobId)
+      setResults({ ...data.job.results, status: data.job.status, error: data.job.error })
       queryClient.invalidateQueries(['stats'])
       queryClient.invalidateQueries(['pending-reviews'])
-    },
+    })
+
+    return () => source.close()
+  }, [jobId])
+
+  const jobRunning = !!jobId && !TERMINAL_JOB_STATES.includes(job?.status)
+
+  const cancelMutation = useMutation({
+    mutationFn: () => descriptionService.cancelJob(jobId),
   })
 
   const handleCatalogChange = (newCatalog) => {
@@ -124,6 +163,8 @@ export default function Generate() {
       catalog,
       schema,
       tables: selectedTables,
+      incremental,
+      background: true,
     }
 
     setConfirmModal({
@@ -131,6 +172,7 @@ export default function Generate() {
       message: `Generate descriptions for ${selectedTables.length} selected table(s)?`,
       onConfirm: () => {
         setResults(null)
+        setJobId(null)
         generateMutation.mutate(params)
       }
     })
@@ -327,17 +369,32 @@ export default function Generate() {
             </div>
           )}
 
+          <label className="flex items-center mt-6 text-gray-700 cursor-pointer">
+            <input
+              type="checkbox"
+              checked={incremental}
+              onChange={(e) => setIncremental(e.target.checked)}
+              className="w-4 h-4 text-databricks-red rounded focus:ring-2 focus:ring-databricks-red"
+            />
+            <span className="ml-2 text-sm">
+              Skip unchanged tables and columns (only generate what is new or changed since the last run)
+            </span>
+          </label>
+
           <motion.button
             whileHover={{ scale: 1.02 }}
             whileTap={{ scale: 0.98 }}
             onClick={handleGenerate}
-            disabled={generateMutation.isPending || !canGenerate || selectedTables.length === 0}
-            className="w-full btn btn-primary flex items-center justify-center space-x-2 py-4 text-lg mt-6"
+            disabled={generateMutation.isPending || jobRunning || !canGenerate || selectedTables.length === 0}
+            className="w-full btn btn-primary flex items-center justify-center space-x-2 py-4 text-lg mt-4"
           >
-            {generateMutation.isPending ? (
+            {generateMutation.isPending || jobRunning ? (
               <>
                 <Loader className="w-5 h-5 animate-spin" />
-                <span>Generating...</span>
+                <span>
+                  Generating...
+                  {job && ` (${job.progress.tables_done}/${job.progress.tables_total} tables)`}
+                </span>
               </>
             ) : (
               <>
@@ -346,6 +403,38 @@ export default function Generate() {
               </>
             )}
           </motion.button>
+
+          {jobRunning && job && (
+            <div className="mt-4 p-4 bg-purple-50 border border-purple-200 rounded-lg">
+              <div className="flex items-center justify-between mb-2">
+                <p className="text-purple-900">
+                  <strong>{job.progress.generated}</strong> generated, <strong>{job.progress.errors}</strong> errors
+                </p>
+                <button
+                  onClick={() => cancelMutation.mutate()}
+                  disabled={cancelMutation.isPending}
+                  className="btn btn-secondary text-sm"
+                >
+                  Cancel
+                </button>
+              </div>
+              <div className="w-full bg-purple-100 rounded-full h-2">
+                <div
+                  className="bg-purple-600 h-2 rounded-full transition-all"
+                  style={{ width: `${job.progress.tables_total ? (100 * job.progress.tables_done) / job.progress.tables_total : 0}%` }}
+                />
+              </div>
+              {liveItems.length > 0 && (
+                <ul className="mt-3 space-y-1 max-h-48 overflow-y-auto text-sm">
+                  {liveItems.map((item, idx) => (
+                    <li key={idx} className="text-purple-900 truncate">
+                      <span className="font-mono">{item.path}</span>: {item.description}
+                    </li>
+                  ))}
+                </ul>
+              )}
+            </div>
+          )}
         </div>
       )}
 
@@ -374,7 +463,10 @@ export default function Generate() {
         >
           <div className="flex items-center space-x-3 mb-6">
             <CheckCircle className="w-8 h-8 text-green-600" />
-            <h3 className="text-2xl font-bold text-gray-900">Generation Complete</h3>
+            <h3 className="text-2xl font-bold text-gray-900">
+              {results.status === 'CANCELLED' ? 'Generation Cancelled' :
+               results.status === 'FAILED' ? `Generation Failed: ${results.error}` : 'Generation Complete'}
+            </h3>
           </div>
 
           <div className="grid grid-cols-2 md:grid-cols-4 gap-4 mb-6">
@@ -396,6 +488,12 @@ export default function Generate() {
             </div>
           </div>
 
+          {results.skipped > 0 && (
+            <p className="text-sm text-gray-600 mb-6">
+              {results.skipped} unchanged table/column description(s) skipped
+            </p>
+          )}
+
           {results.items && results.items.length > 0 && (
             <div>
               <h4 className="font-bold text-gray-900 mb-3">Sample Generated Descriptions</h4>
@@ -193,18 +193,30 @@ const ReviewCard = ({ item, onReview, isSubmitting, isProcessingItem, onShowAler
 }
 
 export default function Review() {
-  const [page, setPage] = useState(1)
+  // Keyset paging: cursors[i] fetches page i + 1, so "Previous" pops a cursor
+  const [cursors, setCursors] = useState([null])
   const [filterType, setFilterType] = useState('ALL')
   const [processingItemId, setProcessingItemId] = useState(null)
   const [confirmModal, setConfirmModal] = useState({ isOpen: false, message: '', onConfirm: () => {} })
   const [alertModal, setAlertModal] = useState({ isOpen: false, title: '', message: '', type: 'info' })
   const queryClient = useQueryClient()
 
+  const cursor = cursors[cursors.length - 1]
+  const page = cursors.length
+  const pendingKey = ['pending-reviews', filterType, cursor]
+
   const { data, isLoading, refetch } = useQuery({
-    queryKey: ['pending-reviews', page],
-    queryFn: () => descriptionService.getPendingReviews(page, 20),
+    queryKey: pendingKey,
+    queryFn: () => descriptionService.getPendingReviews(
+      cursor, 20, filterType === 'ALL' ? {} : { object_type: filterType }
+    ),
   })
 
+  const changeFilter = (type) => {
+    setFilterType(type)
+    setCursors([null])
+  }
+
   const reviewMutation = useMutation({
     mutationFn: ({ id, status, description, reviewer }) =>
       descriptionService.updateReview(id, {
@@ -220,10 +232,10 @@ export default function Review() {
       await queryClient.cancelQueries(['pending-reviews'])
 
       // Snapshot previous value
-      const previousData = queryClient.getQueryData(['pending-reviews', page])
+      const previousData = queryClient.getQueryData(pendingKey)
 
       // Optimistically update - remove item from list
-      queryClient.setQueryData(['pending-reviews', page], (old) => ({
+      queryClient.setQueryData(pendingKey, (old) => ({
         ...old,
         pending: old?.pending?.filter(item => item.id !== id) || []
       }))
@@ -232,7 +244,7 @@ export default function Review() {
     },
     onError: (err, variables, context) => {
       // Rollback on error
-      queryClient.setQueryData(['pending-reviews', page], context.previousData)
+      queryClient.setQueryData(pendingKey, context.previousData)
       setProcessingItemId(null)
     },
     onSuccess: () => {
@@ -258,10 +270,8 @@ export default function Review() {
     )
   }
 
-  const items = data?.pending || []
-  const filteredItems = filterType === 'ALL'
-    ? items
-    : items.filter(item => item.object_type === filterType)
+  // Filtering happens on the server
+  const filteredItems = data?.pending || []
 
   return (
     <div className="space-y-6">
@@ -305,7 +315,7 @@ export default function Review() {
               {['ALL', 'TABLE', 'COLUMN'].map((type) => (
                 <button
                   key={type}
-                  onClick={() => setFilterType(type)}
+                  onClick={() => changeFilter(type)}
                   className={`
                     px-4 py-2 rounded-lg font-medium transition-all
                     ${filterType === type
@@ -321,7 +331,7 @@ export default function Review() {
           </div>
 
           <div className="text-right">
-            <p className="text-3xl font-bold text-gray-900">{filteredItems.length}</p>
+            <p className="text-3xl font-bold text-gray-900">{data?.total_estimate ?? filteredItems.length}</p>
             <p className="text-sm text-gray-500">Items pending review</p>
           </div>
         </div>
@@ -352,10 +362,10 @@ export default function Review() {
           </div>
 
           {/* Pagination */}
-          {items.length === 20 && (
+          {(data?.has_more || page > 1) && (
             <div className="flex items-center justify-center space-x-4">
               <button
-                onClick={() => setPage(Math.max(1, page - 1))}
+                onClick={() => setCursors(cursors.slice(0, -1))}
                 disabled={page === 1}
                 className="btn btn-secondary flex items-center space-x-2 disabled:opacity-50"
               >
@@ -366,8 +376,9 @@ export default function Review() {
               <span className="text-gray-600">Page {page}</span>
 
               <button
-                onClick={() => setPage(page + 1)}
-                className="btn btn-secondary flex items-center space-x-2"
+                onClick={() => setCursors([...cursors, data.next_cursor])}
+                disabled={!data?.has_more}
+                className="btn btn-secondary flex items-center space-x-2 disabled:opacity-50"
               >
                 <span>Next</span>
                 <ChevronRight className="w-4 h-4" />
@@ -32,9 +32,13 @@ export const descriptionService = {
   // Generation
   generate: (params) => api.post('/generate', params),
 
+  getJob: (jobId) => api.get(`/jobs/${jobId}`),
+
+  cancelJob: (jobId) => api.post(`/jobs/${jobId}/cancel`),
+
   // Review
-  getPendingReviews: (page = 1, perPage = 20) =>
-    api.get(`/pending?page=${page}&per_page=${perPage}`),
+  getPendingReviews: (cursor = null, perPage = 20, filters = {}) =>
+    api.get('/pending', { params: { cursor, per_page: perPage, ...filters } }),
 
   updateReview: (id, data) => api.post(`/review/${id}`, data),
 
@@ -44,6 +48,8 @@ export const descriptionService = {
   applyDescriptions: () => api.post('/apply'),
 
   // Statistics
+  getDashboard: () => api.get('/dashboard'),
+
   getStats: () => api.get('/stats'),
 
   getSchemaProgress: () => api.get('/schema-progress'),
@@ -51,6 +57,9 @@ export const descriptionService = {
   getReviewActivity: () => api.get('/review-activity'),
 
   getCoverage: (catalog) => api.get(`/coverage?catalog=${catalog}`),
+
+  // Export (streamed download, so a plain link rather than an axios call)
+  exportUrl: (params = {}) => `/api/export?${new URLSearchParams({ format: 'csv', ...params })}`,
 }
 
 export default api
@@ -17,11 +17,18 @@ CREATE TABLE IF NOT EXISTS main.governance.description_governance (
     reviewed_at TIMESTAMP,
     applied_at TIMESTAMP,
     model_used STRING COMMENT 'Model endpoint used for generation',
-    metadata STRING COMMENT 'JSON metadata'
+    metadata STRING COMMENT 'JSON metadata',
+    confidence_score DOUBLE COMMENT 'AI confidence 0-1',
+    schema_fingerprint STRING COMMENT 'Hash of the table column names and types at generation time'
 )
 TBLPROPERTIES ('delta.feature.allowColumnDefaults' = 'supported')
 COMMENT 'Tracks AI-generated descriptions and their review status';
 
+-- Upgrading an existing governance table (needed for incremental generation and similarity suggestions):
+-- ALTER TABLE main.governance.description_governance
+--   ADD COLUMNS (confidence_score DOUBLE COMMENT 'AI confidence 0-1',
+--                schema_fingerprint STRING COMMENT 'Hash of the table column names and types at generation time');
+
 -- NOTE: Grant permissions to the Service Principal manually
 -- Replace <SERVICE_PRINCIPAL_ID> with your app's service principal client ID
 --
@@ -0,0 +1,47 @@
+"""Shared fixtures: app.main imported without a workspace, SQL captured instead of run"""
+
+import os
+import sys
+
+# app.main validates its configuration at import time
+os.environ.setdefault('FLASK_SECRET_KEY', 'test-secret-key')
+os.environ.setdefault('WAREHOUSE_ID', 'test-warehouse')
+os.environ.setdefault('LLM_CACHE_ENABLED', 'false')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from app import main
+
+
+class FakeSQL:
+    """Records statements and answers them from a list of (substring, rows) pairs"""
+
+    def __init__(self):
+        self.queries = []
+        self.responses = []
+
+    def respond(self, needle, rows):
+        self.responses.append((needle, rows))
+
+    def __call__(self, query, *args, **kwargs):
+        self.queries.append(query)
+        for needle, rows in self.responses:
+            if needle in query:
+                return rows
+        return []
+
+
+@pytest.fixture
+def sql():
+    return FakeSQL()
+
+
+@pytest.fixture
+def service(monkeypatch, sql):
+    """DescriptionService with no workspace client, whose statements go to `sql`"""
+    monkeypatch.setattr(main, 'get_workspace_client', lambda: None)
+    svc = main.DescriptionService()
+    monkeypatch.setattr(svc, 'execute_sql', sql)
+    monkeypatch.setattr(svc, 'iter_sql', lambda query, *args, **kwargs: iter(sql(query)))
+    return svc
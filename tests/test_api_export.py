@@ -0,0 +1,48 @@
+from decimal import Decimal
+
+import pytest
+
+from app import main
+
+
+@pytest.fixture
+def client(monkeypatch, service):
+    monkeypatch.setattr(main, 'get_service', lambda: service)
+    return main.app.test_client()
+
+
+@pytest.mark.parametrize('query', [
+    'format=xml',
+    'status=DONE',
+    'time_column=created_at',
+    'since=yesterday',
+])
+def test_bad_filters_are_client_errors(client, query):
+    response = client.get(f'/api/export?{query}')
+
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
+
+
+def test_query_failures_are_server_errors(client, service, monkeypatch):
+    def fail(*args, **kwargs):
+        raise Exception('Query failed: warehouse stopped')
+
+    monkeypatch.setattr(service, '_governance_has_column', lambda column: False)
+    monkeypatch.setattr(service, '_run_statement', fail)
+
+    response = client.get('/api/export')
+
+    assert response.status_code == 500
+
+
+def test_jsonl_rows_are_streamed(client, service, monkeypatch):
+    monkeypatch.setattr(service, '_governance_has_column', lambda column: False)
+    monkeypatch.setattr(service, '_run_statement', lambda *args, **kwargs: None)
+    monkeypatch.setattr(service, '_iter_statement_rows',
+                        lambda statement: iter([{'id': 1, 'score': Decimal('0.10')}]))
+
+    response = client.get('/api/export?format=jsonl&status=approved')
+
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == '{"id": 1, "score": "0.10"}\n'
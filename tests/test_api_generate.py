@@ -0,0 +1,78 @@
+import pytest
+
+from app import main
+
+
+class StubService:
+    def check_permissions(self, catalog, schema, table=None):
+        return {'can_select': True, 'can_modify': True, 'errors': []}
+
+    def get_tables_for_generation(self, catalog, schema=None):
+        return [{'table_catalog': catalog, 'table_schema': schema, 'table_name': 'orders'}]
+
+
+class StubJobManager:
+    """Keeps submitted jobs without running them; `finish` decides their outcome"""
+
+    def __init__(self, finish=None):
+        self.finish = finish
+        self.jobs = []
+
+    def submit(self, job):
+        self.jobs.append(job)
+        if self.finish:
+            self.finish(job)
+        return job
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(main, 'get_service', lambda: StubService())
+    monkeypatch.setattr(main, 'GENERATE_SYNC_WAIT_SECONDS', 0.05)
+    return main.app.test_client()
+
+
+def test_background_returns_the_job_id_immediately(client, monkeypatch):
+    manager = StubJobManager()
+    monkeypatch.setattr(main, 'get_job_manager', lambda: manager)
+
+    response = client.post('/api/generate', json={'catalog': 'main', 'schema': 'sales', 'background': True})
+
+    assert response.status_code == 202
+    assert response.get_json()['job_id'] == manager.jobs[0].id
+
+
+def test_synchronous_wait_is_bounded(client, monkeypatch):
+    manager = StubJobManager()
+    monkeypatch.setattr(main, 'get_job_manager', lambda: manager)
+
+    response = client.post('/api/generate', json={'catalog': 'main', 'schema': 'sales'})
+    body = response.get_json()
+
+    # Older clients show any 2xx as a finished run
+    assert response.status_code == 504
+    assert body['success'] is False
+    assert body['job_id'] == manager.jobs[0].id
+    assert body['status'] == 'QUEUED'
+    assert manager.jobs[0].id in body['error']
+    assert 'results' in body
+
+
+def test_finished_job_returns_its_results(client, monkeypatch):
+    monkeypatch.setattr(main, 'get_job_manager', lambda: StubJobManager(finish=lambda job: job.finish()))
+
+    response = client.post('/api/generate', json={'catalog': 'main', 'schema': 'sales'})
+
+    assert response.status_code == 200
+    assert response.get_json()['success'] is True
+    assert 'results' in response.get_json()
+
+
+def test_failed_job_returns_its_error(client, monkeypatch):
+    monkeypatch.setattr(main, 'get_job_manager',
+                        lambda: StubJobManager(finish=lambda job: job.finish(error='warehouse stopped')))
+
+    response = client.post('/api/generate', json={'catalog': 'main', 'schema': 'sales'})
+
+    assert response.status_code == 500
+    assert response.get_json()['error'] == 'warehouse stopped'
@@ -0,0 +1,95 @@
+import pytest
+
+from app import main
+
+
+def approved(record_id, column=None, table='orders', description='Desc'):
+    return {
+        'id': record_id,
+        'object_type': 'COLUMN' if column else 'TABLE',
+        'catalog_name': 'main',
+        'schema_name': 'sales',
+        'table_name': table,
+        'column_name': column,
+        'approved_description': description,
+        'reviewer': 'ana',
+    }
+
+
+@pytest.fixture
+def failing(service, sql, monkeypatch):
+    """Make statements containing any of the returned set's substrings fail"""
+    needles = set()
+
+    def execute(query, *args, **kwargs):
+        if any(needle in query for needle in needles):
+            sql.queries.append(query)
+            raise Exception('Query failed: not supported')
+        return sql(query, *args, **kwargs)
+
+    monkeypatch.setattr(service, 'execute_sql', execute)
+    return needles
+
+
+def statements(sql, keyword):
+    return [' '.join(q.split()) for q in sql.queries if keyword in q]
+
+
+def test_columns_of_a_table_are_applied_in_one_alter(service, sql):
+    sql.respond("review_status = 'APPROVED' AND applied_at IS NULL", [
+        approved(1),
+        approved(2, 'email', description="Buyer's email"),
+        approved(3, 'total'),
+        approved(4, 'email', description='Newer email'),
+    ])
+
+    result = service.apply_approved_descriptions()
+
+    assert statements(sql, 'COMMENT ON TABLE') == ["COMMENT ON TABLE main.sales.orders IS 'Desc'"]
+    assert statements(sql, 'ALTER TABLE') == [
+        "ALTER TABLE main.sales.orders ALTER COLUMN email COMMENT 'Newer email', total COMMENT 'Desc'"
+    ]
+    assert statements(sql, 'COMMENT ON COLUMN') == []
+    assert statements(sql, "SET review_status = 'APPLIED'") == [
+        f"UPDATE {main.GOVERNANCE_TABLE} SET review_status = 'APPLIED', applied_at = current_timestamp() "
+        f"WHERE id IN (1, 2, 4, 3)"
+    ]
+    assert result['applied_count'] == 4
+    assert result['errors'] == []
+
+
+def test_a_failed_alter_falls_back_to_one_comment_per_column(service, sql, failing):
+    sql.respond("review_status = 'APPROVED' AND applied_at IS NULL", [
+        approved(1, 'email'), approved(2, 'total'), approved(3, 'status'),
+    ])
+    failing.update({'ALTER TABLE', 'orders.total'})
+
+    result = service.apply_approved_descriptions()
+
+    assert statements(sql, 'COMMENT ON COLUMN') == [
+        "COMMENT ON COLUMN main.sales.orders.email IS 'Desc'",
+        "COMMENT ON COLUMN main.sales.orders.total IS 'Desc'",
+        "COMMENT ON COLUMN main.sales.orders.status IS 'Desc'",
+    ]
+    assert statements(sql, "SET review_status = 'APPLIED'")[0].endswith('WHERE id IN (1, 3)')
+    assert result['applied_count'] == 2
+    assert len(result['errors']) == 1
+    assert 'main.sales.orders' in result['errors'][0]
+
+
+def test_applied_records_are_marked_in_batches(service, sql, failing, monkeypatch):
+    monkeypatch.setattr(main, 'APPLY_MARK_BATCH_SIZE', 2)
+    sql.respond("review_status = 'APPROVED' AND applied_at IS NULL", [
+        approved(record_id, table=f't{record_id}') for record_id in range(1, 6)
+    ])
+    failing.add('WHERE id IN (3, 4)')
+
+    result = service.apply_approved_descriptions()
+
+    updates = statements(sql, "SET review_status = 'APPLIED'")
+    assert [update.split('WHERE ')[1] for update in updates] == ['id IN (1, 2)', 'id IN (3, 4)', 'id IN (5)']
+    assert result['applied_count'] == 3
+    assert result['unmarked_count'] == 2
+    assert result['errors'] == [
+        "Applied to UC but failed to mark 2 records (ids 3-4) as APPLIED: Query failed: not supported"
+    ]
@@ -0,0 +1,142 @@
+from app import main
+
+
+def columns(*specs):
+    return [{'column_name': name, 'data_type': data_type} for name, data_type in specs]
+
+
+def members_by_name(clusters):
+    return {key[0]: sorted(m['table'] for m in members) for key, members in clusters.items()}
+
+
+def test_normalize_column_name():
+    normalize = main.DescriptionService.normalize_column_name
+
+    assert normalize('CustomerID') == 'customer_id'
+    assert normalize('customer-id') == 'customer_id'
+    assert normalize(' customer_id ') == 'customer_id'
+    assert normalize('__Customer__Id__') == 'customer_id'
+
+
+def test_generic_names():
+    generic = main.DescriptionService.is_generic_column_name
+
+    assert generic('id')
+    assert generic('CreatedAt')
+    assert generic('status_code')
+    assert not generic('customer_id')
+    assert not generic('email')
+
+
+def test_generic_names_only_cluster_between_related_tables(service):
+    clusters = service.cluster_columns({
+        ('s', 'orders'): columns(('id', 'int'), ('status', 'string'), ('customer_id', 'int')),
+        ('s', 'order_items'): columns(('id', 'int'), ('Status', 'string')),
+        ('s', 'customers'): columns(('id', 'int'), ('CustomerID', 'int'), ('status', 'string')),
+        ('s', 'vehicles'): columns(('id', 'int')),
+    })
+
+    assert members_by_name(clusters) == {
+        'id': ['order_items', 'orders'],
+        'status': ['order_items', 'orders'],
+        'customer_id': ['customers', 'orders'],
+    }
+
+
+def test_clusters_need_matching_types_and_skip_documented_columns(service):
+    clusters = service.cluster_columns({
+        ('s', 'orders'): columns(('customer_id', 'int'), ('email', 'string')),
+        ('s', 'invoices'): [{'column_name': 'customer_id', 'data_type': 'bigint'},
+                            {'column_name': 'email', 'data_type': 'string', 'comment': 'Documented'}],
+    })
+
+    assert clusters == {}
+
+
+def test_approved_lookup_matches_normalized_names(service, sql):
+    sql.respond('review_status IN', [
+        {'catalog_name': 'main', 'schema_name': 's', 'table_name': 'invoices', 'column_name': 'CustomerID',
+         'column_data_type': 'INT', 'description': 'Customer reference'},
+        {'catalog_name': 'main', 'schema_name': 's', 'table_name': 'invoices', 'column_name': 'customer_id',
+         'column_data_type': 'int', 'description': 'Older description'},
+    ])
+
+    approved = service.get_approved_column_descriptions(['Customer-Id'])
+
+    assert "IN ('customer_id')" in sql.queries[0]
+    assert "regexp_replace" in sql.queries[0]
+    assert approved == {('customer_id', 'int'): [{'table_name': 'invoices', 'description': 'Customer reference'}]}
+
+
+def test_approved_generic_description_needs_a_related_table(service, sql, monkeypatch):
+    sql.respond('review_status IN', [
+        {'catalog_name': 'main', 'schema_name': 's', 'table_name': 'customers', 'column_name': 'status',
+         'column_data_type': 'string', 'description': 'Customer account status'},
+    ])
+    monkeypatch.setattr(service, 'suggest_description', lambda *args: None)
+    monkeypatch.setattr(service, 'call_ai_function_batch',
+                        lambda prompts, use_cache=True: {key: 'Order status' for key in prompts})
+
+    shared = service.describe_shared_columns('main', {
+        ('s', 'orders'): columns(('status', 'string')),
+        ('s', 'order_items'): columns(('status', 'string')),
+    })
+
+    assert shared[('s', 'orders')]['status'] == {'description': 'Order status', 'model_used': None}
+    assert shared[('s', 'order_items')]['status']['description'] == 'Order status'
+
+
+def test_approved_description_is_reused_for_a_related_table(service, sql, monkeypatch):
+    sql.respond('review_status IN', [
+        {'catalog_name': 'main', 'schema_name': 's', 'table_name': 'order_history', 'column_name': 'status',
+         'column_data_type': 'string', 'description': 'Order status'},
+    ])
+    monkeypatch.setattr(service, 'call_ai_function_batch', lambda prompts, use_cache=True: {})
+
+    shared = service.describe_shared_columns('main', {
+        ('s', 'orders'): columns(('status', 'string')),
+        ('s', 'order_items'): columns(('status', 'string')),
+    })
+
+    assert shared[('s', 'orders')]['status'] == {'description': 'Order status',
+                                                 'model_used': main.APPROVED_REUSE_MODEL}
+
+
+def test_similarity_suggestions_are_checked_per_member(service, monkeypatch):
+    suggestions = {'orders': ('Order customer', 0.9)}
+    monkeypatch.setattr(service, 'get_approved_column_descriptions', lambda names: {})
+    monkeypatch.setattr(service, 'suggest_description',
+                        lambda column, data_type, table: suggestions.get(table))
+    sent = []
+
+    def generate(prompts, use_cache=True):
+        sent.append(prompts)
+        return {key: 'Generated customer reference' for key in prompts}
+
+    monkeypatch.setattr(service, 'call_ai_function_batch', generate)
+
+    shared = service.describe_shared_columns('main', {
+        ('s', 'orders'): columns(('customer_id', 'int')),
+        ('s', 'invoices'): columns(('customer_id', 'int')),
+        ('s', 'payments'): columns(('customer_id', 'int')),
+    })
+
+    assert shared[('s', 'orders')]['customer_id']['model_used'] == main.SIMILARITY_INDEX_MODEL
+    assert shared[('s', 'invoices')]['customer_id']['description'] == 'Generated customer reference'
+    assert shared[('s', 'payments')]['customer_id']['description'] == 'Generated customer reference'
+    assert 'orders' not in list(sent[0].values())[0]
+
+
+def test_prefetch_keeps_only_the_run_tables(service, sql):
+    sql.respond('information_schema.columns', [
+        {'table_schema': 'bronze', 'table_name': 'orders', 'column_name': 'id', 'data_type': 'int', 'comment': None},
+        {'table_schema': 'gold', 'table_name': 'orders', 'column_name': 'id', 'data_type': 'int', 'comment': None},
+        {'table_schema': 'gold', 'table_name': 'customers', 'column_name': 'id', 'data_type': 'int', 'comment': None},
+    ])
+
+    columns_by_table = service.prefetch_columns('main', None, [('bronze', 'orders'), ('gold', 'customers')])
+
+    assert sorted(columns_by_table) == [('bronze', 'orders'), ('gold', 'customers')]
+    assert "table_schema IN ('bronze', 'gold')" in sql.queries[0]
+    assert "table_name IN ('customers', 'orders')" in sql.queries[0]
+    assert service.cluster_columns({key: columns_by_table[key] for key in [('bronze', 'orders')]}) == {}
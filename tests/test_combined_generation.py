@@ -0,0 +1,69 @@
+import json
+
+from app import main
+
+parse = main.DescriptionService.parse_combined_response
+
+
+def test_parses_table_and_requested_columns():
+    response = json.dumps({'table': ' Customer orders. ', 'columns': {'id': 'Order id', 'total': 'Order total'}})
+
+    assert parse(response, ['id', 'total'], True) == ('Customer orders.', {'id': 'Order id', 'total': 'Order total'})
+
+
+def test_strips_code_fences_and_surrounding_text():
+    response = 'Here you go:\n```json\n{"columns": {"id": "Order id"}}\n```'
+
+    assert parse(response, ['id'], False) == (None, {'id': 'Order id'})
+
+
+def test_column_names_match_case_insensitively_and_keep_the_requested_case():
+    response = json.dumps({'columns': {'CUSTOMERID': 'Customer reference'}})
+
+    assert parse(response, ['CustomerId'], False) == (None, {'CustomerId': 'Customer reference'})
+
+
+def test_unrequested_empty_and_non_string_values_are_dropped():
+    response = json.dumps({'columns': {'id': 'Order id', 'extra': 'Not asked for', 'total': '  ',
+                                       'status': ['open']}})
+
+    assert parse(response, ['id', 'total', 'status'], False) == (None, {'id': 'Order id'})
+
+
+def test_table_description_only_when_requested():
+    response = json.dumps({'table': 'Customer orders.', 'columns': {}})
+
+    assert parse(response, [], False) == (None, {})
+
+
+def test_truncated_response_keeps_complete_pairs():
+    response = '{"table": "Customer orders.", "columns": {"id": "Order \\"id\\"", "total": "Order tot'
+
+    assert parse(response, ['id', 'total'], True) == ('Customer orders.', {'id': 'Order "id"'})
+
+
+def test_errors_and_empty_responses_yield_nothing():
+    assert parse('ERROR: 429 Too Many Requests', ['id'], True) == (None, {})
+    assert parse('', ['id'], True) == (None, {})
+    assert parse('no json here', ['id'], True) == (None, {})
+
+
+def test_missing_columns_are_retried_individually(service, monkeypatch):
+    columns = [{'column_name': 'id', 'data_type': 'int'}, {'column_name': 'total', 'data_type': 'double'}]
+    metadata = {'columns': columns, 'sample_data': []}
+    monkeypatch.setattr(service, 'call_ai_function_batch', lambda prompts, use_cache=True: {
+        key: json.dumps({'table': 'Customer orders.', 'columns': {'id': 'Order id'}}) for key in prompts
+    })
+    retried = []
+
+    def generate_columns(catalog, schema, table, missing, sample_data, use_cache=True):
+        retried.extend(col['column_name'] for col in missing)
+        return {col['column_name']: 'Order total' for col in missing}
+
+    monkeypatch.setattr(service, 'generate_column_descriptions', generate_columns)
+
+    table_desc, col_descs = service.generate_combined_descriptions('main', 'sales', 'orders', columns, metadata)
+
+    assert table_desc == 'Customer orders.'
+    assert col_descs == {'id': 'Order id', 'total': 'Order total'}
+    assert retried == ['total']
@@ -0,0 +1,84 @@
+
+def dashboard_rows():
+    return [
+        {'grouping_set': 'overall', 'schema_name': None, 'reviewer': None, 'review_status': None, 'total': 3,
+         'pending': 2, 'approved': 1, 'rejected': 0, 'applied': 0, 'tables': 1, 'columns': 2,
+         'first_review': None, 'last_review': None},
+        {'grouping_set': 'schema', 'schema_name': 'sales', 'reviewer': None, 'review_status': None, 'total': 3,
+         'pending': 2, 'approved': 1, 'rejected': 0, 'applied': 0, 'tables': 1, 'columns': 2,
+         'first_review': None, 'last_review': None},
+    ]
+
+
+def test_snapshot_is_reused_and_updated_by_generated_rows(service, sql):
+    sql.respond('GROUPING SETS', dashboard_rows())
+    assert service.get_dashboard()['stats']['pending'] == 2
+
+    service._update_dashboard([(None, {'schema_name': 'sales', 'object_type': 'COLUMN',
+                                       'review_status': 'PENDING'})])
+    dashboard = service.get_dashboard()
+
+    assert len(sql.queries) == 1
+    assert dashboard['stats']['pending'] == 3
+    assert dashboard['schema_progress'][0]['pending'] == 3
+
+
+def test_reviews_of_listed_rows_update_the_snapshot_in_place(service, sql):
+    sql.respond('GROUPING SETS', dashboard_rows())
+    sql.respond("review_status = 'PENDING'", [
+        {'id': 7, 'schema_name': 'sales', 'object_type': 'COLUMN', 'review_status': 'PENDING', 'reviewer': None},
+        {'id': 8, 'schema_name': 'sales', 'object_type': 'COLUMN', 'review_status': 'PENDING', 'reviewer': None},
+    ])
+    service.get_dashboard()
+    service.get_pending_reviews()
+
+    service.update_review_statuses([{'id': 7, 'status': 'APPROVED', 'reviewer': 'ana'},
+                                    {'id': 8, 'status': 'REJECTED', 'reviewer': 'ana'}])
+    dashboard = service.get_dashboard()
+
+    assert sum('GROUPING SETS' in query for query in sql.queries) == 1
+    assert dashboard['stats']['pending'] == 0
+    assert dashboard['stats']['approved'] == 2
+    assert dashboard['stats']['rejected'] == 1
+    assert dashboard['schema_progress'][0]['pending'] == 0
+    assert {(row['reviewer'], row['review_status'], row['count']) for row in dashboard['activity']} == {
+        ('ana', 'APPROVED', 1), ('ana', 'REJECTED', 1)
+    }
+    assert all(row['last_review'] for row in dashboard['activity'])
+
+
+def test_a_second_review_moves_the_row_from_its_new_status(service, sql):
+    sql.respond('GROUPING SETS', dashboard_rows())
+    sql.respond("review_status = 'PENDING'", [
+        {'id': 7, 'schema_name': 'sales', 'object_type': 'COLUMN', 'review_status': 'PENDING', 'reviewer': None},
+    ])
+    service.get_pending_reviews()
+    service.get_dashboard()
+
+    service.update_review_status(7, 'APPROVED', None, 'ana')
+    service.update_review_status(7, 'REJECTED', None, 'ana')
+    stats = service.get_dashboard()['stats']
+
+    assert (stats['pending'], stats['approved'], stats['rejected']) == (1, 1, 1)
+
+
+def test_reviews_of_unlisted_rows_recompute_the_snapshot(service, sql):
+    sql.respond('GROUPING SETS', dashboard_rows())
+    service.get_dashboard()
+
+    service.update_review_statuses([{'id': 7, 'status': 'APPROVED', 'reviewer': 'ana'}])
+    service.get_dashboard()
+
+    assert sum('GROUPING SETS' in query for query in sql.queries) == 2
+
+
+def test_apply_updates_schema_progress_in_place(service, sql):
+    sql.respond('GROUPING SETS', dashboard_rows())
+    service.get_dashboard()
+
+    row = {'schema_name': 'sales', 'object_type': 'COLUMN', 'reviewer': 'ana'}
+    service._update_dashboard([(dict(row, review_status='APPROVED'), dict(row, review_status='APPLIED'))])
+    progress = service.get_dashboard()['schema_progress'][0]
+
+    assert sum('GROUPING SETS' in query for query in sql.queries) == 1
+    assert progress['completed'] == 1
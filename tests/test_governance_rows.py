@@ -0,0 +1,77 @@
+import pytest
+
+from app import main
+
+
+def test_row_escapes_quotes_in_every_string_value(service):
+    row = service._governance_row_sql('COLUMN', 'main', 'sales', 'orders', 'note', "map<string,string>",
+                                      "Customer's note; '); DROP TABLE x; --", fingerprint="ab'c",
+                                      model_used="model's")
+
+    assert row['ai_generated_description'] == "'Customer''s note; ''); DROP TABLE x; --'"
+    assert row['schema_fingerprint'] == "'ab''c'"
+    assert row['model_used'] == "'model''s'"
+    assert row['column_name'] == "'note'"
+    assert row['review_status'] == "'PENDING'"
+
+
+def test_table_row_uses_sql_nulls(service):
+    row = service._governance_row_sql('TABLE', 'main', 'sales', 'orders', None, None, 'Orders')
+
+    assert row['column_name'] == 'NULL'
+    assert row['column_data_type'] == 'NULL'
+    assert row['schema_fingerprint'] == 'NULL'
+    assert row['confidence_score'] == 'CAST(NULL AS DOUBLE)'
+    assert row['model_used'] == f"'{main.MODEL_ENDPOINT}'"
+
+
+def test_confidence_is_a_numeric_literal(service):
+    row = service._governance_row_sql('COLUMN', 'main', 'sales', 'orders', 'id', 'int', 'Id', confidence=0.91234567)
+
+    assert row['confidence_score'] == '0.9123'
+
+
+@pytest.mark.parametrize('field', ['catalog', 'schema', 'table', 'column'])
+def test_illegal_identifiers_are_rejected(service, field):
+    args = {'catalog': 'main', 'schema': 'sales', 'table': 'orders', 'column': 'id'}
+    args[field] = "orders'; DROP TABLE x"
+
+    with pytest.raises(ValueError):
+        service._governance_row_sql('COLUMN', args['catalog'], args['schema'], args['table'], args['column'],
+                                    'int', 'Id')
+
+
+def test_rows_are_inserted_with_one_statement(service, sql):
+    sql.respond('information_schema.columns', [])
+    rows = [service._governance_row_sql('COLUMN', 'main', 'sales', 'orders', f'c{i}', 'int', f'Column {i}')
+            for i in range(3)]
+
+    service._insert_governance_rows(rows)
+
+    inserts = [query for query in sql.queries if 'INSERT INTO' in query]
+    assert len(inserts) == 1
+    assert inserts[0].count("'Column ") == 3
+
+
+def test_insert_leaves_out_migration_columns_the_table_lacks(service, monkeypatch, sql):
+    monkeypatch.setattr(service, 'execute_sql_columns', lambda query: {'column_name': ['id']})
+    row = service._governance_row_sql('COLUMN', 'main', 'sales', 'orders', 'id', 'int', 'Id',
+                                      fingerprint='abc', confidence=0.5)
+
+    service._insert_governance_rows([row])
+
+    insert = sql.queries[-1]
+    for column in main.GOVERNANCE_MIGRATION_COLUMNS:
+        assert column not in insert
+    assert 'ai_generated_description' in insert
+
+
+def test_writer_flushes_when_the_buffer_is_full(service, monkeypatch):
+    batches = []
+    monkeypatch.setattr(service, '_insert_governance_rows', lambda rows: batches.append(len(rows)))
+
+    with service.governance_writer(max_rows=2, max_age_seconds=3600) as writer:
+        for i in range(5):
+            writer.add('COLUMN', 'main', 'sales', 'orders', f'c{i}', 'int', f'Column {i}')
+
+    assert batches == [2, 2, 1]
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from databricks.sdk.errors import NotFound
+
+
+def workspace(catalog_error=None):
+    def get_catalog(name):
+        if catalog_error:
+            raise catalog_error
+    return SimpleNamespace(
+        current_user=SimpleNamespace(me=lambda: SimpleNamespace(user_name='ana@example.com')),
+        catalogs=SimpleNamespace(get=get_catalog),
+        schemas=SimpleNamespace(get=lambda name: None),
+    )
+
+
+def test_granted_permissions_are_cached(service, sql):
+    service.w = workspace()
+
+    first = service.check_permissions('main', 'sales')
+    second = service.check_permissions('main', 'sales')
+
+    assert first['can_select'] and first['can_modify'] and not first['errors']
+    assert second == first
+    assert len(sql.queries) == 1
+
+
+def test_missing_grants_are_cached(service, sql):
+    service.w = workspace(catalog_error=NotFound('no catalog'))
+
+    service.check_permissions('main', 'sales')
+    permissions = service.check_permissions('main', 'sales')
+
+    assert not permissions['can_use_catalog']
+    assert len(sql.queries) == 1
+
+
+def test_transient_failures_are_checked_again(service, monkeypatch):
+    service.w = workspace()
+    calls = []
+
+    def execute_sql(query):
+        calls.append(query)
+        if len(calls) == 1:
+            raise TimeoutError('warehouse starting')
+        return []
+
+    monkeypatch.setattr(service, 'execute_sql', execute_sql)
+
+    denied = service.check_permissions('main', 'sales')
+    granted = service.check_permissions('main', 'sales')
+
+    assert not denied['can_select']
+    assert 'Cannot list tables' in denied['errors'][0]
+    assert granted['can_select'] and granted['can_modify']
+    assert len(calls) == 2
@@ -0,0 +1,91 @@
+from app import main
+
+
+def wide_columns(count):
+    return [{'column_name': f'column_{i:03d}', 'data_type': 'string'} for i in range(count)]
+
+
+def described(chunks):
+    return [col['column_name'] for chunk, _ in chunks for col in chunk]
+
+
+def test_sample_values_are_distinct_truncated_and_limited():
+    builder = main.PromptBuilder(sample_values=2, value_chars=10)
+
+    values = builder.format_values([None, 'a  b\nc', 'a b c', 'x' * 50, 'third'])
+
+    assert values == ['a b c', 'xxxxxxx...']
+
+
+def test_narrow_table_is_one_chunk_with_the_table_request():
+    builder = main.PromptBuilder(budget=1500)
+    columns = wide_columns(5)
+
+    chunks = builder.combined_prompts('main', 'sales', 'orders', columns)
+
+    assert len(chunks) == 1
+    assert described(chunks) == [col['column_name'] for col in columns]
+    assert '"table"' in chunks[0][1]
+
+
+def test_wide_table_is_split_without_dropping_columns():
+    builder = main.PromptBuilder(budget=300, chunk_columns=25)
+    columns = wide_columns(120)
+
+    chunks = builder.combined_prompts('main', 'sales', 'orders', columns)
+
+    assert len(chunks) > 1
+    assert described(chunks) == [col['column_name'] for col in columns]
+    assert all(len(chunk) <= 25 for chunk, _ in chunks)
+    assert '"table"' in chunks[0][1]
+    assert all('"table"' not in prompt for _, prompt in chunks[1:])
+    assert all(builder.count_tokens(prompt) <= builder.budget for _, prompt in chunks)
+
+
+def test_chunks_respect_the_column_limit():
+    builder = main.PromptBuilder(budget=100000, chunk_columns=10)
+
+    chunks = builder.combined_prompts('main', 'sales', 'orders', wide_columns(25), include_table=False)
+
+    assert [len(chunk) for chunk, _ in chunks] == [10, 10, 5]
+
+
+def test_table_only_prompt_when_no_columns_need_describing():
+    builder = main.PromptBuilder()
+
+    chunks = builder.combined_prompts('main', 'sales', 'orders', [], table_columns=wide_columns(3))
+
+    assert len(chunks) == 1
+    assert chunks[0][0] == []
+    assert 'has 3 columns' in chunks[0][1]
+
+
+def test_samples_are_dropped_before_columns_when_over_budget():
+    builder = main.PromptBuilder(budget=200, sample_values=3, value_chars=40)
+    columns = wide_columns(3)
+    samples = [{col['column_name']: 'v' * 40 for col in columns} for _ in range(3)]
+
+    chunks = builder.combined_prompts('main', 'sales', 'orders', columns, samples, include_table=False)
+
+    assert described(chunks) == [col['column_name'] for col in columns]
+    assert all(builder.count_tokens(prompt) <= builder.budget for _, prompt in chunks)
+
+
+def test_table_prompt_lists_columns_past_the_budget_by_name():
+    builder = main.PromptBuilder(budget=200)
+
+    prompt = builder.table_prompt('main', 'sales', 'orders', wide_columns(200))
+
+    assert 'Other columns:' in prompt
+    assert 'more' in prompt
+    assert builder.count_tokens(prompt) <= builder.budget
+
+
+def test_built_prompts_are_recorded():
+    builder = main.PromptBuilder()
+    builder.column_prompt('main', 'sales', 'orders', 'id', 'int', [1, 2])
+
+    stats = builder.stats()
+
+    assert stats['by_kind']['column']['prompts'] == 1
+    assert stats['recent'][0]['target'] == 'main.sales.orders.id'
@@ -0,0 +1,141 @@
+import pytest
+
+from app import main
+
+
+class FakeClock:
+    """Stands in for the time module: sleep advances monotonic instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(main, 'time', clock)
+    return clock
+
+
+def controller(rps=10, tpm=6000, max_retries=3):
+    rate = main.RateController(rps=rps, tpm=tpm, max_retries=max_retries, retry_base_seconds=0)
+    rate.max_factor = 2.0
+    return rate
+
+
+def test_success_raises_the_rate_up_to_the_ceiling(clock):
+    rate = controller()
+    for _ in range(100):
+        rate.on_success()
+
+    assert rate.factor == 2.0
+
+
+def test_throttling_halves_the_rate_once_per_burst(clock):
+    rate = controller()
+    rate.on_throttle()
+    rate.on_throttle()
+    assert rate.factor == 0.5
+
+    clock.sleep(1.0)
+    rate.on_throttle()
+    assert rate.factor == 0.25
+
+
+def test_rate_never_drops_below_the_floor(clock):
+    rate = controller()
+    for _ in range(20):
+        clock.sleep(1.0)
+        rate.on_throttle()
+
+    assert rate.factor == main.MODEL_MIN_RATE_FACTOR
+
+
+def test_repeated_transient_failures_reduce_the_rate(clock):
+    rate = controller()
+    rate.on_transient()
+    assert rate.factor == 1.0
+
+    rate.on_transient()
+    assert rate.factor == 0.5
+
+
+def test_classify():
+    rate = controller()
+
+    assert rate.classify('ERROR: 429 Too Many Requests') == 'throttle'
+    assert rate.classify('ERROR: REQUEST_LIMIT_EXCEEDED') == 'throttle'
+    assert rate.classify('ERROR: 503 Service Unavailable') == 'transient'
+    assert rate.classify('ERROR: invalid prompt') is None
+    assert rate.classify('A description') is None
+
+
+def test_calls_within_the_bucket_do_not_wait(clock):
+    rate = controller(rps=10, tpm=6000)  # 100 tokens/s, 1000 token bucket
+
+    rate.acquire(1, 500)
+
+    assert clock.slept == 0
+
+
+def test_oversized_batches_are_sent_at_once_and_charged_in_full(clock):
+    rate = controller(rps=10, tpm=6000)  # 100 tokens/s, 1000 token bucket
+    started = clock.now
+
+    rate.acquire(1, 3000)
+    assert clock.now == started
+
+    # The next call waits out the batch's 2000 token debt plus its own cost
+    rate.acquire(1, 500)
+    assert clock.now - started >= (3000 - 1000 + 500) / 100 - 1e-6
+
+
+def test_average_rate_holds_for_oversized_batches(clock):
+    rate = controller(rps=10, tpm=6000)
+    started = clock.now
+    for _ in range(10):
+        rate.acquire(1, 3000)
+    # The last batch may burst past the limit; everything before it was paid for
+    rate.acquire(1, 1)
+
+    assert clock.now - started >= (10 * 3000 - 1000) / 100 - 1e-6
+
+
+def test_run_retries_only_failed_prompts(clock):
+    rate = controller()
+    calls = []
+
+    def send(batch):
+        calls.append(sorted(batch))
+        if len(calls) == 1:
+            return {'a': 'fine', 'b': 'ERROR: 429 Too Many Requests', 'c': 'ERROR: bad prompt'}
+        return {key: f'retried {key}' for key in batch}
+
+    results = rate.run({'a': 'p', 'b': 'p', 'c': 'p'}, send)
+
+    assert calls == [['a', 'b', 'c'], ['b']]
+    assert results == {'a': 'fine', 'b': 'retried b', 'c': 'ERROR: bad prompt'}
+    assert rate.stats()['retried'] == 1
+    assert rate.stats()['throttled'] == 1
+
+
+def test_run_gives_up_after_max_retries(clock):
+    rate = controller(max_retries=2)
+    calls = []
+
+    def send(batch):
+        calls.append(batch)
+        return {key: 'ERROR: 503 Service Unavailable' for key in batch}
+
+    results = rate.run({'a': 'p'}, send)
+
+    assert len(calls) == 3
+    assert results == {'a': 'ERROR: 503 Service Unavailable'}
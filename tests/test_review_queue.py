@@ -0,0 +1,38 @@
+import pytest
+
+from app import main
+
+
+def test_cursor_round_trip():
+    cursor = main.DescriptionService.encode_cursor({'cursor_micros': 1760000000123456, 'id': 42})
+
+    assert cursor == '1760000000123456.42'
+    assert main.DescriptionService._decode_cursor(cursor) == (1760000000123456, 42)
+
+
+@pytest.mark.parametrize('cursor', ['', 'abc', '1.2.3', '1', "1.2 OR 1=1", None])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(ValueError):
+        main.DescriptionService._decode_cursor(cursor)
+
+
+def test_cursor_pages_by_keyset_and_ignores_offset(service, sql):
+    service.get_pending_reviews(limit=20, offset=40, cursor='1760000000123456.42')
+
+    query = sql.queries[0]
+    assert ("generated_at < timestamp_micros(1760000000123456) OR "
+            "(generated_at = timestamp_micros(1760000000123456) AND id < 42)") in query
+    assert 'LIMIT 20 OFFSET 0' in query
+
+
+def test_filters_are_validated_and_quoted(service, sql):
+    service.get_pending_reviews(catalog='main', schema='sales', object_type='COLUMN')
+
+    assert "catalog_name = 'main'" in sql.queries[0]
+    assert "schema_name = 'sales'" in sql.queries[0]
+    assert "object_type = 'COLUMN'" in sql.queries[0]
+
+    with pytest.raises(ValueError):
+        service.get_pending_reviews(schema="sales' OR '1'='1")
+    with pytest.raises(ValueError):
+        service.get_pending_reviews(object_type='VIEW')
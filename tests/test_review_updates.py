@@ -0,0 +1,74 @@
+import re
+
+from app import main
+
+
+def merge_rows(query):
+    """The VALUES tuples of a review MERGE, in order"""
+    values = query.split('SELECT * FROM VALUES', 1)[1].split('AS updates', 1)[0]
+    return [line.strip().rstrip(',') for line in values.strip().splitlines()]
+
+
+def test_reviews_are_merged_in_one_statement(service, sql):
+    result = service.update_review_statuses([
+        {'id': 1, 'status': 'APPROVED', 'approved_description': "Customer's email", 'reviewer': 'ana'},
+        {'id': 2, 'status': 'REJECTED', 'reviewer': 'ana'},
+    ])
+
+    merges = [q for q in sql.queries if 'MERGE INTO' in q]
+    assert len(merges) == 1
+    assert f'MERGE INTO {main.GOVERNANCE_TABLE}' in merges[0]
+    assert merge_rows(merges[0]) == [
+        "(1, 'APPROVED', 'Customer''s email', 'ana')",
+        "(2, 'REJECTED', CAST(NULL AS STRING), 'ana')",
+    ]
+    assert result == {'results': [{'id': 1, 'success': True}, {'id': 2, 'success': True}], 'errors': []}
+
+
+def test_a_later_review_of_the_same_id_wins(service, sql):
+    result = service.update_review_statuses([
+        {'id': 5, 'status': 'APPROVED', 'reviewer': 'ana'},
+        {'id': 6, 'status': 'APPROVED', 'reviewer': 'ana'},
+        {'id': 5, 'status': 'REJECTED', 'reviewer': 'ben'},
+    ])
+
+    rows = merge_rows(sql.queries[-1])
+    assert rows == ["(6, 'APPROVED', CAST(NULL AS STRING), 'ana')",
+                    "(5, 'REJECTED', CAST(NULL AS STRING), 'ben')"]
+    assert result['errors'] == [{'id': 5, 'error': 'Superseded by a later review for the same id'}]
+    assert result['results'] == [{'id': 6, 'success': True}, {'id': 5, 'success': True}]
+
+
+def test_invalid_reviews_are_reported_and_skipped(service, sql):
+    result = service.update_review_statuses([
+        {'id': 'x', 'status': 'APPROVED'},
+        {'id': 3, 'status': 'DONE'},
+        {'id': 4, 'status': 'APPROVED', 'reviewer': 'ana'},
+    ])
+
+    assert [e['id'] for e in result['errors']] == ['x', 3]
+    assert [re.match(r'\((\d+),', row).group(1) for row in merge_rows(sql.queries[-1])] == ['4']
+
+
+def test_nothing_valid_runs_no_statement(service, sql):
+    result = service.update_review_statuses([{'id': -1, 'status': 'APPROVED'}])
+
+    assert sql.queries == []
+    assert result['results'] == []
+    assert len(result['errors']) == 1
+
+
+def test_a_failed_merge_reports_every_id(service, monkeypatch):
+    def fail(query, *args, **kwargs):
+        raise Exception('Query failed: concurrent update')
+
+    monkeypatch.setattr(service, 'execute_sql', fail)
+
+    result = service.update_review_statuses([
+        {'id': 1, 'status': 'APPROVED', 'reviewer': 'ana'},
+        {'id': 2, 'status': 'APPROVED', 'reviewer': 'ana'},
+    ])
+
+    assert result['results'] == []
+    assert result['errors'] == [{'id': 1, 'error': 'Query failed: concurrent update'},
+                                {'id': 2, 'error': 'Query failed: concurrent update'}]
@@ -0,0 +1,59 @@
+import pytest
+
+from app import main
+
+
+@pytest.fixture
+def tablesample(monkeypatch):
+    monkeypatch.setattr(main, 'SAMPLE_TABLESAMPLE_MIN_BYTES', 1000)
+
+
+def columns(*names):
+    return [{'column_name': name, 'data_type': 'string'} for name in names]
+
+
+def test_only_sampleable_columns_are_projected_and_truncated(service, sql):
+    service.get_sample_data('main', 'sales', 'orders',
+                            columns('name') + [{'column_name': 'payload', 'data_type': 'BINARY'}])
+
+    query = sql.queries[0]
+    assert f"substr(cast(`name` AS STRING), 1, {main.PROMPT_SAMPLE_VALUE_CHARS + 1}) AS `name`" in query
+    assert 'payload' not in query
+    assert f'LIMIT {main.SAMPLE_ROWS}' in query
+
+
+def test_samples_are_cached_per_table(service, sql):
+    sql.respond('SELECT', [{'name': 'Ana'}])
+
+    service.get_sample_data('main', 'sales', 'orders', columns('name'))
+    rows = service.get_sample_data('main', 'sales', 'orders', columns('name'))
+
+    assert rows == [{'name': 'Ana'}]
+    assert len(sql.queries) == 1
+
+
+def test_failed_tablesample_falls_back_to_limit(service, monkeypatch, tablesample):
+    queries = []
+
+    def execute_sql(query):
+        queries.append(query)
+        if 'DESCRIBE DETAIL' in query:
+            return [{'sizeInBytes': 10 ** 9}]
+        if 'TABLESAMPLE' in query:
+            raise RuntimeError('TABLESAMPLE is not supported for materialized views')
+        return [{'name': 'Ana'}]
+
+    monkeypatch.setattr(service, 'execute_sql', execute_sql)
+
+    rows = service.get_sample_data('main', 'sales', 'orders', columns('name'))
+
+    assert rows == [{'name': 'Ana'}]
+    assert 'TABLESAMPLE' not in queries[-1]
+
+
+def test_empty_tablesample_falls_back_to_limit(service, sql, tablesample):
+    sql.respond('DESCRIBE DETAIL', [{'sizeInBytes': 10 ** 9}])
+    sql.respond('TABLESAMPLE', [])
+    sql.respond('SELECT', [{'name': 'Ana'}])
+
+    assert service.get_sample_data('main', 'sales', 'orders', columns('name')) == [{'name': 'Ana'}]
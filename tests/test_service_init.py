@@ -0,0 +1,25 @@
+import threading
+import time
+
+from app import main
+
+
+def test_concurrent_first_requests_share_one_service(monkeypatch):
+    created = []
+
+    class SlowService:
+        def __init__(self):
+            time.sleep(0.05)
+            created.append(self)
+
+    monkeypatch.setattr(main, 'DescriptionService', SlowService)
+    monkeypatch.setattr(main, '_service', None)
+    services = []
+    threads = [threading.Thread(target=lambda: services.append(main.get_service())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(service is created[0] for service in services)
@@ -0,0 +1,95 @@
+from app import main
+
+
+def indexed(*docs):
+    index = main.SimilarityIndex()
+    for table, column, data_type, description in docs:
+        index.add(f"main.s.{table}.{column}", column, data_type, table, description)
+    return index
+
+
+def test_same_column_in_the_same_entity_scores_above_threshold():
+    index = indexed(('customers', 'email', 'string', 'Customer email address'))
+
+    description, score = index.search('email', 'string', 'customer')
+
+    assert description == 'Customer email address'
+    assert score >= main.SIMILARITY_THRESHOLD
+
+
+def test_table_sharing_a_word_is_a_candidate():
+    index = indexed(('customers', 'email', 'string', 'Customer email address'))
+
+    assert index.search('email', 'string', 'dim_customer')[0] == 'Customer email address'
+
+
+def test_unrelated_table_gets_no_candidate():
+    index = indexed(('customers', 'id', 'int', 'Customer identifier'))
+
+    assert index.search('id', 'int', 'vehicles') is None
+
+
+def test_shared_table_prefix_scores_below_threshold():
+    index = indexed(('dim_customer', 'id', 'int', 'Customer identifier'))
+
+    match = index.search('id', 'int', 'dim_vehicle')
+
+    assert match is not None
+    assert match[1] < main.SIMILARITY_THRESHOLD
+
+
+def test_best_match_wins():
+    index = indexed(('customers', 'email', 'string', 'Customer email address'),
+                    ('customers', 'email_verified', 'boolean', 'Whether the email is verified'))
+
+    assert index.search('email', 'string', 'customers')[0] == 'Customer email address'
+
+
+def test_readding_a_key_replaces_it_and_discard_removes_it():
+    index = indexed(('customers', 'email', 'string', 'Old'))
+    index.add('main.s.customers.email', 'email', 'string', 'customers', 'New')
+
+    assert len(index) == 1
+    assert index.search('email', 'string', 'customers')[0] == 'New'
+
+    index.discard('main.s.customers.email')
+    index.discard('main.s.customers.email')
+
+    assert len(index) == 0
+    assert index.stats()['terms'] == 0
+    assert index.search('email', 'string', 'customers') is None
+
+
+def test_candidates_are_bounded():
+    index = main.SimilarityIndex(max_candidates=3)
+    for i in range(10):
+        index.add(f"main.s.customers_{i}.email", 'email', 'string', f'customers_{i}', f'Email {i}')
+
+    assert len(index._candidates(index.features('email', 'string', 'customers'))) == 3
+
+
+def test_refresh_drops_columns_no_longer_approved(service, sql):
+    row = {'catalog_name': 'main', 'schema_name': 's', 'table_name': 'customers', 'column_name': 'email',
+           'column_data_type': 'string', 'description': 'Customer email address'}
+    sql.respond('FROM', [dict(row, review_status='APPROVED', reviewed_at='2026-01-01 00:00:00')])
+    service.refresh_similarity_index(force=True)
+    assert service.suggest_description('email', 'string', 'customers')[0] == 'Customer email address'
+
+    sql.responses.clear()
+    sql.respond('FROM', [dict(row, review_status='REJECTED', reviewed_at='2026-01-02 00:00:00')])
+    service.refresh_similarity_index(force=True)
+
+    assert len(service.similarity_index) == 0
+    assert service.similarity_index.watermark == '2026-01-02 00:00:00'
+    assert "reviewed_at >= CAST('2026-01-01 00:00:00' AS TIMESTAMP)" in sql.queries[-1]
+
+
+def test_latest_review_of_a_column_decides(service, sql):
+    row = {'catalog_name': 'main', 'schema_name': 's', 'table_name': 'customers', 'column_name': 'email',
+           'column_data_type': 'string', 'description': 'Customer email address'}
+    sql.respond('FROM', [dict(row, review_status='APPROVED', reviewed_at='2026-01-01 00:00:00'),
+                         dict(row, review_status='REJECTED', reviewed_at='2026-01-02 00:00:00')])
+
+    service.refresh_similarity_index(force=True)
+
+    assert len(service.similarity_index) == 0
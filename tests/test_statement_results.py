@@ -0,0 +1,136 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app import main
+
+Types = main.ColumnInfoTypeName
+
+
+def column(name, type_name, scale=None):
+    return SimpleNamespace(name=name, type_name=type_name, type_scale=scale)
+
+
+def statement(columns, data, next_chunk_index=None, statement_id='s1'):
+    return SimpleNamespace(
+        statement_id=statement_id,
+        status=SimpleNamespace(state=main.StatementState.SUCCEEDED, error=None),
+        manifest=SimpleNamespace(schema=SimpleNamespace(columns=columns), truncated=False),
+        result=SimpleNamespace(data_array=data, external_links=None, next_chunk_index=next_chunk_index),
+    )
+
+
+def test_manifest_types_are_decoded(service):
+    stmt = statement(
+        [column('n', Types.INT), column('big', Types.LONG), column('ratio', Types.DOUBLE),
+         column('flag', Types.BOOLEAN), column('name', Types.STRING), column('seen', Types.TIMESTAMP)],
+        [['7', '9007199254740993', '0.25', 'TRUE', 'x', '2024-01-01T00:00:00Z']],
+    )
+
+    assert service._statement_rows(stmt) == [{
+        'n': 7, 'big': 9007199254740993, 'ratio': 0.25, 'flag': True,
+        'name': 'x', 'seen': '2024-01-01T00:00:00Z',
+    }]
+
+
+def test_scaled_decimals_stay_exact(service):
+    stmt = statement(
+        [column('amount', Types.DECIMAL, scale=2), column('count', Types.DECIMAL, scale=0)],
+        [['12345678901234567.89', '12345678901234567890']],
+    )
+
+    row = service._statement_rows(stmt)[0]
+
+    assert row['amount'] == Decimal('12345678901234567.89')
+    assert isinstance(row['amount'], Decimal)
+    assert row['count'] == 12345678901234567890
+    assert isinstance(row['count'], int)
+
+
+def test_nulls_are_not_decoded(service):
+    stmt = statement([column('n', Types.INT), column('flag', Types.BOOLEAN), column('amount', Types.DECIMAL, 2)],
+                     [[None, None, None]])
+
+    assert service._statement_rows(stmt) == [{'n': None, 'flag': None, 'amount': None}]
+
+
+def test_failed_statement_raises(service):
+    stmt = statement([column('n', Types.INT)], [])
+    stmt.status = SimpleNamespace(state=main.StatementState.FAILED, error='boom')
+
+    with pytest.raises(Exception, match='boom'):
+        service._statement_rows(stmt)
+
+
+class FakeStatements:
+    """statement_execution stand-in serving follow-up chunks by index"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.requested = []
+
+    def get_statement_result_chunk_n(self, statement_id, chunk_index):
+        self.requested.append((statement_id, chunk_index))
+        return self.chunks[chunk_index]
+
+
+class FakeHTTP:
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.calls = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.calls.append((url, headers, timeout))
+        return SimpleNamespace(json=lambda: self.bodies[url], raise_for_status=lambda: None)
+
+
+def link(url, next_chunk_index=None, headers=None):
+    return SimpleNamespace(external_link=url, next_chunk_index=next_chunk_index, http_headers=headers)
+
+
+def test_inline_chunks_are_followed(service):
+    stmt = statement([column('n', Types.INT)], [['1'], ['2']], next_chunk_index=1)
+    statements = FakeStatements({
+        1: SimpleNamespace(data_array=[['3']], external_links=None, next_chunk_index=2),
+        2: SimpleNamespace(data_array=[['4']], external_links=None, next_chunk_index=None),
+    })
+    service.w = SimpleNamespace(statement_execution=statements)
+
+    assert [row['n'] for row in service._statement_rows(stmt)] == [1, 2, 3, 4]
+    assert statements.requested == [('s1', 1), ('s1', 2)]
+
+
+def test_external_links_are_downloaded_and_followed(service):
+    stmt = statement([column('n', Types.INT), column('name', Types.STRING)], None)
+    stmt.result = SimpleNamespace(data_array=None, next_chunk_index=None,
+                                  external_links=[link('https://files/0', 1, {'x-amz-sse': 'AES256'})])
+    statements = FakeStatements({
+        1: SimpleNamespace(data_array=None, next_chunk_index=None, external_links=[link('https://files/1')]),
+    })
+    http = FakeHTTP({'https://files/0': [['1', 'a'], ['2', 'b']], 'https://files/1': [['3', None]]})
+    service.w = SimpleNamespace(statement_execution=statements)
+    service._http = http
+
+    rows = service._statement_rows(stmt)
+
+    assert rows == [{'n': 1, 'name': 'a'}, {'n': 2, 'name': 'b'}, {'n': 3, 'name': None}]
+    assert statements.requested == [('s1', 1)]
+    # Presigned links get only their own headers, never workspace credentials
+    assert http.calls == [
+        ('https://files/0', {'x-amz-sse': 'AES256'}, main.SQL_DOWNLOAD_TIMEOUT_SECONDS),
+        ('https://files/1', {}, main.SQL_DOWNLOAD_TIMEOUT_SECONDS),
+    ]
+
+
+def test_rows_are_fetched_one_chunk_at_a_time(service):
+    stmt = statement([column('n', Types.INT)], [['1']], next_chunk_index=1)
+    statements = FakeStatements({1: SimpleNamespace(data_array=[['2']], external_links=None, next_chunk_index=None)})
+    service.w = SimpleNamespace(statement_execution=statements)
+
+    rows = service._iter_statement_rows(stmt)
+
+    assert next(rows) == {'n': 1}
+    assert statements.requested == []
+    assert list(rows) == [{'n': 2}]
+    assert statements.requested == [('s1', 1)]
@@ -0,0 +1,46 @@
+import threading
+from types import SimpleNamespace
+
+from app import main
+
+
+def stub_submission(service, monkeypatch):
+    monkeypatch.setattr(service, 'submit_sql', lambda *args, **kwargs: SimpleNamespace(statement='done'))
+    monkeypatch.setattr(service, '_wait', lambda handle: None)
+
+
+def test_generation_statements_use_their_own_slots(service, monkeypatch):
+    stub_submission(service, monkeypatch)
+    for _ in range(main.MAX_STATEMENTS_IN_FLIGHT):
+        assert service._statement_slots.acquire(blocking=False)
+
+    finished = threading.Event()
+
+    def run():
+        with service.generation_statements():
+            service._run_statement('SELECT 1', 'w', 60, None)
+        finished.set()
+
+    threading.Thread(target=run, daemon=True).start()
+
+    assert finished.wait(2)
+
+
+def test_request_statements_do_not_wait_for_busy_jobs(service, monkeypatch):
+    stub_submission(service, monkeypatch)
+    for _ in range(main.MAX_GENERATION_STATEMENTS):
+        assert service._generation_slots.acquire(blocking=False)
+
+    assert service._run_statement('SELECT 1', 'w', 60, None) == 'done'
+
+
+def test_generation_flag_is_per_thread_and_restored(service):
+    seen = []
+    with service.generation_statements():
+        thread = threading.Thread(target=lambda: seen.append(getattr(service._thread_state, 'generation', False)))
+        thread.start()
+        thread.join()
+        assert service._thread_state.generation is True
+
+    assert seen == [False]
+    assert service._thread_state.generation is False